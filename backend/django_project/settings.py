@@ -143,7 +143,18 @@ SPECTACULAR_SETTINGS = {
 
 # Env-backed thresholds / knobs
 EVALUATIONS_MIN_RATINGS = int(os.getenv("EVALUATIONS_MIN_RATINGS", "10"))
-EVALUATIONS_REPEAT_DAYS = env.int("EVALUATIONS_REPEAT_DAYS", default=7)  # cooldown
+# Cooldown between ratings of the same (subject, criterion); it is stamped into PendingTask.next_due_at,
+# so run `manage.py rebuild_pending_tasks` after changing it
+EVALUATIONS_REPEAT_DAYS = env.int("EVALUATIONS_REPEAT_DAYS", default=7)
+# Apply deviation deltas and recompute weights in signal handlers instead of queueing for process_dirty_raters
+# (the subject-summary refresh a weight change triggers is queued either way)
+EVALUATIONS_WEIGHTS_SYNC = env.bool("EVALUATIONS_WEIGHTS_SYNC", default=False)
+# Summary responses are invalidated by generation counters; this only bounds how long unused entries linger
+EVALUATIONS_SUMMARY_CACHE_TIMEOUT = env.int("EVALUATIONS_SUMMARY_CACHE_TIMEOUT", default=3600)
+# After this many seconds a cached summary is refreshed by one worker (others serve the stale copy meanwhile)
+EVALUATIONS_SUMMARY_CACHE_SOFT_TIMEOUT = env.int("EVALUATIONS_SUMMARY_CACHE_SOFT_TIMEOUT", default=300)
+# Upper bound on subject ids per summary-batch request
+EVALUATIONS_SUMMARY_BATCH_MAX_SUBJECTS = env.int("EVALUATIONS_SUMMARY_BATCH_MAX_SUBJECTS", default=100)
 
 # Additional configuration reading from environment variables
 SPOTIFY_CLIENT_ID = env("SPOTIFY_CLIENT_ID", default="")
@@ -159,3 +170,17 @@ CLOUDINARY_API_SECRET = env("CLOUDINARY_API_SECRET", default="")
 # Redis configuration
 REDIS_HOST = env("REDIS_HOST", default="redis")
 REDIS_PORT = env("REDIS_PORT", default="6379")
+
+# Shared cache so every gunicorn worker sees the same entries (and the same summary generations)
+CACHES = {
+    "default": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": env("CACHE_URL", default=f"redis://{REDIS_HOST}:{REDIS_PORT}/1"),
+        "KEY_PREFIX": "personalities",
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            # A cache outage degrades to recomputing instead of failing requests
+            "IGNORE_EXCEPTIONS": True,
+        },
+    }
+}
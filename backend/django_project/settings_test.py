@@ -32,3 +32,9 @@ DATABASES = {
     }
 }
 EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+
+# Rater weights are recomputed inline so tests can assert on them right after a write
+EVALUATIONS_WEIGHTS_SYNC = True
+
+# Per-process cache; tests don't need Redis
+CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
@@ -0,0 +1,75 @@
+"""
+Outbound gating of evaluations.
+
+A subject's received evaluations count towards summaries (Evaluation.is_active) once the subject
+has given at least EVALUATIONS_MIN_OUTBOUND ratings themselves. The outbound count is read from
+RaterStats.outbound_count, which the signals keep current, instead of counting Evaluation rows.
+
+EvaluationMeta.status is kept as a mirror of is_active for readers that still use it.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional, Set
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .meta_models import EvaluationMeta
+from .models import Evaluation
+from .rater_models import RaterStats
+from .subject_summaries import refresh_subject_summaries
+
+
+def min_outbound() -> int:
+    return int(getattr(settings, "EVALUATIONS_MIN_OUTBOUND", 10))
+
+
+def active_subjects(subject_ids: Iterable[Optional[int]]) -> Set[int]:
+    """The subjects among ``subject_ids`` that passed the outbound gate, in one query."""
+
+    ids = {int(subject_id) for subject_id in subject_ids if subject_id is not None}
+    if not ids:
+        return set()
+    return set(
+        RaterStats.objects.filter(user_id__in=ids, outbound_count__gte=min_outbound()).values_list("user_id", flat=True)
+    )
+
+
+def create_meta_mirrors(evaluations: Iterable[Evaluation], active: Set[int]) -> None:
+    """Write the compatibility EvaluationMeta rows for freshly created evaluations."""
+
+    EvaluationMeta.objects.bulk_create(
+        [
+            EvaluationMeta(
+                evaluation=evaluation,
+                status=(
+                    EvaluationMeta.STATUS_ACTIVE if evaluation.subject_id in active else EvaluationMeta.STATUS_PENDING
+                ),
+            )
+            for evaluation in evaluations
+        ]
+    )
+
+
+def activate_subjects(subject_ids: Iterable[Optional[int]]) -> int:
+    """
+    Activate every pending evaluation of ``subject_ids`` and refresh their summary rows.
+    The pending rows are found through the partial index on is_active=False, and the meta
+    mirror is updated by evaluation id, so no join-update is issued. Returns the rows activated.
+    """
+
+    ids = sorted({int(subject_id) for subject_id in subject_ids if subject_id is not None})
+    if not ids:
+        return 0
+    with transaction.atomic():
+        pending = list(Evaluation.objects.filter(subject_id__in=ids, is_active=False).values_list("pk", flat=True))
+        if pending:
+            Evaluation.objects.filter(pk__in=pending).update(is_active=True)
+            EvaluationMeta.objects.filter(evaluation_id__in=pending).exclude(
+                status=EvaluationMeta.STATUS_ACTIVE
+            ).update(status=EvaluationMeta.STATUS_ACTIVE, updated_at=timezone.now())
+    # Queryset updates skip the meta signals; refresh the subjects' summary rows here.
+    refresh_subject_summaries(ids)
+    return len(pending)
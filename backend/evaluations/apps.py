@@ -15,7 +15,34 @@ class EvaluationsConfig(AppConfig):
             from . import meta_models  # noqa: F401
         except Exception:
             pass
+        try:
+            from . import consensus_models  # noqa: F401
+        except Exception:
+            pass
+        try:
+            from . import queue_models  # noqa: F401
+        except Exception:
+            pass
+        try:
+            from . import task_models  # noqa: F401
+        except Exception:
+            pass
+        try:
+            from . import summary_models  # noqa: F401
+        except Exception:
+            pass
+        try:
+            from . import deviation_models  # noqa: F401
+        except Exception:
+            pass
         try:
             from . import signals  # noqa: F401
         except Exception:
             pass
+        try:
+            # Resolve the create endpoints' Evaluation field names once, not per request.
+            from .writes import resolve_write_fields
+
+            resolve_write_fields()
+        except Exception:
+            pass
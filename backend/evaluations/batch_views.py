@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import F, Subquery
+from django.db.models.functions import Coalesce
+
+from rest_framework import permissions, status
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .activation import activate_subjects, active_subjects, create_meta_mirrors
+from .models import Criterion, Evaluation
+from .pending_tasks import cooling_pairs
+from .rater_models import RaterStats
+from .signals import apply_bulk_evaluations
+from .writes import EvaluationWriteError, check_familiarity, check_score
+
+
+def _as_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class EvaluationBatchCreateView(APIView):
+    """
+    Create many evaluations for the current user in one request.
+
+    Accepts a JSON array of {subject_id, criterion_id, score, familiarity?} (or {"items": [...]}).
+    Cooldowns are checked with one query, valid items are inserted with bulk_create in one
+    transaction, and consensus/moments/weights/gating each run once for the whole batch.
+    Invalid items are reported per index and do not fail the rest of the batch.
+    """
+
+    authentication_classes = [TokenAuthentication]
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        items = request.data.get("items") if isinstance(request.data, dict) else request.data
+        if not isinstance(items, list) or not items:
+            return Response(
+                {"detail": "Expected a non-empty list of evaluations."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        max_items = int(getattr(settings, "EVALUATIONS_BATCH_MAX_ITEMS", 100))
+        if len(items) > max_items:
+            return Response(
+                {"detail": f"At most {max_items} evaluations per batch."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        user = request.user
+        errors = []
+        candidates = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                errors.append({"index": index, "detail": "Each item must be an object."})
+                continue
+            subject_id = _as_int(item.get("subject_id"))
+            criterion_id = _as_int(item.get("criterion_id"))
+            if subject_id is None or criterion_id is None or item.get("score") is None:
+                errors.append({"index": index, "detail": "subject_id, criterion_id, and score are required."})
+                continue
+            # Same bounds as create_evaluation(); an out-of-range value would fail the whole insert.
+            try:
+                score, familiarity = check_score(item.get("score")), check_familiarity(item.get("familiarity"))
+            except EvaluationWriteError as exc:
+                errors.append({"index": index, "detail": exc.detail})
+                continue
+            candidates.append((index, subject_id, criterion_id, score, familiarity))
+
+        pairs = {(subject_id, criterion_id) for _, subject_id, criterion_id, _, _ in candidates}
+        known_subjects = set(
+            get_user_model().objects.filter(pk__in={subject_id for subject_id, _ in pairs}).values_list("pk", flat=True)
+        )
+        known_criteria = set(
+            Criterion.objects.filter(pk__in={criterion_id for _, criterion_id in pairs}).values_list("pk", flat=True)
+        )
+
+        # Enforce cooldown for every pair in the batch with a single PendingTask query
+        cooling = cooling_pairs(user.id, pairs)
+
+        accepted = []
+        seen = set()
+        for index, subject_id, criterion_id, score, familiarity in candidates:
+            pair = (subject_id, criterion_id)
+            if subject_id not in known_subjects:
+                errors.append({"index": index, "detail": "subject_id not found."})
+            elif criterion_id not in known_criteria:
+                errors.append({"index": index, "detail": "criterion_id not found."})
+            elif pair in cooling or pair in seen:
+                errors.append({"index": index, "detail": "Evaluation cooldown active."})
+            else:
+                seen.add(pair)
+                accepted.append(
+                    (
+                        index,
+                        Evaluation(
+                            evaluator=user,
+                            subject_id=subject_id,
+                            criterion_id=criterion_id,
+                            score=score,
+                            familiarity=familiarity,
+                        ),
+                    )
+                )
+
+        created = []
+        if accepted:
+            with transaction.atomic():
+                evaluations = Evaluation.objects.bulk_create([evaluation for _, evaluation in accepted])
+                self._apply_side_effects(user, evaluations)
+            created = [{"index": index, "id": evaluation.pk} for (index, _), evaluation in zip(accepted, evaluations)]
+
+        errors.sort(key=lambda error: error["index"])
+        return Response(
+            {"created": created, "errors": errors},
+            status=status.HTTP_201_CREATED if created else status.HTTP_400_BAD_REQUEST,
+        )
+
+    def _apply_side_effects(self, user, evaluations) -> None:
+        # bulk_create fires no signals: fold the batch into consensus, moments and weights once.
+        apply_bulk_evaluations(evaluations)
+
+        # Every evaluation by a rater carries the same reliability_weight; mirror the fresh one.
+        RaterStats.objects.filter(user=user).update(
+            reliability=Coalesce(
+                Subquery(Evaluation.objects.filter(pk=evaluations[-1].pk).values("reliability_weight")[:1]),
+                F("reliability"),
+            )
+        )
+
+        # Outbound gating for every subject in the batch from one RaterStats query.
+        active = active_subjects(evaluation.subject_id for evaluation in evaluations)
+        create_meta_mirrors(evaluations, active)
+        if active:
+            activate_subjects(active)
@@ -0,0 +1,245 @@
+"""
+Microbenchmarks of the evaluations hot paths.
+
+run_benchmarks() loads a synthetic dataset (evaluations.synthetic) per size into the current
+database and times each case in BENCHMARKS: the consensus map, a rater's weight recompute,
+the post-save weight refresh, the create/tasks/summary-v2 views (called directly with
+APIRequestFactory, no HTTP) and the recompute_rater_stats command. Cases that write run inside
+a rolled-back transaction, so every repeat sees the same data. compare_results() flags cases
+whose median got slower than a baseline by more than a threshold.
+
+The benchmark_evaluations command runs this against a throwaway SQLite database.
+"""
+
+from __future__ import annotations
+
+import platform
+import sqlite3
+import statistics
+import time
+from io import StringIO
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+import django
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from .consensus_models import PairConsensus
+from .models import Evaluation
+from .signals import _build_consensus_map, _compute_weights_for_rater, _handle_weight_refresh
+from .summary_views import EvaluationSummaryV2View
+from .synthetic import SyntheticConfig, generate
+from .views import EvaluationCreateView, EvaluationTasksView
+
+DEFAULT_SIZES = (1000, 5000, 20000)
+
+
+class Fixture(NamedTuple):
+    """Ids picked once per size: the busiest rater, one of its evaluations and a sample of pairs."""
+
+    rater: object
+    subject_id: int
+    criterion_id: int
+    evaluation: Evaluation
+    pairs: List[tuple]
+
+
+def _fixture() -> Fixture:
+    rater_id = (
+        Evaluation.objects.values("evaluator_id")
+        .annotate(n=Count("id"))
+        .order_by("-n", "evaluator_id")
+        .values_list("evaluator_id", flat=True)
+        .first()
+    )
+    rater = get_user_model().objects.get(pk=rater_id)
+    evaluation = Evaluation.objects.filter(evaluator_id=rater_id).order_by("pk").first()
+    # A subject the rater never rated, so the create path is never on cooldown.
+    subject_id = (
+        get_user_model()
+        .objects.exclude(pk=rater_id)
+        .exclude(received_evaluations__evaluator_id=rater_id)
+        .order_by("pk")
+        .values_list("pk", flat=True)
+        .first()
+    )
+    pairs = list(PairConsensus.objects.order_by("pk").values_list("subject_id", "criterion_id")[:100])
+    return Fixture(rater, subject_id, evaluation.criterion_id, evaluation, pairs)
+
+
+def _rolled_back(func: Callable[[], object]) -> Callable[[], None]:
+    def run() -> None:
+        with transaction.atomic():
+            func()
+            transaction.set_rollback(True)
+
+    return run
+
+
+def _create_view(fixture: Fixture) -> Callable[[], None]:
+    view = EvaluationCreateView.as_view()
+    factory = APIRequestFactory()
+
+    def post() -> None:
+        request = factory.post(
+            f"/?subject_id={fixture.subject_id}",
+            {"criterion_id": fixture.criterion_id, "score": 4},
+            format="json",
+        )
+        force_authenticate(request, user=fixture.rater)
+        response = view(request)
+        assert response.status_code == 201, response.data
+
+    return _rolled_back(post)
+
+
+def _get_view(view_class, user=None, query: str = "") -> Callable[[], None]:
+    view = view_class.as_view()
+    factory = APIRequestFactory()
+
+    def get() -> None:
+        request = factory.get(f"/{query}")
+        if user is not None:
+            force_authenticate(request, user=user)
+        response = view(request)
+        assert response.status_code == 200, response.data
+
+    return get
+
+
+def _summary_v2() -> Callable[[], None]:
+    get = _get_view(EvaluationSummaryV2View)
+
+    def cold() -> None:
+        # Measure the compute path, not a cache hit.
+        cache.clear()
+        get()
+
+    return cold
+
+
+def _recompute_rater_stats() -> None:
+    call_command("recompute_rater_stats", stdout=StringIO())
+
+
+BENCHMARKS: Dict[str, Callable[[Fixture], Callable[[], None]]] = {
+    "build_consensus_map": lambda f: lambda: _build_consensus_map(f.pairs),
+    "compute_weights_for_rater": lambda f: _rolled_back(lambda: _compute_weights_for_rater(f.rater.pk)),
+    "handle_weight_refresh": lambda f: _rolled_back(lambda: _handle_weight_refresh(f.evaluation)),
+    "create_view_post": _create_view,
+    "tasks_view_get": lambda f: _get_view(EvaluationTasksView, user=f.rater),
+    "summary_v2_view_get": lambda f: _summary_v2(),
+    "recompute_rater_stats": lambda f: _rolled_back(_recompute_rater_stats),
+}
+
+
+def _time(func: Callable[[], None], repeat: int) -> Dict[str, float]:
+    with CaptureQueriesContext(connection) as ctx:
+        func()  # warm-up; also counts the queries of one call
+    queries = len(ctx.captured_queries)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+        "queries": queries,
+    }
+
+
+def _reset() -> None:
+    call_command("flush", interactive=False, verbosity=0)
+    cache.clear()
+
+
+def run_benchmarks(
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    repeat: int = 5,
+    seed: int = 0,
+    only: Optional[Iterable[str]] = None,
+    progress: Optional[Callable[[str, int, Dict[str, float]], None]] = None,
+) -> dict:
+    """
+    Time every case (or ``only`` those) at each dataset size (number of evaluations).
+    Returns {"meta": {...}, "results": {case: {size: {"min", "median", "mean", "queries"}}}};
+    sizes are string keys so the dict round-trips through JSON unchanged.
+    """
+
+    names = list(only) if only else list(BENCHMARKS)
+    unknown = sorted(set(names) - set(BENCHMARKS))
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {', '.join(unknown)}.")
+
+    sizes = [int(size) for size in sizes]
+    results: Dict[str, Dict[str, Dict[str, float]]] = {name: {} for name in names}
+    for size in sizes:
+        _reset()
+        generate(
+            SyntheticConfig(
+                users=max(20, size // 20),
+                evaluations=size,
+                degree=10,
+                questions=0,
+                seed=seed,
+                prefix="bench",
+            )
+        )
+        fixture = _fixture()
+        for name in names:
+            timing = _time(BENCHMARKS[name](fixture), repeat)
+            results[name][str(size)] = timing
+            if progress:
+                progress(name, size, timing)
+
+    return {
+        "meta": {
+            "created_at": timezone.now().isoformat(),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "vendor": connection.vendor,
+            "sizes": sizes,
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+class Regression(NamedTuple):
+    name: str
+    size: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def compare_results(baseline: dict, current: dict, threshold: float = 0.2) -> List[Regression]:
+    """
+    Cases (present in both runs) whose median is more than ``threshold`` (0.2 = 20%) slower
+    than in ``baseline``.
+    """
+
+    regressions = []
+    for name, by_size in sorted(current["results"].items()):
+        for size, timing in sorted(by_size.items(), key=lambda item: int(item[0])):
+            before = baseline["results"].get(name, {}).get(size)
+            if before is None:
+                continue
+            regression = Regression(name, size, before["median"], timing["median"])
+            if regression.ratio > 1 + threshold:
+                regressions.append(regression)
+    return regressions
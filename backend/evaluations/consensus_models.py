@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.db import models
+
+
+class PairConsensus(models.Model):
+    """
+    Running score aggregate for one (subject, criterion) pair.
+    Maintained by evaluations.signals on every Evaluation create/update/delete,
+    so the consensus for a pair is one indexed fetch instead of an AVG over its rows.
+    """
+
+    subject = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="pair_consensus",
+    )
+    criterion = models.ForeignKey(
+        "evaluations.Criterion",
+        on_delete=models.CASCADE,
+        related_name="pair_consensus",
+    )
+    score_count = models.PositiveIntegerField(default=0)
+    score_sum = models.FloatField(default=0.0)
+    score_sq_sum = models.FloatField(default=0.0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Pair Consensus"
+        verbose_name_plural = "Pair Consensus"
+        constraints = [
+            models.UniqueConstraint(fields=["subject", "criterion"], name="uniq_pair_consensus"),
+        ]
+
+    def __str__(self) -> str:
+        return f"PairConsensus<{self.subject_id}:{self.criterion_id}>"
+
+    @property
+    def mean(self) -> float | None:
+        if not self.score_count:
+            return None
+        return self.score_sum / self.score_count
+
+    @property
+    def variance(self) -> float | None:
+        if not self.score_count:
+            return None
+        mean = self.score_sum / self.score_count
+        return max(0.0, self.score_sq_sum / self.score_count - mean * mean)
@@ -1,77 +1,22 @@
 from __future__ import annotations
 
-from django.apps import apps
-from django.conf import settings
-from django.db import transaction
-
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from .meta_models import EvaluationMeta
-
-# Prefer helpers from summary_views if exported there; otherwise use local fallbacks
-try:
-    from .summary_views import _pick_fk_field, _pick_numeric_field  # type: ignore
-except Exception:
-
-    def _pick_fk_field(model, preferred_names):
-        # Exact name match first
-        for f in model._meta.get_fields():
-            if getattr(f, "is_relation", False) and not getattr(f, "many_to_many", False):
-                if f.name in preferred_names:
-                    return f.name
-        # Then partial match
-        for f in model._meta.get_fields():
-            if getattr(f, "is_relation", False) and not getattr(f, "many_to_many", False):
-                for p in preferred_names:
-                    if p in f.name:
-                        return f.name
-        return None
-
-    def _pick_numeric_field(model, preferred_names):
-        numeric_types = {
-            "IntegerField",
-            "SmallIntegerField",
-            "PositiveIntegerField",
-            "PositiveSmallIntegerField",
-            "BigIntegerField",
-            "FloatField",
-            "DecimalField",
-        }
-        # Exact name match first
-        for f in model._meta.get_fields():
-            if hasattr(f, "get_internal_type") and f.get_internal_type() in numeric_types:
-                if f.name in preferred_names:
-                    return f.name
-        # Then partial match
-        for f in model._meta.get_fields():
-            if hasattr(f, "get_internal_type") and f.get_internal_type() in numeric_types:
-                for p in preferred_names:
-                    if p in f.name:
-                        return f.name
-        return None
-
-
-def _get_model(app_label: str, model_name: str):
-    try:
-        return apps.get_model(app_label, model_name)
-    except Exception:
-        return None
+from .writes import EvaluationWriteError, create_evaluation
 
 
 class EvaluationCreateV2View(APIView):
+    """
+    Create an evaluation; subject_id comes from the query string and the response carries the
+    gating status. The write is evaluations.writes.create_evaluation (shared with create/).
+    """
+
     permission_classes = [IsAuthenticated]
 
-    @transaction.atomic
     def post(self, request, *args, **kwargs):
-        Evaluation = _get_model("evaluations", "Evaluation")  # type: ignore
-        Criterion = _get_model("evaluations", "Criterion") or _get_model(
-            "evaluations", "EvaluationCriterion"
-        )  # type: ignore
-        if Evaluation is None or Criterion is None:
-            return Response({"detail": "Evaluation models not available"}, status=500)
-
         # subject_id must be in query params
         try:
             subject_id = int(request.query_params.get("subject_id", ""))
@@ -85,40 +30,10 @@ class EvaluationCreateV2View(APIView):
         if not criterion_id or score_val is None:
             return Response({"detail": "criterion_id and score are required"}, status=400)
 
-        # Dynamically resolve field names on Evaluation
-        subject_field = _pick_fk_field(Evaluation, ["subject", "target", "rated_user", "profile", "user"])
-        rater_field = _pick_fk_field(Evaluation, ["rater", "evaluator", "author", "user"])
-        criterion_field = _pick_fk_field(Evaluation, ["criterion", "criteria"])
-        score_field = _pick_numeric_field(Evaluation, ["score", "rating", "value", "val", "points"])
-        familiarity_field = _pick_numeric_field(Evaluation, ["familiarity", "weight", "confidence"])  # optional
-
-        if not (subject_field and rater_field and criterion_field and score_field):
-            return Response({"detail": "Evaluation model fields could not be inferred."}, status=500)
-
-        # Validate criterion exists
         try:
-            Criterion.objects.get(pk=criterion_id)
-        except Criterion.DoesNotExist:
-            return Response({"detail": "criterion_id not found"}, status=404)
-
-        # Create evaluation
-        payload = {
-            f"{subject_field}_id": subject_id,
-            f"{rater_field}_id": request.user.id,
-            f"{criterion_field}_id": criterion_id,
-            score_field: score_val,
-        }
-        if familiarity_field and familiarity_val is not None:
-            payload[familiarity_field] = familiarity_val
-
-        ev = Evaluation.objects.create(**payload)
-
-        # Participation gating for SUBJECT (rated user): count their outbound ratings
-        outbound_count = Evaluation.objects.filter(**{f"{rater_field}_id": subject_id}).count()
-
-        min_outbound = int(getattr(settings, "EVALUATIONS_MIN_OUTBOUND", 10))
-
-        status_value = EvaluationMeta.STATUS_ACTIVE if outbound_count >= min_outbound else EvaluationMeta.STATUS_PENDING
-        EvaluationMeta.objects.create(evaluation=ev, status=status_value)
+            ev, active = create_evaluation(request.user, subject_id, criterion_id, score_val, familiarity_val)
+        except EvaluationWriteError as exc:
+            return Response({"detail": exc.detail}, status=exc.status_code)
 
+        status_value = EvaluationMeta.STATUS_ACTIVE if active else EvaluationMeta.STATUS_PENDING
         return Response({"id": ev.pk, "status": status_value}, status=201)
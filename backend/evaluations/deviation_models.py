@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from django.db import models
+
+
+class RaterDeviation(models.Model):
+    """
+    Running deviation accumulators of one rater against the PairConsensus averages:
+    dev_sum = sum of |score - consensus|, scored_count and extreme_count over the rater's evaluations.
+    Reliability/extreme-rate weights derive from these three numbers without reading the rater's
+    history; RaterPairContribution keeps the per-pair terms so a consensus move applies as a delta.
+
+    rater_id is deliberately not a foreign key (see DirtyRater): deltas may land while the user is
+    being cascade-deleted. ``manage.py resync_rater_deviations`` recomputes the rows exactly.
+    """
+
+    rater_id = models.BigIntegerField(unique=True)
+    dev_sum = models.FloatField(default=0.0)
+    scored_count = models.PositiveIntegerField(default=0)
+    extreme_count = models.PositiveIntegerField(default=0)
+    # Last exact recompute; delta updates in between may accumulate floating-point drift.
+    synced_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Rater Deviation"
+        verbose_name_plural = "Rater Deviations"
+
+    def __str__(self) -> str:
+        return f"RaterDeviation<{self.rater_id}>"
+
+
+class RaterPairContribution(models.Model):
+    """
+    One rater's current share of RaterDeviation for one (subject, criterion) pair.
+    When the pair's consensus moves, only its rows are re-derived and the difference is added to
+    each rater's accumulators. Ids are plain integers for the same reason as RaterDeviation.
+    """
+
+    rater_id = models.BigIntegerField()
+    subject_id = models.BigIntegerField()
+    criterion_id = models.BigIntegerField()
+    dev_sum = models.FloatField(default=0.0)
+    scored_count = models.PositiveIntegerField(default=0)
+    extreme_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Rater Pair Contribution"
+        verbose_name_plural = "Rater Pair Contributions"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["rater_id", "subject_id", "criterion_id"], name="uniq_rater_pair_contribution"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["subject_id", "criterion_id"], name="rater_pair_contribution_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"RaterPairContribution<{self.rater_id}:{self.subject_id}:{self.criterion_id}>"
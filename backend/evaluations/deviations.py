@@ -0,0 +1,269 @@
+"""
+Maintenance of the RaterDeviation accumulators and their RaterPairContribution terms.
+
+apply_pair_deviations() runs for every pair whose consensus moved (inline from the signal
+receivers in sync mode, otherwise from the process_dirty_raters worker via DirtyPair): only that
+pair's evaluations are read, and each of its raters' accumulators change by the difference
+between the new and the stored contribution. Rater weights are then written from the
+accumulators alone. resync_rater_deviations() recomputes everything exactly
+(recompute_rater_weights, the resync_rater_deviations command and the worker's rolling
+--resync-interval pass use it) to bound the floating-point drift of the delta updates.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import (
+    Case,
+    Count,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Abs
+from django.utils import timezone
+
+from .consensus_models import PairConsensus
+from .deviation_models import RaterDeviation, RaterPairContribution
+from .models import Evaluation
+from .rater_stats import EXTREME_LOW, WEIGHT_EXTREME_HIGH, is_extreme
+
+Pair = Tuple[int, int]
+ContributionKey = Tuple[int, int, int]
+# (dev_sum, scored_count, extreme_count)
+Totals = Tuple[float, int, int]
+
+DEVIATION_FIELDS = ("dev_sum", "scored_count", "extreme_count")
+
+
+def _pair_filter(pairs: Iterable[Pair]) -> Q:
+    query = Q(pk__in=[])
+    for subject_id, criterion_id in pairs:
+        query |= Q(subject_id=subject_id, criterion_id=criterion_id)
+    return query
+
+
+def _add(totals: Totals, other: Totals, sign: int = 1) -> Totals:
+    return totals[0] + sign * other[0], totals[1] + sign * other[1], totals[2] + sign * other[2]
+
+
+def _add_rater_deltas(deltas: Dict[int, Totals]) -> None:
+    """Add per-rater deltas to RaterDeviation with one insert and one CASE UPDATE."""
+
+    deltas = {rater_id: delta for rater_id, delta in deltas.items() if any(delta)}
+    if not deltas:
+        return
+
+    def case(index: int, output_field):
+        return Case(
+            *[When(rater_id=rater_id, then=Value(delta[index])) for rater_id, delta in deltas.items()],
+            default=Value(0),
+            output_field=output_field,
+        )
+
+    RaterDeviation.objects.bulk_create(
+        [RaterDeviation(rater_id=rater_id) for rater_id in deltas], ignore_conflicts=True
+    )
+    RaterDeviation.objects.filter(rater_id__in=list(deltas)).update(
+        dev_sum=F("dev_sum") + case(0, FloatField()),
+        scored_count=F("scored_count") + case(1, IntegerField()),
+        extreme_count=F("extreme_count") + case(2, IntegerField()),
+        updated_at=timezone.now(),
+    )
+
+
+def apply_pair_deviations(pairs: Iterable[Pair]) -> set[int]:
+    """
+    Re-derive every rater's contribution to ``pairs`` against the pairs' current consensus and
+    fold the change into RaterDeviation. The PairConsensus rows are locked first (in pk order), so
+    concurrent calls for one pair run one after the other instead of applying the same delta twice
+    or colliding on uniq_rater_pair_contribution. Query count is independent of the raters' history.
+    Returns the raters whose accumulators changed.
+    """
+
+    pairs = set(pairs)
+    if not pairs:
+        return set()
+
+    with transaction.atomic():
+        locked = (
+            PairConsensus.objects.select_for_update()
+            .filter(_pair_filter(pairs))
+            .order_by("pk")
+            .values_list("subject_id", "criterion_id", "score_sum", "score_count")
+        )
+        consensus = {
+            (subject_id, criterion_id): float(score_sum) / score_count
+            for subject_id, criterion_id, score_sum, score_count in locked
+            if score_count > 0
+        }
+
+        fresh: Dict[ContributionKey, Totals] = {}
+        rows = Evaluation.objects.filter(_pair_filter(pairs)).values_list(
+            "evaluator_id", "subject_id", "criterion_id", "score"
+        )
+        for rater_id, subject_id, criterion_id, score in rows:
+            mean = consensus.get((subject_id, criterion_id))
+            if mean is None:
+                continue
+            key = (rater_id, subject_id, criterion_id)
+            extreme = int(is_extreme(score, WEIGHT_EXTREME_HIGH))
+            fresh[key] = _add(fresh.get(key, (0.0, 0, 0)), (abs(score - mean), 1, extreme))
+
+        stored: Dict[ContributionKey, Tuple[int, Totals]] = {
+            (rater_id, subject_id, criterion_id): (pk, tuple(totals))
+            for pk, rater_id, subject_id, criterion_id, *totals in RaterPairContribution.objects.filter(
+                _pair_filter(pairs)
+            ).values_list("pk", "rater_id", "subject_id", "criterion_id", *DEVIATION_FIELDS)
+        }
+        # Only rows whose terms changed are rewritten; their difference is the rater's delta.
+        deltas: Dict[int, Totals] = {}
+        stale = []
+        for key, (pk, totals) in stored.items():
+            if fresh.get(key) != totals:
+                stale.append(pk)
+                deltas[key[0]] = _add(deltas.get(key[0], (0.0, 0, 0)), totals, sign=-1)
+        changed = {key: totals for key, totals in fresh.items() if key not in stored or stored[key][1] != totals}
+        for (rater_id, _, _), totals in changed.items():
+            deltas[rater_id] = _add(deltas.get(rater_id, (0.0, 0, 0)), totals)
+
+        if stale:
+            RaterPairContribution.objects.filter(pk__in=stale).delete()
+        RaterPairContribution.objects.bulk_create(
+            [
+                RaterPairContribution(
+                    rater_id=rater_id,
+                    subject_id=subject_id,
+                    criterion_id=criterion_id,
+                    dev_sum=dev_sum,
+                    scored_count=scored_count,
+                    extreme_count=extreme_count,
+                )
+                for (rater_id, subject_id, criterion_id), (dev_sum, scored_count, extreme_count) in changed.items()
+            ]
+        )
+        _add_rater_deltas(deltas)
+    return {rater_id for rater_id, delta in deltas.items() if any(delta)}
+
+
+def deviation_totals(rater_ids: Iterable[int]) -> Dict[int, Totals]:
+    """Stored (dev_sum, scored_count, extreme_count) per rater, in one query."""
+
+    return {
+        rater_id: (dev_sum, scored_count, extreme_count)
+        for rater_id, dev_sum, scored_count, extreme_count in RaterDeviation.objects.filter(
+            rater_id__in=list(rater_ids)
+        ).values_list("rater_id", *DEVIATION_FIELDS)
+    }
+
+
+def exact_contributions(rater_ids=None):
+    """Per (rater, subject, criterion) totals computed from scratch against the consensus averages."""
+
+    consensus = PairConsensus.objects.filter(
+        subject_id=OuterRef("subject_id"),
+        criterion_id=OuterRef("criterion_id"),
+        score_count__gt=0,
+    ).values(mean=ExpressionWrapper(F("score_sum") / F("score_count"), output_field=FloatField()))[:1]
+
+    queryset = Evaluation.objects.annotate(consensus=Subquery(consensus, output_field=FloatField()))
+    if rater_ids is not None:
+        queryset = queryset.filter(evaluator_id__in=rater_ids)
+    return (
+        queryset.filter(consensus__isnull=False)
+        .values("evaluator_id", "subject_id", "criterion_id")
+        .annotate(
+            dev_sum=Sum(Abs(F("score") - F("consensus")), output_field=FloatField()),
+            scored_count=Count("id"),
+            extreme_count=Count("id", filter=Q(score__lte=EXTREME_LOW) | Q(score__gte=WEIGHT_EXTREME_HIGH)),
+        )
+        .order_by()
+    )
+
+
+def resync_rater_deviations(
+    rater_ids: Optional[Iterable[int]] = None,
+    batch_size: int = 1000,
+) -> int:
+    """
+    Recompute the accumulators and contribution rows exactly (for ``rater_ids``, or everyone).
+    Returns the number of raters written.
+    """
+
+    only = None if rater_ids is None else sorted({int(rater_id) for rater_id in rater_ids})
+
+    contributions = []
+    totals: Dict[int, Totals] = {}
+    for row in exact_contributions(only).iterator():
+        rater_id = row["evaluator_id"]
+        row_totals = (float(row["dev_sum"] or 0.0), int(row["scored_count"]), int(row["extreme_count"]))
+        totals[rater_id] = _add(totals.get(rater_id, (0.0, 0, 0)), row_totals)
+        contributions.append(
+            RaterPairContribution(
+                rater_id=rater_id,
+                subject_id=row["subject_id"],
+                criterion_id=row["criterion_id"],
+                dev_sum=row_totals[0],
+                scored_count=row_totals[1],
+                extreme_count=row_totals[2],
+            )
+        )
+
+    now = timezone.now()
+    with transaction.atomic():
+        stale_contributions = RaterPairContribution.objects.all()
+        stale_deviations = RaterDeviation.objects.all()
+        if only is not None:
+            stale_contributions = stale_contributions.filter(rater_id__in=only)
+            stale_deviations = stale_deviations.filter(rater_id__in=only)
+        stale_contributions.delete()
+        stale_deviations.delete()
+        RaterPairContribution.objects.bulk_create(contributions, batch_size=batch_size)
+        RaterDeviation.objects.bulk_create(
+            [
+                RaterDeviation(
+                    rater_id=rater_id,
+                    dev_sum=dev_sum,
+                    scored_count=scored_count,
+                    extreme_count=extreme_count,
+                    synced_at=now,
+                )
+                for rater_id, (dev_sum, scored_count, extreme_count) in totals.items()
+            ],
+            batch_size=batch_size,
+        )
+    return len(totals)
+
+
+def check_rater_deviations(tolerance: float = 1e-6) -> List[Tuple[int, str]]:
+    """
+    Compare the stored accumulators with an exact recomputation.
+    Returns (rater_id, reason) for every missing, extra or drifted row.
+    """
+
+    expected: Dict[int, Totals] = {}
+    for row in exact_contributions().iterator():
+        row_totals = (float(row["dev_sum"] or 0.0), int(row["scored_count"]), int(row["extreme_count"]))
+        expected[row["evaluator_id"]] = _add(expected.get(row["evaluator_id"], (0.0, 0, 0)), row_totals)
+
+    problems: List[Tuple[int, str]] = []
+    for rater_id, *stored in RaterDeviation.objects.values_list("rater_id", *DEVIATION_FIELDS).iterator():
+        fresh = expected.pop(rater_id, None)
+        if fresh is None:
+            if any(stored):
+                problems.append((rater_id, "extra"))
+            continue
+        drifted = [name for name, a, b in zip(DEVIATION_FIELDS, stored, fresh) if abs(float(a) - float(b)) > tolerance]
+        if drifted:
+            problems.append((rater_id, "drift: " + ", ".join(drifted)))
+    problems.extend((rater_id, "missing") for rater_id in expected)
+    return sorted(problems)
@@ -1,9 +1,10 @@
 from django.apps import apps
 from django.core.management.base import BaseCommand
+from django.utils import timezone
 
 
 class Command(BaseCommand):
-    help = "Promote all EvaluationMeta statuses to ACTIVE (dev utility)."
+    help = "Promote all evaluations (and their EvaluationMeta mirrors) to ACTIVE (dev utility)."
 
     def handle(self, *args, **options):
         try:
@@ -12,5 +13,13 @@ class Command(BaseCommand):
             self.stdout.write("EvaluationMeta model not found; nothing to do.")
             return
 
-        updated = EvaluationMeta.objects.exclude(status="ACTIVE").update(status="ACTIVE")
+        Evaluation = apps.get_model("evaluations", "Evaluation")
+        updated = Evaluation.objects.filter(is_active=False).update(is_active=True)
+        EvaluationMeta.objects.exclude(status="ACTIVE").update(status="ACTIVE", updated_at=timezone.now())
         self.stdout.write(self.style.SUCCESS(f"Promoted {updated} evaluations to ACTIVE."))
+
+        if updated:
+            # The bulk updates skip the signals that keep summary-v2's table in step.
+            from evaluations.subject_summaries import rebuild_subject_summaries
+
+            rebuild_subject_summaries()
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from evaluations.benchmarks import BENCHMARKS, DEFAULT_SIZES, compare_results, run_benchmarks
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the evaluations hot paths at several synthetic dataset sizes on a throwaway SQLite database, "
+        "save the results as JSON and optionally --baseline compare them, failing on regressions. "
+        "Run with DJANGO_SETTINGS_MODULE=django_project.settings_test."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            default=",".join(str(size) for size in DEFAULT_SIZES),
+            help="Comma-separated dataset sizes (evaluations)",
+        )
+        parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case (after one warm-up run)")
+        parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic datasets")
+        parser.add_argument(
+            "--only",
+            action="append",
+            choices=sorted(BENCHMARKS),
+            help="Run only this case (repeatable)",
+        )
+        parser.add_argument("--output", help="Write the results to this JSON file")
+        parser.add_argument(
+            "--input",
+            help="Compare this results file instead of running the benchmarks (requires --baseline)",
+        )
+        parser.add_argument("--baseline", help="Results file to compare against")
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.2,
+            help="Allowed slowdown of a case's median before it counts as a regression (0.2 = 20%%)",
+        )
+
+    def _progress(self, name: str, size: int, timing: dict) -> None:
+        self.stdout.write(
+            f"  {name:<28} {size:>8}  median {timing['median'] * 1000:9.2f} ms  "
+            f"min {timing['min'] * 1000:9.2f} ms  {timing['queries']:>4} queries"
+        )
+
+    def _load(self, path: str) -> dict:
+        try:
+            with open(path) as handle:
+                return json.load(handle)
+        except (OSError, ValueError) as exc:
+            raise CommandError(f"Cannot read benchmark results {path}: {exc}") from exc
+
+    def _run(self, options) -> dict:
+        if connection.vendor != "sqlite":
+            raise CommandError(
+                "Benchmarks run on SQLite only; use DJANGO_SETTINGS_MODULE=django_project.settings_test."
+            )
+        try:
+            sizes = [int(size) for size in options["sizes"].split(",") if size.strip()]
+        except ValueError:
+            raise CommandError("--sizes must be comma-separated integers.") from None
+
+        # A throwaway database: the configured one is never touched.
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            return run_benchmarks(
+                sizes=sizes,
+                repeat=max(1, options["repeat"]),
+                seed=options["seed"],
+                only=options["only"],
+                progress=self._progress,
+            )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    def handle(self, *args, **options):
+        if options["input"]:
+            if not options["baseline"]:
+                raise CommandError("--input requires --baseline.")
+            results = self._load(options["input"])
+        else:
+            results = self._run(options)
+
+        if options["output"]:
+            with open(options["output"], "w") as handle:
+                json.dump(results, handle, indent=2, sort_keys=True)
+            self.stdout.write(f"Results written to {options['output']}.")
+
+        if not options["baseline"]:
+            return
+        regressions = compare_results(self._load(options["baseline"]), results, threshold=options["threshold"])
+        for regression in regressions:
+            self.stdout.write(
+                f"  {regression.name} @ {regression.size}: {regression.baseline * 1000:.2f} ms -> "
+                f"{regression.current * 1000:.2f} ms ({regression.ratio:.2f}x)"
+            )
+        if regressions:
+            raise CommandError(f"{len(regressions)} benchmarks regressed by more than {options['threshold']:.0%}.")
+        self.stdout.write(self.style.SUCCESS("No regressions."))
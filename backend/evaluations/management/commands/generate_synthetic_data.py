@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from evaluations.synthetic import DEGREE_DISTRIBUTIONS, SyntheticConfig, generate
+
+DEFAULTS = SyntheticConfig()
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a deterministic synthetic dataset (users with profiles, friendships, questions, answers "
+        "and evaluations) for reproducing production performance locally, e.g. "
+        "--users 200000 --evaluations 10000000."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=DEFAULTS.users, help="Users (each with a profile)")
+        parser.add_argument("--evaluations", type=int, default=DEFAULTS.evaluations, help="Evaluations to create")
+        parser.add_argument("--degree", type=int, default=DEFAULTS.degree, help="Mean friendship degree")
+        parser.add_argument(
+            "--distribution",
+            choices=DEGREE_DISTRIBUTIONS,
+            default=DEFAULTS.distribution,
+            help="Degree distribution of the friendship graph",
+        )
+        parser.add_argument(
+            "--confirmed-rate",
+            type=float,
+            default=DEFAULTS.confirmed_rate,
+            help="Share of friendships that are confirmed",
+        )
+        parser.add_argument("--questions", type=int, default=DEFAULTS.questions, help="Questions to create")
+        parser.add_argument(
+            "--answers-per-question",
+            type=int,
+            default=DEFAULTS.answers_per_question,
+            help="Distinct users answering each question",
+        )
+        parser.add_argument(
+            "--leniency",
+            type=float,
+            default=DEFAULTS.leniency,
+            help="Standard deviation of the per-rater score offset",
+        )
+        parser.add_argument(
+            "--noise",
+            type=float,
+            default=DEFAULTS.noise,
+            help="Standard deviation of the per-evaluation score noise",
+        )
+        parser.add_argument(
+            "--days", type=int, default=DEFAULTS.days, help="Spread evaluation timestamps over this many days"
+        )
+        parser.add_argument("--seed", type=int, default=DEFAULTS.seed, help="Random seed; equal seeds give equal data")
+        parser.add_argument("--prefix", default=DEFAULTS.prefix, help="Username prefix of the generated users")
+        parser.add_argument("--batch-size", type=int, default=DEFAULTS.batch_size, help="Rows per bulk INSERT")
+        parser.add_argument(
+            "--skip-rebuild",
+            action="store_true",
+            help="Do not rebuild weights, deviations, pending tasks and subject summaries afterwards",
+        )
+
+    def handle(self, *args, **options):
+        config = SyntheticConfig(
+            users=options["users"],
+            evaluations=options["evaluations"],
+            degree=options["degree"],
+            distribution=options["distribution"],
+            confirmed_rate=options["confirmed_rate"],
+            questions=options["questions"],
+            answers_per_question=options["answers_per_question"],
+            leniency=options["leniency"],
+            noise=options["noise"],
+            days=options["days"],
+            seed=options["seed"],
+            prefix=options["prefix"],
+            batch_size=max(1, int(options["batch_size"])),
+        )
+
+        def progress(written: int) -> None:
+            self.stdout.write(f"  {written} evaluations written")
+
+        try:
+            report = generate(
+                config,
+                rebuild=not options["skip_rebuild"],
+                progress=progress if options["verbosity"] > 1 else None,
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated {report.users} users, {report.friendships} friendships, {report.questions} questions, "
+                f"{report.answers} answers and {report.evaluations} evaluations in {report.seconds:.1f}s."
+            )
+        )
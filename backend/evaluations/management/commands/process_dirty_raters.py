@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from evaluations.signals import dirty_rater_backlog, drain_dirty_pairs, drain_dirty_raters, resync_stale_raters
+
+
+class Command(BaseCommand):
+    help = (
+        "Drain the dirty-pair and dirty-rater queues: apply deviation deltas, then recompute "
+        "reliability/extreme-rate weights in batches. With --loop, idle passes also resync the deviation "
+        "accumulators exactly, so every rater is resynced at least once per --resync-interval."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Pairs and raters claimed per transaction",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling the queue instead of exiting once it is empty",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=2.0,
+            help="Seconds to wait between polls when --loop finds the queue empty",
+        )
+        parser.add_argument(
+            "--resync-interval",
+            type=float,
+            default=86400.0,
+            help="Max seconds between exact resyncs of a rater's deviation accumulators in --loop mode (0 disables)",
+        )
+        parser.add_argument(
+            "--stats",
+            action="store_true",
+            help="Print queue depth and max staleness, then exit",
+        )
+
+    def _report_backlog(self) -> None:
+        backlog = dirty_rater_backlog()
+        self.stdout.write(
+            f"dirty_raters pending={backlog['pending']} dirty_pairs pending={backlog['pending_pairs']} "
+            f"max_staleness_seconds={backlog['max_staleness_seconds']:.1f}"
+        )
+
+    def handle(self, *args, **options):
+        if options["stats"]:
+            self._report_backlog()
+            return
+
+        batch_size = max(1, int(options["batch_size"]))
+        total = 0
+        while True:
+            pairs = drain_dirty_pairs(batch_size=batch_size)
+            processed = drain_dirty_raters(batch_size=batch_size)
+            total += processed
+            if pairs or processed:
+                continue
+            if not options["loop"]:
+                break
+            # Resync only once the queues are empty, so fresh writes are never delayed behind it.
+            if options["resync_interval"] > 0 and resync_stale_raters(options["resync_interval"], batch_size):
+                continue
+            self._report_backlog()
+            time.sleep(options["sleep"])
+
+        self.stdout.write(self.style.SUCCESS(f"Recomputed weights for {total} raters."))
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from evaluations.purge import purge_users
+
+
+class Command(BaseCommand):
+    help = "Delete users with every evaluation they gave or received, refreshing dependent stats once."
+
+    def add_arguments(self, parser):
+        parser.add_argument("user_ids", nargs="+", type=int, help="Ids of the users to delete")
+
+    def handle(self, *args, **options):
+        report = purge_users(options["user_ids"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Purged {report.users} users and {report.evaluations} evaluations; "
+                f"refreshed {report.raters} raters and {report.pairs} pairs in {report.seconds:.2f}s."
+            )
+        )
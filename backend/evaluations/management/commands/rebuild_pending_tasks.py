@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from evaluations.pending_tasks import rebuild_pending_tasks
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the PendingTask due-task queue from evaluations, confirmed friendships and criteria. "
+        "Run it after changing EVALUATIONS_REPEAT_DAYS."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            type=int,
+            action="append",
+            dest="user_ids",
+            help="Only rebuild tasks for this evaluator id (repeatable)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows per bulk INSERT",
+        )
+
+    def handle(self, *args, **options):
+        written = rebuild_pending_tasks(
+            evaluator_ids=options["user_ids"],
+            batch_size=max(1, int(options["batch_size"])),
+        )
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {written} pending tasks."))
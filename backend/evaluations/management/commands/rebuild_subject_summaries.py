@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from evaluations.subject_summaries import check_subject_summaries, rebuild_subject_summaries
+
+
+class Command(BaseCommand):
+    help = "Rebuild (or --check) the maintained SubjectCriterionSummary table behind summary-v2."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Compare the maintained rows with a fresh aggregation instead of rebuilding",
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=1e-6,
+            help="Allowed absolute difference per summed column in --check mode",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows per bulk INSERT",
+        )
+
+    def handle(self, *args, **options):
+        if options["check"]:
+            problems = check_subject_summaries(tolerance=options["tolerance"])
+            for subject_id, criterion_id, reason in problems[:20]:
+                self.stdout.write(f"  subject {subject_id} criterion {criterion_id}: {reason}")
+            if problems:
+                raise CommandError(f"{len(problems)} subject summaries are out of date.")
+            self.stdout.write(self.style.SUCCESS("Subject summaries are consistent."))
+            return
+
+        written = rebuild_subject_summaries(batch_size=max(1, int(options["batch_size"])))
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {written} subject summaries."))
@@ -1,18 +1,32 @@
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
-from statistics import mean, pstdev
-from typing import Dict, List, Tuple
+import time
+from typing import List
 
 from django.apps import apps
 from django.conf import settings
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
-from django.db.models import Avg
+
+from evaluations.rater_stats import (
+    EvaluationFields,
+    StreamReport,
+    capture_high_water,
+    compute_for_raters,
+    compute_numpy,
+    compute_python,
+    compute_sharded,
+    stream_rater_stats,
+    touched_rater_ids,
+    upsert_rater_stats,
+    verify_sample,
+)
 
 logger = logging.getLogger(__name__)
 
+WATERMARK_NAME = "default"
+
 
 def _pick_fk_field(model, preferred_names):
     # Exact name match first
@@ -56,7 +70,10 @@ def _pick_numeric_field(model, preferred_names):
 
 
 class Command(BaseCommand):
-    help = "Recompute per-rater statistics (mean/std/extreme rate/reliability) for evaluations."
+    help = (
+        "Recompute per-rater statistics (mean/std/extreme rate/reliability) over every evaluation a rater "
+        "gave, pending or active, with scores <= 1 or >= 10 counting as extreme."
+    )
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -79,12 +96,93 @@ class Command(BaseCommand):
             type=str,
             help="Evaluation numeric score field name",
         )
+        parser.add_argument(
+            "--engine",
+            choices=["python", "numpy", "stream"],
+            default="python",
+            help=(
+                "Aggregation engine: pure Python (default), vectorised NumPy, "
+                "or bounded-memory streaming with per-batch commits"
+            ),
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5000,
+            help="Rows fetched per round trip by --engine=stream",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="RaterStats rows upserted and committed per batch by --engine=stream",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=0,
+            help=(
+                "Shard raters by id across N processes (NumPy); "
+                "pair consensus is computed once and shared via memory-mapped arrays"
+            ),
+        )
+        parser.add_argument(
+            "--since",
+            action="store_true",
+            help="Only recompute raters of pairs touched since the last run's watermark",
+        )
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Force a complete recompute (overrides --since) and reset the watermark",
+        )
+        parser.add_argument(
+            "--verify",
+            type=int,
+            default=0,
+            metavar="N",
+            help="Afterwards, recompute N random raters from scratch and fail on any mismatch",
+        )
         parser.add_argument(
             "--list-fields",
             action="store_true",
             help="List detected Evaluation fields and exit",
         )
 
+    def _report_progress(self, report: StreamReport) -> None:
+        rate = report.rows / report.seconds if report.seconds > 0 else float(report.rows)
+        self.stdout.write(f"  {report.rows} rows, {report.raters} raters written ({rate:,.0f} rows/s)")
+
+    def _run_sharded(self, qs, fields: EvaluationFields, workers: int, RaterStats, batch_size: int) -> None:
+        try:
+            import numpy  # noqa: F401
+        except ImportError as exc:
+            raise CommandError("--workers requires numpy to be installed.") from exc
+        if RaterStats is None:
+            logger.warning("RaterStats model not found; computed aggregates but skipped DB writes.")
+
+        started = time.monotonic()
+        reports = compute_sharded(
+            qs,
+            fields,
+            workers=workers,
+            write=RaterStats is not None,
+            batch_size=batch_size,
+            processes=workers > 1,
+        )
+        for report in reports:
+            self.stdout.write(
+                f"  shard {report.shard}: {report.rows} rows, {report.raters} raters in {report.seconds:.2f}s"
+            )
+        updated = sum(report.raters for report in reports) if RaterStats is not None else 0
+        rows = sum(report.rows for report in reports)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Updated RaterStats for {updated} users from {rows} rows "
+                f"across {len(reports)} shards in {time.monotonic() - started:.1f}s."
+            )
+        )
+
     def handle(self, *args, **options):
         Evaluation = apps.get_model("evaluations", "Evaluation")
 
@@ -163,75 +261,111 @@ class Command(BaseCommand):
             )
             return
 
-        # Base queryset; optionally filter by EvaluationMeta status
+        # Base queryset: every evaluation, pending or active. This used to be ACTIVE rows only, but the
+        # moments normalize every evaluation the rater gave, and activation gates the subject, not the
+        # rater: a rater's leniency does not change when one of their subjects passes the outbound gate.
+        # The live moments in signals fold in the same population.
         qs = Evaluation.objects.all()
-        if EvaluationMeta:
-            qs = qs.filter(evaluationmeta__status="ACTIVE")
-
-        # Consensus avg per (subject, criterion)
-        agg = qs.values(f"{subject_field}_id", f"{criterion_field}_id").annotate(avg=Avg(score_field)).order_by()
-        consensus: Dict[Tuple[int, int], float] = {
-            (
-                int(row[f"{subject_field}_id"]),
-                int(row[f"{criterion_field}_id"]),
-            ): float(row["avg"])
-            for row in agg
-        }
-
-        # Collect per-rater deviations and stats
-        by_rater: Dict[int, List[float]] = defaultdict(list)
-        raw_scores: Dict[int, List[float]] = defaultdict(list)
-        extreme_cnt: Dict[int, int] = defaultdict(int)
-
-        for ev in qs.values(
-            f"{rater_field}_id",
-            f"{subject_field}_id",
-            f"{criterion_field}_id",
-            score_field,
-        ):
-            uid_val = ev.get(f"{rater_field}_id")
-            if uid_val is None:
-                continue
-            uid = int(uid_val)
-
-            s = float(ev[score_field])
-            key = (int(ev[f"{subject_field}_id"]), int(ev[f"{criterion_field}_id"]))
-            avg = consensus.get(key)
-            if avg is None:
-                continue
-
-            by_rater[uid].append(abs(s - avg))
-            raw_scores[uid].append(s)
-            if s <= 1.0 or s >= 10.0:
-                extreme_cnt[uid] += 1
+
+        fields = EvaluationFields(
+            rater=rater_field,
+            subject=subject_field,
+            criterion=criterion_field,
+            score=score_field,
+        )
+        Watermark = None
+        if RaterStats is not None:
+            try:
+                Watermark = apps.get_model("evaluations", "RaterStatsWatermark")
+            except LookupError:
+                Watermark = None
+        high_water = capture_high_water(Evaluation, EvaluationMeta) if Watermark is not None else None
+
+        watermark = None
+        if options.get("since") and not options.get("full"):
+            if Watermark is None:
+                raise CommandError("--since requires the RaterStats and RaterStatsWatermark models.")
+            watermark = Watermark.objects.filter(name=WATERMARK_NAME).first()
+            if watermark is None:
+                self.stdout.write("No watermark recorded yet; running a full recompute.")
+
+        if watermark is not None:
+            self._run_incremental(Evaluation, qs, fields, watermark, RaterStats, has_meta=EvaluationMeta is not None)
+        else:
+            self._run_full(qs, fields, RaterStats, options)
+
+        if high_water is not None:
+            Watermark.objects.update_or_create(
+                name=WATERMARK_NAME,
+                defaults={
+                    "last_evaluation_id": high_water.evaluation_id,
+                    "last_created_at": high_water.created_at,
+                    "last_meta_updated_at": high_water.meta_updated_at,
+                },
+            )
+
+        sample_size = int(options.get("verify") or 0)
+        if sample_size and RaterStats is not None:
+            checked, mismatched = verify_sample(qs, fields, RaterStats, sample_size)
+            if mismatched:
+                raise CommandError(
+                    f"Verification failed for {len(mismatched)} of {checked} sampled raters: {sorted(mismatched)[:20]}"
+                )
+            self.stdout.write(self.style.SUCCESS(f"Verified {checked} sampled raters against a full recompute."))
+
+    def _run_incremental(self, Evaluation, qs, fields: EvaluationFields, watermark, RaterStats, has_meta: bool) -> None:
+        rater_ids = touched_rater_ids(Evaluation, qs, fields, watermark, has_meta=has_meta)
+        rows = compute_for_raters(qs, fields, rater_ids)
+        with transaction.atomic():
+            updated = upsert_rater_stats(RaterStats, rows)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Updated RaterStats for {updated} users "
+                f"({len(rater_ids)} touched since evaluation #{watermark.last_evaluation_id})."
+            )
+        )
+
+    def _run_full(self, qs, fields: EvaluationFields, RaterStats, options) -> None:
+        workers = int(options.get("workers") or 0)
+        if workers:
+            self._run_sharded(qs, fields, workers, RaterStats, batch_size=max(1, int(options["batch_size"])))
+            return
+
+        engine = options.get("engine") or "python"
+        if engine == "stream":
+            report = stream_rater_stats(
+                qs,
+                fields,
+                RaterStats,
+                chunk_size=max(1, int(options["chunk_size"])),
+                batch_size=max(1, int(options["batch_size"])),
+                progress=self._report_progress,
+            )
+            updated = report.raters
+            if RaterStats is None:
+                updated = 0
+                logger.warning("RaterStats model not found; computed aggregates but skipped DB writes.")
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Updated RaterStats for {updated} users from {report.rows} rows in {report.seconds:.1f}s."
+                )
+            )
+            return
+
+        if engine == "numpy":
+            try:
+                import numpy  # noqa: F401
+            except ImportError as exc:
+                raise CommandError("--engine=numpy requires numpy to be installed.") from exc
+            rows = compute_numpy(qs, fields)
+        else:
+            rows = compute_python(qs, fields)
 
         # Write aggregates if RaterStats exists; otherwise, just report
         updated = 0
         if RaterStats is not None:
             with transaction.atomic():
-                for uid, diffs in by_rater.items():
-                    scores = raw_scores.get(uid, [])
-                    if not scores:
-                        continue
-
-                    cnt = len(scores)
-                    mu = mean(scores)
-                    sd = pstdev(scores) if len(scores) > 1 else 0.0
-                    e_rate = extreme_cnt.get(uid, 0) / float(cnt)
-
-                    # Map mean absolute deviation to reliability in [0.5, 1.0]
-                    mad = mean(diffs) if diffs else 0.0
-                    rel = 1.0 / (1.0 + (mad / 3.0))
-                    rel = max(0.5, min(1.0, rel))
-
-                    obj, _ = RaterStats.objects.get_or_create(user_id=uid)
-                    obj.ratings_count = cnt
-                    obj.mean_score = mu
-                    obj.std_score = sd
-                    obj.extreme_rate = e_rate
-                    obj.reliability = rel
-                    obj.save()
-                    updated += 1
+                updated = upsert_rater_stats(RaterStats, rows)
         else:
             logger.warning("RaterStats model not found; computed aggregates but skipped DB writes.")
 
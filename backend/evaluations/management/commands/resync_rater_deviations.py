@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from evaluations.deviation_models import RaterDeviation
+from evaluations.deviations import check_rater_deviations, resync_rater_deviations
+from evaluations.signals import apply_rater_weights
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute (or --check) the RaterDeviation accumulators exactly and rewrite rater weights from them. "
+        "The process_dirty_raters --loop worker already resyncs every rater once per --resync-interval "
+        "(daily by default); use this for a one-off full resync or a --check."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Compare the accumulators with an exact recomputation instead of resyncing",
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=1e-6,
+            help="Allowed absolute difference per accumulator in --check mode",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows per bulk INSERT",
+        )
+
+    def handle(self, *args, **options):
+        if options["check"]:
+            problems = check_rater_deviations(tolerance=options["tolerance"])
+            for rater_id, reason in problems[:20]:
+                self.stdout.write(f"  rater {rater_id}: {reason}")
+            if problems:
+                raise CommandError(f"{len(problems)} rater deviation accumulators are out of date.")
+            self.stdout.write(self.style.SUCCESS("Rater deviations are consistent."))
+            return
+
+        resynced = resync_rater_deviations(batch_size=max(1, int(options["batch_size"])))
+        apply_rater_weights(RaterDeviation.objects.values_list("rater_id", flat=True))
+        self.stdout.write(self.style.SUCCESS(f"Resynced {resynced} raters."))
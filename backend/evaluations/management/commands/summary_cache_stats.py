@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from evaluations.summary_cache import reset_summary_cache_stats, summary_cache_stats
+
+
+class Command(BaseCommand):
+    help = "Print the shared hit / miss / stale-served counters of the evaluation summary cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Zero the counters after printing them",
+        )
+
+    def handle(self, *args, **options):
+        stats = summary_cache_stats()
+        served = sum(stats.values())
+        hit_rate = (stats["hit"] + stats["stale"]) / served if served else 0.0
+        self.stdout.write(
+            f"summary_cache hit={stats['hit']} miss={stats['miss']} stale={stats['stale']} "
+            f"served_from_cache={hit_rate:.1%}"
+        )
+        if options["reset"]:
+            reset_summary_cache_stats()
@@ -29,6 +29,10 @@ class EvaluationMeta(models.Model):
     class Meta:
         verbose_name = "Evaluation Meta"
         verbose_name_plural = "Evaluation Meta"
+        indexes = [
+            # Status-gated joins (evaluationmeta__status=ACTIVE) resolve the evaluation ids from the index.
+            models.Index(fields=["status", "evaluation"], name="evaluation_meta_status_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"EvaluationMeta<{self.evaluation_id}:{self.status}>"
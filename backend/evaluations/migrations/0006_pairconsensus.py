@@ -0,0 +1,89 @@
+# Generated by Django 5.1.2 on 2026-10-18 03:20
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, F, FloatField, Sum
+from django.db.models.functions import Cast
+
+
+def backfill_pair_consensus(apps, schema_editor):
+    Evaluation = apps.get_model("evaluations", "Evaluation")
+    PairConsensus = apps.get_model("evaluations", "PairConsensus")
+
+    score = Cast("score", FloatField())
+    rows = (
+        Evaluation.objects.values("subject_id", "criterion_id")
+        .annotate(
+            score_count=Count("id"),
+            score_sum=Sum(score),
+            score_sq_sum=Sum(F("score") * F("score"), output_field=FloatField()),
+        )
+        .order_by()
+    )
+    PairConsensus.objects.bulk_create(
+        (
+            PairConsensus(
+                subject_id=row["subject_id"],
+                criterion_id=row["criterion_id"],
+                score_count=row["score_count"],
+                score_sum=float(row["score_sum"] or 0.0),
+                score_sq_sum=float(row["score_sq_sum"] or 0.0),
+            )
+            for row in rows.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("evaluations", "0005_alter_evaluation_unique_together"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PairConsensus",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("score_count", models.PositiveIntegerField(default=0)),
+                ("score_sum", models.FloatField(default=0.0)),
+                ("score_sq_sum", models.FloatField(default=0.0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "criterion",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pair_consensus",
+                        to="evaluations.criterion",
+                    ),
+                ),
+                (
+                    "subject",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pair_consensus",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Pair Consensus",
+                "verbose_name_plural": "Pair Consensus",
+                "constraints": [
+                    models.UniqueConstraint(fields=("subject", "criterion"), name="uniq_pair_consensus"),
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_pair_consensus, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.1.2 on 2026-10-18 03:22
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("evaluations", "0006_pairconsensus"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DirtyRater",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("rater_id", models.BigIntegerField(unique=True)),
+                (
+                    "marked_at",
+                    models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+                ),
+            ],
+            options={
+                "verbose_name": "Dirty Rater",
+                "verbose_name_plural": "Dirty Raters",
+            },
+        ),
+    ]
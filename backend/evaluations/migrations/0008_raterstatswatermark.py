@@ -0,0 +1,39 @@
+# Generated by Django 5.1.2 on 2026-10-18 03:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("evaluations", "0007_dirtyrater"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RaterStatsWatermark",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(default="default", max_length=64, unique=True),
+                ),
+                ("last_evaluation_id", models.BigIntegerField(default=0)),
+                ("last_created_at", models.DateTimeField(blank=True, null=True)),
+                ("last_meta_updated_at", models.DateTimeField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Rater Stats Watermark",
+                "verbose_name_plural": "Rater Stats Watermarks",
+            },
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.1.2 on 2026-10-18 03:31
+
+import math
+
+from django.db import migrations, models
+from django.db.models import Count, F, FloatField, Q, Sum
+
+MOMENT_FIELDS = ["ratings_count", "mean_score", "m2", "std_score", "extreme_rate"]
+
+
+def backfill_moments(apps, schema_editor):
+    """
+    Derive every rater's moments from all of their evaluations, the population the signal handlers
+    keep current from here on. Rows written by earlier recomputes counted ACTIVE evaluations only
+    (and some raters have no row yet), so m2 cannot be derived from the stored std_score.
+    """
+
+    RaterStats = apps.get_model("evaluations", "RaterStats")
+    Evaluation = apps.get_model("evaluations", "Evaluation")
+
+    moments = {}
+    rows = (
+        Evaluation.objects.values("evaluator_id")
+        .annotate(
+            n=Count("id"),
+            total=Sum("score", output_field=FloatField()),
+            squares=Sum(F("score") * F("score"), output_field=FloatField()),
+            extreme=Count("id", filter=Q(score__lte=1) | Q(score__gte=10)),
+        )
+        .order_by()
+    )
+    for row in rows.iterator():
+        n = row["n"]
+        mean = row["total"] / n
+        m2 = max(0.0, row["squares"] - n * mean * mean)
+        moments[row["evaluator_id"]] = (n, mean, m2, math.sqrt(m2 / n), row["extreme"] / n)
+
+    RaterStats.objects.bulk_create(
+        [RaterStats(user_id=user_id) for user_id in moments], batch_size=1000, ignore_conflicts=True
+    )
+    batch = []
+    for stats in RaterStats.objects.order_by("pk").iterator():
+        for name, value in zip(MOMENT_FIELDS, moments.get(stats.user_id, (0, 0.0, 0.0, 0.0, 0.0))):
+            setattr(stats, name, value)
+        batch.append(stats)
+        if len(batch) >= 500:
+            RaterStats.objects.bulk_update(batch, MOMENT_FIELDS)
+            batch = []
+    if batch:
+        RaterStats.objects.bulk_update(batch, MOMENT_FIELDS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("evaluations", "0008_raterstatswatermark"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="raterstats",
+            name="m2",
+            field=models.FloatField(default=0.0),
+        ),
+        migrations.RunPython(backfill_moments, migrations.RunPython.noop),
+    ]
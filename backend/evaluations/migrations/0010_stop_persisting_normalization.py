@@ -0,0 +1,25 @@
+# Generated by Django 5.1.2 on 2026-10-18 03:32
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("evaluations", "0009_raterstats_m2"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="evaluation",
+            name="normalized_score",
+        ),
+        migrations.RemoveField(
+            model_name="evaluation",
+            name="rater_mean",
+        ),
+        migrations.RemoveField(
+            model_name="evaluation",
+            name="rater_stddev",
+        ),
+    ]
@@ -0,0 +1,122 @@
+# Generated by Django 5.1.2 on 2026-10-18 03:38
+
+import os
+from datetime import timedelta
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Max
+from django.utils import timezone
+
+
+def backfill_pending_tasks(apps, schema_editor):
+    PendingTask = apps.get_model("evaluations", "PendingTask")
+    Evaluation = apps.get_model("evaluations", "Evaluation")
+    Criterion = apps.get_model("evaluations", "Criterion")
+    Friendship = apps.get_model("userprofiles", "Friendship")
+
+    repeat = timedelta(days=int(os.getenv("EVALUATIONS_REPEAT_DAYS", "7")))
+    now = timezone.now()
+
+    friend_pairs = set()
+    for a, b in Friendship.objects.filter(is_confirmed=True).values_list("from_user_id", "to_user_id").iterator():
+        if a != b:
+            friend_pairs.update({(a, b), (b, a)})
+
+    rows = {}
+    last_rated = (
+        Evaluation.objects.values("evaluator_id", "subject_id", "criterion_id")
+        .annotate(last=Max("created_at"))
+        .order_by()
+    )
+    for row in last_rated.iterator():
+        e, s, c = row["evaluator_id"], row["subject_id"], row["criterion_id"]
+        rows[(e, s, c)] = PendingTask(
+            evaluator_id=e,
+            subject_id=s,
+            criterion_id=c,
+            last_rated_at=row["last"],
+            next_due_at=row["last"] + repeat,
+            active=(e, s) in friend_pairs,
+        )
+
+    criteria = list(Criterion.objects.values_list("pk", flat=True))
+    for e, s in friend_pairs:
+        for c in criteria:
+            if (e, s, c) not in rows:
+                rows[(e, s, c)] = PendingTask(
+                    evaluator_id=e, subject_id=s, criterion_id=c, next_due_at=now, active=True
+                )
+
+    PendingTask.objects.bulk_create(rows.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("evaluations", "0010_stop_persisting_normalization"),
+        ("userprofiles", "0007_friendship_is_confirmed"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PendingTask",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("next_due_at", models.DateTimeField()),
+                ("last_rated_at", models.DateTimeField(blank=True, null=True)),
+                ("active", models.BooleanField(default=False)),
+                (
+                    "criterion",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pending_tasks",
+                        to="evaluations.criterion",
+                    ),
+                ),
+                (
+                    "evaluator",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pending_tasks",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "subject",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Pending Task",
+                "verbose_name_plural": "Pending Tasks",
+                "indexes": [
+                    models.Index(
+                        fields=["evaluator", "active", "next_due_at"],
+                        name="pending_task_due_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("evaluator", "subject", "criterion"),
+                        name="uniq_pending_task",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_pending_tasks, migrations.RunPython.noop),
+    ]
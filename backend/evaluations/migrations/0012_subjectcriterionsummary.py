@@ -0,0 +1,111 @@
+# Generated by Django 5.1.2 on 2026-10-18 03:41
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Case, Count, ExpressionWrapper, F, FloatField, Sum, Value, When
+from django.db.models.functions import Coalesce
+
+
+def backfill_subject_summaries(apps, schema_editor):
+    SubjectCriterionSummary = apps.get_model("evaluations", "SubjectCriterionSummary")
+    Evaluation = apps.get_model("evaluations", "Evaluation")
+
+    weight = ExpressionWrapper(
+        Coalesce(F("reliability_weight"), Value(1.0)) * Coalesce(F("extreme_rate_weight"), Value(1.0)),
+        output_field=FloatField(),
+    )
+    normalized = Case(
+        When(
+            evaluator__rater_stats__std_score__gt=0,
+            then=ExpressionWrapper(
+                (F("score") - F("evaluator__rater_stats__mean_score")) / F("evaluator__rater_stats__std_score"),
+                output_field=FloatField(),
+            ),
+        ),
+        default=Value(0.0),
+        output_field=FloatField(),
+    )
+    rows = (
+        Evaluation.objects.filter(evaluationmeta__status="ACTIVE")
+        .values("subject_id", "criterion_id")
+        .annotate(
+            raw_count=Count("id"),
+            weighted_sum=Sum(ExpressionWrapper(F("score") * weight, output_field=FloatField())),
+            normalized_weighted_sum=Sum(ExpressionWrapper(normalized * weight, output_field=FloatField())),
+            weight_sum=Sum(weight),
+        )
+        .order_by()
+    )
+    SubjectCriterionSummary.objects.bulk_create(
+        (
+            SubjectCriterionSummary(
+                subject_id=row["subject_id"],
+                criterion_id=row["criterion_id"],
+                raw_count=row["raw_count"],
+                weighted_sum=float(row["weighted_sum"] or 0.0),
+                normalized_weighted_sum=float(row["normalized_weighted_sum"] or 0.0),
+                weight_sum=float(row["weight_sum"] or 0.0),
+            )
+            for row in rows.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("evaluations", "0011_pendingtask"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SubjectCriterionSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("raw_count", models.PositiveIntegerField(default=0)),
+                ("weighted_sum", models.FloatField(default=0.0)),
+                ("normalized_weighted_sum", models.FloatField(default=0.0)),
+                ("weight_sum", models.FloatField(default=0.0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "criterion",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="subject_summaries",
+                        to="evaluations.criterion",
+                    ),
+                ),
+                (
+                    "subject",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="criterion_summaries",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Subject Criterion Summary",
+                "verbose_name_plural": "Subject Criterion Summaries",
+                "indexes": [models.Index(fields=["raw_count"], name="subject_summary_count_idx")],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("subject", "criterion"),
+                        name="uniq_subject_criterion_summary",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_subject_summaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.1.2 on 2026-10-18 03:47
+
+from django.db import migrations, models
+from django.db.models import FloatField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_score_sums(apps, schema_editor):
+    SubjectCriterionSummary = apps.get_model("evaluations", "SubjectCriterionSummary")
+    Evaluation = apps.get_model("evaluations", "Evaluation")
+
+    score_sum = (
+        Evaluation.objects.filter(
+            subject_id=OuterRef("subject_id"),
+            criterion_id=OuterRef("criterion_id"),
+            evaluationmeta__status="ACTIVE",
+        )
+        .values("subject_id", "criterion_id")
+        .annotate(total=Sum("score", output_field=FloatField()))
+        .values("total")[:1]
+    )
+    SubjectCriterionSummary.objects.update(
+        score_sum=Coalesce(Subquery(score_sum, output_field=FloatField()), Value(0.0))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("evaluations", "0012_subjectcriterionsummary"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="subjectcriterionsummary",
+            name="score_sum",
+            field=models.FloatField(default=0.0),
+        ),
+        migrations.RunPython(backfill_score_sums, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.1.2 on 2026-10-18 03:49
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def copy_meta_status(apps, schema_editor):
+    Evaluation = apps.get_model("evaluations", "Evaluation")
+    Evaluation.objects.filter(evaluationmeta__status="ACTIVE").update(is_active=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("evaluations", "0013_subjectcriterionsummary_score_sum"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="evaluation",
+            name="is_active",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name="evaluation",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["subject", "criterion"],
+                name="evaluation_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="evaluation",
+            index=models.Index(
+                condition=models.Q(("is_active", False)),
+                fields=["subject"],
+                name="evaluation_pending_idx",
+            ),
+        ),
+        migrations.RunPython(copy_meta_status, migrations.RunPython.noop),
+    ]
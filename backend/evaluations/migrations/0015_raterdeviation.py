@@ -0,0 +1,134 @@
+# Generated by Django 5.1.2 on 2026-10-18 03:58
+
+from django.db import migrations, models
+from django.db.models import Count, ExpressionWrapper, F, FloatField, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Abs
+from django.utils import timezone
+
+
+def backfill_rater_deviations(apps, schema_editor):
+    RaterDeviation = apps.get_model("evaluations", "RaterDeviation")
+    RaterPairContribution = apps.get_model("evaluations", "RaterPairContribution")
+    Evaluation = apps.get_model("evaluations", "Evaluation")
+    PairConsensus = apps.get_model("evaluations", "PairConsensus")
+
+    consensus = PairConsensus.objects.filter(
+        subject_id=OuterRef("subject_id"),
+        criterion_id=OuterRef("criterion_id"),
+        score_count__gt=0,
+    ).values(mean=ExpressionWrapper(F("score_sum") / F("score_count"), output_field=FloatField()))[:1]
+    rows = (
+        Evaluation.objects.annotate(consensus=Subquery(consensus, output_field=FloatField()))
+        .filter(consensus__isnull=False)
+        .values("evaluator_id", "subject_id", "criterion_id")
+        .annotate(
+            dev_sum=Sum(Abs(F("score") - F("consensus")), output_field=FloatField()),
+            scored_count=Count("id"),
+            extreme_count=Count("id", filter=Q(score__lte=1) | Q(score__gte=5)),
+        )
+        .order_by()
+    )
+
+    contributions = []
+    totals = {}
+    for row in rows.iterator():
+        dev_sum, scored_count, extreme_count = float(row["dev_sum"] or 0.0), row["scored_count"], row["extreme_count"]
+        contributions.append(
+            RaterPairContribution(
+                rater_id=row["evaluator_id"],
+                subject_id=row["subject_id"],
+                criterion_id=row["criterion_id"],
+                dev_sum=dev_sum,
+                scored_count=scored_count,
+                extreme_count=extreme_count,
+            )
+        )
+        total = totals.get(row["evaluator_id"], (0.0, 0, 0))
+        totals[row["evaluator_id"]] = (total[0] + dev_sum, total[1] + scored_count, total[2] + extreme_count)
+
+    now = timezone.now()
+    RaterPairContribution.objects.bulk_create(contributions, batch_size=1000)
+    RaterDeviation.objects.bulk_create(
+        [
+            RaterDeviation(
+                rater_id=rater_id,
+                dev_sum=dev_sum,
+                scored_count=scored_count,
+                extreme_count=extreme_count,
+                synced_at=now,
+            )
+            for rater_id, (dev_sum, scored_count, extreme_count) in totals.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("evaluations", "0014_evaluation_is_active"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RaterDeviation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("rater_id", models.BigIntegerField(unique=True)),
+                ("dev_sum", models.FloatField(default=0.0)),
+                ("scored_count", models.PositiveIntegerField(default=0)),
+                ("extreme_count", models.PositiveIntegerField(default=0)),
+                ("synced_at", models.DateTimeField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Rater Deviation",
+                "verbose_name_plural": "Rater Deviations",
+            },
+        ),
+        migrations.CreateModel(
+            name="RaterPairContribution",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("rater_id", models.BigIntegerField()),
+                ("subject_id", models.BigIntegerField()),
+                ("criterion_id", models.BigIntegerField()),
+                ("dev_sum", models.FloatField(default=0.0)),
+                ("scored_count", models.PositiveIntegerField(default=0)),
+                ("extreme_count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "Rater Pair Contribution",
+                "verbose_name_plural": "Rater Pair Contributions",
+                "indexes": [
+                    models.Index(
+                        fields=["subject_id", "criterion_id"],
+                        name="rater_pair_contribution_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("rater_id", "subject_id", "criterion_id"),
+                        name="uniq_rater_pair_contribution",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_rater_deviations, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.1.2 on 2026-10-18 04:01
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("evaluations", "0015_raterdeviation"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="evaluation",
+            index=models.Index(
+                fields=["evaluator", "subject", "criterion", "created_at"],
+                name="evaluation_rater_pair_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="evaluation",
+            index=models.Index(
+                fields=["subject", "criterion", "evaluator", "score"],
+                name="evaluation_pair_score_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="evaluation",
+            index=models.Index(fields=["evaluator", "score"], name="evaluation_rater_score_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="evaluationmeta",
+            index=models.Index(fields=["status", "evaluation"], name="evaluation_meta_status_idx"),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.1.2 on 2026-10-18 04:26
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_outbound_counts(apps, schema_editor):
+    RaterStats = apps.get_model("evaluations", "RaterStats")
+    Evaluation = apps.get_model("evaluations", "Evaluation")
+
+    # Raters that predate the signal handlers may have no RaterStats row yet.
+    RaterStats.objects.bulk_create(
+        (
+            RaterStats(user_id=user_id)
+            for user_id in Evaluation.objects.values_list("evaluator_id", flat=True).distinct().iterator()
+        ),
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+    given = (
+        Evaluation.objects.filter(evaluator_id=OuterRef("user_id"))
+        .values("evaluator_id")
+        .annotate(n=Count("id"))
+        .values("n")[:1]
+    )
+    RaterStats.objects.update(outbound_count=Coalesce(Subquery(given), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("evaluations", "0016_evaluation_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="raterstats",
+            name="outbound_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_outbound_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.1.2 on 2026-10-18 04:32
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("evaluations", "0017_raterstats_outbound_count"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DirtyPair",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("subject_id", models.BigIntegerField()),
+                ("criterion_id", models.BigIntegerField()),
+                (
+                    "marked_at",
+                    models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+                ),
+            ],
+            options={
+                "verbose_name": "Dirty Pair",
+                "verbose_name_plural": "Dirty Pairs",
+                "constraints": [models.UniqueConstraint(fields=("subject_id", "criterion_id"), name="uniq_dirty_pair")],
+            },
+        ),
+    ]
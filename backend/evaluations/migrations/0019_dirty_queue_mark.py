@@ -0,0 +1,25 @@
+# Generated by Django 5.1.2 on 2026-10-18 04:47
+
+import uuid
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("evaluations", "0018_dirtypair"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dirtypair",
+            name="mark",
+            field=models.UUIDField(default=uuid.uuid4),
+        ),
+        migrations.AddField(
+            model_name="dirtyrater",
+            name="mark",
+            field=models.UUIDField(default=uuid.uuid4),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.db.models import Case, ExpressionWrapper, F, FloatField, Q, Value, When
 
 User = get_user_model()
 
@@ -11,20 +12,63 @@ class Criterion(models.Model):
         return self.name
 
 
+def normalized_score_expression():
+    """
+    z-score of ``score`` against the evaluator's running RaterStats moments.
+    0.0 when the rater has no spread yet (or no RaterStats row), matching the old persisted default.
+    """
+    mean = F("evaluator__rater_stats__mean_score")
+    std = F("evaluator__rater_stats__std_score")
+    return Case(
+        When(
+            evaluator__rater_stats__std_score__gt=0,
+            then=ExpressionWrapper((F("score") - mean) / std, output_field=FloatField()),
+        ),
+        default=Value(0.0),
+        output_field=FloatField(),
+    )
+
+
+class EvaluationQuerySet(models.QuerySet):
+    def with_normalization(self):
+        """Annotate rater_mean, rater_stddev and normalized_score from a join to RaterStats."""
+        return self.annotate(
+            rater_mean=F("evaluator__rater_stats__mean_score"),
+            rater_stddev=F("evaluator__rater_stats__std_score"),
+            normalized_score=normalized_score_expression(),
+        )
+
+
 class Evaluation(models.Model):
     evaluator = models.ForeignKey(User, related_name="given_evaluations", on_delete=models.CASCADE)
     subject = models.ForeignKey(User, related_name="received_evaluations", on_delete=models.CASCADE)
     criterion = models.ForeignKey(Criterion, on_delete=models.CASCADE)
     score = models.PositiveSmallIntegerField()
     familiarity = models.PositiveSmallIntegerField(null=True, blank=True)
-    normalized_score = models.FloatField(null=True, blank=True)
     pending = models.BooleanField(default=True)
-    rater_mean = models.FloatField(null=True, blank=True)
-    rater_stddev = models.FloatField(null=True, blank=True)
     reliability_weight = models.FloatField(null=True, blank=True)
     extreme_rate_weight = models.FloatField(null=True, blank=True)
     objectivity_score = models.FloatField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Outbound-gating status (see evaluations.activation); EvaluationMeta.status mirrors it.
+    is_active = models.BooleanField(default=False)
+
+    objects = EvaluationQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Summaries aggregate ACTIVE rows per (subject, criterion) without touching pending ones.
+            models.Index(fields=["subject", "criterion"], condition=Q(is_active=True), name="evaluation_active_idx"),
+            # Activating a subject flips only its still-pending rows.
+            models.Index(fields=["subject"], condition=Q(is_active=False), name="evaluation_pending_idx"),
+            # Cooldown / PendingTask re-derivation: Max(created_at) per (evaluator, subject, criterion),
+            # answered from the index alone.
+            models.Index(fields=["evaluator", "subject", "criterion", "created_at"], name="evaluation_rater_pair_idx"),
+            # Consensus and deviation refreshes read every (evaluator, score) of a pair; covering.
+            models.Index(fields=["subject", "criterion", "evaluator", "score"], name="evaluation_pair_score_idx"),
+            # Rater moments / history reads only need the scores of one evaluator; covering.
+            models.Index(fields=["evaluator", "score"], name="evaluation_rater_score_idx"),
+        ]
 
     def __str__(self):
         return f"{self.subject} rated by {self.evaluator} on {self.criterion}"
@@ -32,7 +76,12 @@ class Evaluation(models.Model):
 
 # Codex CLI: ensure additive models register with this app
 try:
+    from .consensus_models import PairConsensus  # noqa: F401
+    from .deviation_models import RaterDeviation, RaterPairContribution  # noqa: F401
     from .meta_models import EvaluationMeta  # noqa: F401
-    from .rater_models import RaterStats  # noqa: F401
+    from .queue_models import DirtyPair, DirtyRater  # noqa: F401
+    from .rater_models import RaterStats, RaterStatsWatermark  # noqa: F401
+    from .summary_models import SubjectCriterionSummary  # noqa: F401
+    from .task_models import PendingTask  # noqa: F401
 except Exception:
     pass
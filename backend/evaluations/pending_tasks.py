@@ -0,0 +1,248 @@
+"""
+Maintenance of the PendingTask due-task queue.
+
+Signal receivers in evaluations.signals call the incremental helpers here; the
+rebuild_pending_tasks command recomputes it from Evaluation, Friendship and Criterion.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, DateTimeField, Max, Q, Value, When
+from django.utils import timezone
+
+from userprofiles.models import Friendship
+
+from .models import Criterion, Evaluation
+from .task_models import PendingTask
+
+TaskKey = Tuple[int, int, int]
+
+
+def repeat_days() -> int:
+    """
+    The cooldown between ratings of the same (subject, criterion), read per call.
+    It is stamped into next_due_at when a row is written: after changing
+    EVALUATIONS_REPEAT_DAYS, run ``manage.py rebuild_pending_tasks`` to re-stamp existing rows.
+    """
+
+    return int(getattr(settings, "EVALUATIONS_REPEAT_DAYS", 7))
+
+
+def _due_after(rated_at: datetime, days: Optional[int] = None) -> datetime:
+    return rated_at + timedelta(days=repeat_days() if days is None else days)
+
+
+def _key_filter(keys: Iterable[TaskKey]) -> Q:
+    query = Q(pk__in=[])
+    for evaluator_id, subject_id, criterion_id in keys:
+        query |= Q(evaluator_id=evaluator_id, subject_id=subject_id, criterion_id=criterion_id)
+    return query
+
+
+def _friend_pairs(user_ids: Set[int]) -> Set[Tuple[int, int]]:
+    """Directed (a, b) pairs of confirmed friends among ``user_ids``, both directions."""
+
+    rows = Friendship.objects.filter(
+        is_confirmed=True,
+        from_user_id__in=user_ids,
+        to_user_id__in=user_ids,
+    ).values_list("from_user_id", "to_user_id")
+    pairs: Set[Tuple[int, int]] = set()
+    for a, b in rows:
+        if a != b:
+            pairs.update({(a, b), (b, a)})
+    return pairs
+
+
+def cooldown_active(evaluator_id: int, subject_id, criterion_id, now: Optional[datetime] = None) -> bool:
+    """True when the (evaluator, subject, criterion) task is not due yet (unique-key lookup)."""
+
+    return PendingTask.objects.filter(
+        evaluator_id=evaluator_id,
+        subject_id=subject_id,
+        criterion_id=criterion_id,
+        next_due_at__gt=now or timezone.now(),
+    ).exists()
+
+
+def cooling_pairs(evaluator_id: int, pairs: Iterable[Tuple[int, int]], now: Optional[datetime] = None):
+    """The (subject, criterion) pairs among ``pairs`` still in cooldown for the evaluator, in one query."""
+
+    keys = [(evaluator_id, subject_id, criterion_id) for subject_id, criterion_id in pairs]
+    if not keys:
+        return set()
+    return set(
+        PendingTask.objects.filter(_key_filter(keys), next_due_at__gt=now or timezone.now()).values_list(
+            "subject_id", "criterion_id"
+        )
+    )
+
+
+def record_evaluations(evaluations: Iterable) -> None:
+    """
+    Push next_due_at forward for every (evaluator, subject, criterion) rated in ``evaluations``.
+    Missing rows are inserted first (active when the pair are confirmed friends), then one CASE
+    UPDATE stamps all keys; a key never moves backwards if an older rating arrives late.
+    """
+
+    latest: Dict[TaskKey, datetime] = {}
+    for evaluation in evaluations:
+        if None in (evaluation.evaluator_id, evaluation.subject_id, evaluation.criterion_id):
+            continue
+        key = (int(evaluation.evaluator_id), int(evaluation.subject_id), int(evaluation.criterion_id))
+        rated_at = evaluation.created_at or timezone.now()
+        if key not in latest or rated_at > latest[key]:
+            latest[key] = rated_at
+    if not latest:
+        return
+
+    def case(values: Dict[TaskKey, datetime]) -> Case:
+        return Case(
+            *[
+                When(evaluator_id=e, subject_id=s, criterion_id=c, then=Value(value))
+                for (e, s, c), value in values.items()
+            ],
+            output_field=DateTimeField(),
+        )
+
+    with transaction.atomic():
+        existing = set(
+            PendingTask.objects.filter(_key_filter(latest)).values_list("evaluator_id", "subject_id", "criterion_id")
+        )
+        missing = [key for key in latest if key not in existing]
+        if missing:
+            friends = _friend_pairs({user_id for e, s, _ in missing for user_id in (e, s)})
+            PendingTask.objects.bulk_create(
+                [
+                    PendingTask(
+                        evaluator_id=e,
+                        subject_id=s,
+                        criterion_id=c,
+                        next_due_at=latest[(e, s, c)],
+                        active=(e, s) in friends,
+                    )
+                    for e, s, c in missing
+                ],
+                ignore_conflicts=True,
+            )
+        PendingTask.objects.filter(_key_filter(latest)).filter(
+            Q(last_rated_at__isnull=True) | Q(last_rated_at__lte=case(latest))
+        ).update(
+            last_rated_at=case(latest),
+            next_due_at=case({key: _due_after(rated_at) for key, rated_at in latest.items()}),
+        )
+
+
+def refresh_after_delete(evaluator_id: int, subject_id: int, criterion_id: int) -> None:
+    """Re-derive one key from its remaining evaluations after a delete (due now if none remain)."""
+
+    last = Evaluation.objects.filter(
+        evaluator_id=evaluator_id,
+        subject_id=subject_id,
+        criterion_id=criterion_id,
+    ).aggregate(last=Max("created_at"))["last"]
+    PendingTask.objects.filter(evaluator_id=evaluator_id, subject_id=subject_id, criterion_id=criterion_id).update(
+        last_rated_at=last,
+        next_due_at=_due_after(last) if last else timezone.now(),
+    )
+
+
+def sync_friendship(user_a: int, user_b: int) -> None:
+    """
+    Align both directions of a user pair with their current friendship state.
+    Confirming inserts a due-now row per criterion (existing rows keep their cooldown);
+    unconfirming or removing only deactivates, so the cooldown survives re-friending.
+    """
+
+    if user_a is None or user_b is None or user_a == user_b:
+        return
+    friends = bool(_friend_pairs({user_a, user_b}))
+    with transaction.atomic():
+        if friends:
+            now = timezone.now()
+            PendingTask.objects.bulk_create(
+                [
+                    PendingTask(evaluator_id=e, subject_id=s, criterion_id=c, next_due_at=now, active=True)
+                    for e, s in ((user_a, user_b), (user_b, user_a))
+                    for c in Criterion.objects.values_list("pk", flat=True)
+                ],
+                ignore_conflicts=True,
+            )
+        PendingTask.objects.filter(
+            Q(evaluator_id=user_a, subject_id=user_b) | Q(evaluator_id=user_b, subject_id=user_a)
+        ).exclude(active=friends).update(active=friends)
+
+
+def add_criterion(criterion_id: int, batch_size: int = 1000) -> None:
+    """Queue a new criterion as due now for every confirmed friendship, in both directions."""
+
+    now = timezone.now()
+    rows = (
+        PendingTask(evaluator_id=e, subject_id=s, criterion_id=criterion_id, next_due_at=now, active=True)
+        for a, b in Friendship.objects.filter(is_confirmed=True).values_list("from_user_id", "to_user_id").iterator()
+        if a != b
+        for e, s in ((a, b), (b, a))
+    )
+    PendingTask.objects.bulk_create(rows, batch_size=batch_size, ignore_conflicts=True)
+
+
+def rebuild_pending_tasks(
+    evaluator_ids: Optional[Iterable[int]] = None,
+    batch_size: int = 1000,
+) -> int:
+    """
+    Recompute PendingTask rows from scratch (for ``evaluator_ids``, or everyone) with the
+    current cooldown. Returns the number of rows written.
+    """
+
+    now = timezone.now()
+    days = repeat_days()
+    only = None if evaluator_ids is None else {int(pk) for pk in evaluator_ids}
+
+    friendships = Friendship.objects.filter(is_confirmed=True)
+    evaluations = Evaluation.objects.all()
+    stale = PendingTask.objects.all()
+    if only is not None:
+        friendships = friendships.filter(Q(from_user_id__in=only) | Q(to_user_id__in=only))
+        evaluations = evaluations.filter(evaluator_id__in=only)
+        stale = stale.filter(evaluator_id__in=only)
+
+    friend_pairs = set()
+    for a, b in friendships.values_list("from_user_id", "to_user_id").iterator():
+        if a != b:
+            friend_pairs.update({(a, b), (b, a)})
+    if only is not None:
+        friend_pairs = {(e, s) for e, s in friend_pairs if e in only}
+
+    rows = {}
+    last_rated = (
+        evaluations.values("evaluator_id", "subject_id", "criterion_id").annotate(last=Max("created_at")).order_by()
+    )
+    for row in last_rated.iterator():
+        e, s, c = row["evaluator_id"], row["subject_id"], row["criterion_id"]
+        rows[(e, s, c)] = PendingTask(
+            evaluator_id=e,
+            subject_id=s,
+            criterion_id=c,
+            last_rated_at=row["last"],
+            next_due_at=_due_after(row["last"], days),
+            active=(e, s) in friend_pairs,
+        )
+
+    criteria = list(Criterion.objects.values_list("pk", flat=True))
+    for e, s in friend_pairs:
+        for c in criteria:
+            if (e, s, c) not in rows:
+                rows[(e, s, c)] = PendingTask(
+                    evaluator_id=e, subject_id=s, criterion_id=c, next_due_at=now, active=True
+                )
+
+    with transaction.atomic():
+        stale.delete()
+        PendingTask.objects.bulk_create(rows.values(), batch_size=batch_size)
+    return len(rows)
@@ -0,0 +1,116 @@
+"""
+Bulk deletion of users together with every evaluation they gave or received.
+
+Deleting a user through the ORM cascades into Evaluation one row at a time, and every row's
+post_delete receivers re-derive consensus, moments, weights, tasks and summaries on their own.
+purge_users() instead deletes the evaluations with explicit DELETE statements, which fire no
+delete signals, then applies the aggregate effect once: one consensus UPDATE for the surviving
+pairs, one moments UPDATE per surviving rater, a single weight refresh and one summary refresh
+for the surviving subjects.
+The purged users' deviation accumulators are dropped, and the surviving raters' contributions
+to the pairs of purged subjects are subtracted by the same weight refresh.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Dict, Iterable, List, NamedTuple, Set, Tuple
+
+from django.contrib.auth import get_user_model
+from django.db import connections, transaction
+from django.db.models import Q
+
+from .deviation_models import RaterDeviation, RaterPairContribution
+from .meta_models import EvaluationMeta
+from .models import Evaluation
+from .signals import _refresh_pair_raters, _remove_many_from_consensus, remove_rater_scores
+from .subject_summaries import refresh_subject_summaries
+from .summary_cache import bump_generations
+
+
+class PurgeReport(NamedTuple):
+    users: int
+    evaluations: int
+    raters: int
+    pairs: int
+    seconds: float
+
+
+def _delete_rows(queryset) -> int:
+    """
+    Delete the rows of ``queryset`` with one DELETE ... WHERE pk IN (<queryset SQL>): no per-row
+    collection and no pre/post_delete signals. Returns the number of rows deleted.
+    """
+
+    connection = connections[queryset.db]
+    meta = queryset.model._meta
+    pk_sql, params = queryset.order_by().values("pk").query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {connection.ops.quote_name(meta.db_table)} "
+            f"WHERE {connection.ops.quote_name(meta.pk.column)} IN ({pk_sql})",
+            params,
+        )
+        return cursor.rowcount
+
+
+def purge_users(user_ids: Iterable[int]) -> PurgeReport:
+    """Delete ``user_ids`` and their evaluations, refreshing what the survivors depend on once."""
+
+    started = time.perf_counter()
+    ids = {int(user_id) for user_id in user_ids}
+    evaluations = Evaluation.objects.filter(Q(evaluator_id__in=ids) | Q(subject_id__in=ids))
+    User = get_user_model()
+
+    deltas: Dict[Tuple[int, int], Tuple[int, float, float]] = {}
+    vanished: Set[Tuple[int, int]] = set()
+    removed_scores: Dict[int, List[float]] = {}
+    deleted = 0
+    with transaction.atomic():
+        # The deltas must describe exactly the rows deleted below. Locking the users blocks new
+        # evaluations referencing them (their foreign-key check waits on the lock), and locking the
+        # evaluations blocks score updates until the DELETE commits.
+        list(User.objects.select_for_update().filter(pk__in=ids).order_by("pk").values_list("pk", flat=True))
+        rows = (
+            evaluations.select_for_update()
+            .order_by("pk")
+            .values_list("evaluator_id", "subject_id", "criterion_id", "score")
+        )
+        for evaluator_id, subject_id, criterion_id, score in rows.iterator():
+            deleted += 1
+            score = float(score)
+            if subject_id not in ids:
+                count, total, squares = deltas.get((subject_id, criterion_id), (0, 0.0, 0.0))
+                deltas[(subject_id, criterion_id)] = (count + 1, total + score, squares + score * score)
+            else:
+                vanished.add((subject_id, criterion_id))
+            if evaluator_id not in ids:
+                removed_scores.setdefault(evaluator_id, []).append(score)
+
+        _delete_rows(
+            EvaluationMeta.objects.filter(Q(evaluation__evaluator_id__in=ids) | Q(evaluation__subject_id__in=ids))
+        )
+        _delete_rows(evaluations)
+
+        _remove_many_from_consensus(deltas)
+        for rater_id, scores in removed_scores.items():
+            remove_rater_scores(rater_id, scores)
+        RaterPairContribution.objects.filter(rater_id__in=ids).delete()
+        RaterDeviation.objects.filter(rater_id__in=ids).delete()
+
+        # Nothing references the users' evaluations any more, so this cascade is evaluation-free.
+        _, per_model = User.objects.filter(pk__in=ids).delete()
+
+    # Weights of the surviving raters (and every rater of the pairs that lost ratings), once.
+    _refresh_pair_raters([*deltas, *vanished], removed_scores)
+    refresh_subject_summaries({subject_id for subject_id, _ in deltas})
+    # No post_delete fired for the purged rows, so invalidate every touched subject's summaries here.
+    bump_generations({subject_id for subject_id, _ in [*deltas, *vanished]})
+
+    return PurgeReport(
+        users=per_model.get(User._meta.label, 0),
+        evaluations=deleted,
+        raters=len(removed_scores),
+        pairs=len(deltas),
+        seconds=time.perf_counter() - started,
+    )
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import uuid
+
+from django.db import models
+from django.utils import timezone
+
+
+class DirtyRater(models.Model):
+    """
+    A rater whose reliability/extreme-rate weights need recomputing.
+    Signal handlers only insert rows here; the process_dirty_raters worker drains them.
+    One row per rater, so repeated marks before a drain coalesce into a single recompute.
+    Every mark stamps a fresh ``mark`` token; a drain deletes only the rows whose token is still
+    the one it claimed, so a mark landing mid-drain keeps its row for the next batch.
+
+    rater_id is deliberately not a foreign key: post_delete handlers mark raters while a
+    user is being cascade-deleted, and a queued id for a vanished user is simply a no-op.
+    """
+
+    rater_id = models.BigIntegerField(unique=True)
+    marked_at = models.DateTimeField(default=timezone.now, db_index=True)
+    mark = models.UUIDField(default=uuid.uuid4)
+
+    class Meta:
+        verbose_name = "Dirty Rater"
+        verbose_name_plural = "Dirty Raters"
+
+    def __str__(self) -> str:
+        return f"DirtyRater<{self.rater_id}>"
+
+
+class DirtyPair(models.Model):
+    """
+    A (subject, criterion) pair whose consensus moved since its raters' deviation contributions
+    were last derived. Outside sync mode signal handlers only insert rows here; the
+    process_dirty_raters worker applies the deviation deltas and queues the affected raters.
+    Ids are plain integers and marks are stamped for the same reasons as DirtyRater.
+    """
+
+    subject_id = models.BigIntegerField()
+    criterion_id = models.BigIntegerField()
+    marked_at = models.DateTimeField(default=timezone.now, db_index=True)
+    mark = models.UUIDField(default=uuid.uuid4)
+
+    class Meta:
+        verbose_name = "Dirty Pair"
+        verbose_name_plural = "Dirty Pairs"
+        constraints = [
+            models.UniqueConstraint(fields=["subject_id", "criterion_id"], name="uniq_dirty_pair"),
+        ]
+
+    def __str__(self) -> str:
+        return f"DirtyPair<{self.subject_id}:{self.criterion_id}>"
@@ -13,8 +13,13 @@ class RaterStats(models.Model):
     ratings_count = models.PositiveIntegerField(default=0)
     mean_score = models.FloatField(default=0.0)
     std_score = models.FloatField(default=0.0)
+    # Sum of squared deviations from mean_score (Welford's M2); std_score == sqrt(m2 / ratings_count).
+    m2 = models.FloatField(default=0.0)
     extreme_rate = models.FloatField(default=0.0)
     reliability = models.FloatField(default=0.0)
+    # Evaluations given by the user, for the outbound gate (evaluations.activation). Only the signal
+    # handlers maintain it; recompute_rater_stats rewrites the moments above but never this counter.
+    outbound_count = models.PositiveIntegerField(default=0)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
@@ -23,3 +28,23 @@ class RaterStats(models.Model):
 
     def __str__(self) -> str:
         return f"RaterStats<{self.user_id}>"
+
+
+class RaterStatsWatermark(models.Model):
+    """
+    High-water marks of the last recompute_rater_stats run.
+    ``recompute_rater_stats --since`` only revisits pairs touched after these marks.
+    """
+
+    name = models.CharField(max_length=64, unique=True, default="default")
+    last_evaluation_id = models.BigIntegerField(default=0)
+    last_created_at = models.DateTimeField(null=True, blank=True)
+    last_meta_updated_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Rater Stats Watermark"
+        verbose_name_plural = "Rater Stats Watermarks"
+
+    def __str__(self) -> str:
+        return f"RaterStatsWatermark<{self.name}:{self.last_evaluation_id}>"
@@ -0,0 +1,586 @@
+"""
+Computation engines behind the ``recompute_rater_stats`` management command.
+
+Every engine takes the evaluations queryset to aggregate plus the resolved Evaluation
+field names, and returns one RaterStatsRow per rater. ``upsert_rater_stats`` writes them.
+"""
+
+from __future__ import annotations
+
+import math
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import chain
+from statistics import mean, pstdev
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from django.db import connections, transaction
+from django.db.models import Avg, F, FloatField, Max, Q, Value, Window
+from django.db.models.functions import Mod
+
+# Scores at or beyond these bounds (of the 1-10 rating scale) count towards a rater's extreme rate.
+EXTREME_LOW = 1.0
+EXTREME_HIGH = 10.0
+# The extreme-rate weight (evaluations.deviations) keeps its own, tighter upper bound.
+WEIGHT_EXTREME_HIGH = 5.0
+
+RATER_STATS_FIELDS = ["ratings_count", "mean_score", "std_score", "extreme_rate", "reliability"]
+
+
+def is_extreme(score: float, high: float = EXTREME_HIGH) -> bool:
+    """
+    Whether a score counts towards the extreme rate; shared by the live and recompute paths.
+    The deviation accumulators behind the weights pass ``high=WEIGHT_EXTREME_HIGH``.
+    """
+
+    return score <= EXTREME_LOW or score >= high
+
+
+class EvaluationFields(NamedTuple):
+    rater: str
+    subject: str
+    criterion: str
+    score: str
+
+
+class StreamReport(NamedTuple):
+    rows: int
+    raters: int
+    seconds: float
+
+
+class ShardReport(NamedTuple):
+    shard: int
+    rows: int
+    raters: int
+    seconds: float
+
+
+class HighWater(NamedTuple):
+    evaluation_id: int
+    created_at: Optional[datetime]
+    meta_updated_at: Optional[datetime]
+
+
+class RaterStatsRow(NamedTuple):
+    user_id: int
+    ratings_count: int
+    mean_score: float
+    std_score: float
+    extreme_rate: float
+    reliability: float
+
+
+def reliability_from_mad(mad: float) -> float:
+    """Map mean absolute deviation from consensus to reliability in [0.5, 1.0]."""
+
+    rel = 1.0 / (1.0 + (mad / 3.0))
+    return max(0.5, min(1.0, rel))
+
+
+def compute_python(qs, fields: EvaluationFields, rater_ids: Optional[Iterable[int]] = None) -> List[RaterStatsRow]:
+    """
+    Reference engine: dict-of-lists aggregation in pure Python.
+    With ``rater_ids`` only those raters are computed, against the full consensus of the pairs they rated.
+    """
+
+    subject_key = f"{fields.subject}_id"
+    criterion_key = f"{fields.criterion}_id"
+    rater_key = f"{fields.rater}_id"
+
+    rows_qs = qs
+    consensus_qs = qs
+    if rater_ids is not None:
+        rows_qs = qs.filter(**{f"{rater_key}__in": list(rater_ids)})
+        consensus_qs = qs.filter(
+            **{
+                f"{subject_key}__in": rows_qs.values(subject_key),
+                f"{criterion_key}__in": rows_qs.values(criterion_key),
+            }
+        )
+
+    # Consensus avg per (subject, criterion)
+    agg = consensus_qs.values(subject_key, criterion_key).annotate(avg=Avg(fields.score)).order_by()
+    consensus: Dict[Tuple[int, int], float] = {
+        (int(row[subject_key]), int(row[criterion_key])): float(row["avg"]) for row in agg
+    }
+
+    # Collect per-rater deviations and stats
+    by_rater: Dict[int, List[float]] = defaultdict(list)
+    raw_scores: Dict[int, List[float]] = defaultdict(list)
+    extreme_cnt: Dict[int, int] = defaultdict(int)
+
+    for ev in rows_qs.values(rater_key, subject_key, criterion_key, fields.score):
+        uid_val = ev.get(rater_key)
+        if uid_val is None:
+            continue
+        uid = int(uid_val)
+
+        s = float(ev[fields.score])
+        avg = consensus.get((int(ev[subject_key]), int(ev[criterion_key])))
+        if avg is None:
+            continue
+
+        by_rater[uid].append(abs(s - avg))
+        raw_scores[uid].append(s)
+        if is_extreme(s):
+            extreme_cnt[uid] += 1
+
+    rows: List[RaterStatsRow] = []
+    for uid, diffs in by_rater.items():
+        scores = raw_scores.get(uid, [])
+        if not scores:
+            continue
+
+        cnt = len(scores)
+        rows.append(
+            RaterStatsRow(
+                user_id=uid,
+                ratings_count=cnt,
+                mean_score=mean(scores),
+                std_score=pstdev(scores) if cnt > 1 else 0.0,
+                extreme_rate=extreme_cnt.get(uid, 0) / float(cnt),
+                reliability=reliability_from_mad(mean(diffs) if diffs else 0.0),
+            )
+        )
+    return rows
+
+
+def load_columns(qs, fields: EvaluationFields, chunk_size: int = 50_000):
+    """
+    Stream (rater, subject, criterion, score) into NumPy arrays without materialising row tuples.
+    Returns int64 rater/subject/criterion arrays and a float64 score array.
+    """
+
+    import numpy as np
+
+    values = qs.exclude(**{f"{fields.rater}_id__isnull": True}).values_list(
+        f"{fields.rater}_id",
+        f"{fields.subject}_id",
+        f"{fields.criterion}_id",
+        fields.score,
+    )
+    flat = np.fromiter(chain.from_iterable(values.iterator(chunk_size=chunk_size)), dtype=np.float64)
+    table = flat.reshape(-1, 4)
+    return (
+        table[:, 0].astype(np.int64),
+        table[:, 1].astype(np.int64),
+        table[:, 2].astype(np.int64),
+        table[:, 3],
+    )
+
+
+def pair_consensus_arrays(subjects, criteria, scores):
+    """
+    Group rows by (subject, criterion) and return (pair_keys, pair_means, row_to_pair).
+    pair_keys are sorted int64 codes from encode_pairs, so they can be searched with np.searchsorted.
+    """
+
+    import numpy as np
+
+    keys = encode_pairs(subjects, criteria)
+    pair_keys, row_to_pair = np.unique(keys, return_inverse=True)
+    pair_counts = np.bincount(row_to_pair, minlength=pair_keys.size)
+    pair_sums = np.bincount(row_to_pair, weights=scores, minlength=pair_keys.size)
+    return pair_keys, pair_sums / pair_counts, row_to_pair
+
+
+def encode_pairs(subjects, criteria):
+    """Pack (subject_id, criterion_id) into one int64 so pairs group with a 1-D np.unique."""
+
+    import numpy as np
+
+    return (subjects.astype(np.int64) << 32) | criteria.astype(np.int64)
+
+
+def rater_stats_from_arrays(raters, scores, deviations) -> List[RaterStatsRow]:
+    """Vectorised per-rater count/mean/std/extreme rate/MAD reliability."""
+
+    import numpy as np
+
+    if raters.size == 0:
+        return []
+
+    rater_ids, row_to_rater = np.unique(raters, return_inverse=True)
+    n = rater_ids.size
+    counts = np.bincount(row_to_rater, minlength=n).astype(np.float64)
+    means = np.bincount(row_to_rater, weights=scores, minlength=n) / counts
+
+    # Two-pass variance matches statistics.pstdev without sum-of-squares cancellation.
+    centered = scores - means[row_to_rater]
+    stds = np.sqrt(np.bincount(row_to_rater, weights=centered * centered, minlength=n) / counts)
+    stds[counts <= 1] = 0.0
+
+    extreme = ((scores <= EXTREME_LOW) | (scores >= EXTREME_HIGH)).astype(np.float64)
+    extreme_rates = np.bincount(row_to_rater, weights=extreme, minlength=n) / counts
+
+    mads = np.bincount(row_to_rater, weights=deviations, minlength=n) / counts
+    reliabilities = np.clip(1.0 / (1.0 + mads / 3.0), 0.5, 1.0)
+
+    return [
+        RaterStatsRow(int(uid), int(cnt), float(mu), float(sd), float(er), float(rel))
+        for uid, cnt, mu, sd, er, rel in zip(
+            rater_ids.tolist(),
+            counts.tolist(),
+            means.tolist(),
+            stds.tolist(),
+            extreme_rates.tolist(),
+            reliabilities.tolist(),
+        )
+    ]
+
+
+def compute_numpy(qs, fields: EvaluationFields) -> List[RaterStatsRow]:
+    """Vectorised engine: load four columns once, group with np.unique/np.bincount."""
+
+    import numpy as np
+
+    raters, subjects, criteria, scores = load_columns(qs, fields)
+    if raters.size == 0:
+        return []
+
+    _, pair_means, row_to_pair = pair_consensus_arrays(subjects, criteria, scores)
+    deviations = np.abs(scores - pair_means[row_to_pair])
+    return rater_stats_from_arrays(raters, scores, deviations)
+
+
+def upsert_rater_stats(RaterStats, rows: Iterable[RaterStatsRow], batch_size: int = 1000) -> int:
+    """Insert or update RaterStats for ``rows`` with batched INSERT ... ON CONFLICT statements."""
+
+    # m2 is kept consistent with std_score so the live Welford updates continue from these values.
+    objs = [RaterStats(**row._asdict(), m2=row.std_score * row.std_score * row.ratings_count) for row in rows]
+    if not objs:
+        return 0
+    RaterStats.objects.bulk_create(
+        objs,
+        batch_size=batch_size,
+        update_conflicts=True,
+        unique_fields=["user"],
+        update_fields=[*RATER_STATS_FIELDS, "m2", "updated_at"],
+    )
+    return len(objs)
+
+
+class _RaterAccumulator:
+    """Running count/mean/M2 (Welford), extreme count and deviation sum for one rater."""
+
+    __slots__ = ("user_id", "count", "mean", "m2", "extreme", "deviation_sum")
+
+    def __init__(self, user_id: int) -> None:
+        self.user_id = user_id
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.extreme = 0
+        self.deviation_sum = 0.0
+
+    def add(self, score: float, consensus: float) -> None:
+        self.count += 1
+        delta = score - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (score - self.mean)
+        if is_extreme(score):
+            self.extreme += 1
+        self.deviation_sum += abs(score - consensus)
+
+    def row(self) -> RaterStatsRow:
+        return RaterStatsRow(
+            user_id=self.user_id,
+            ratings_count=self.count,
+            mean_score=self.mean,
+            std_score=math.sqrt(self.m2 / self.count) if self.count > 1 else 0.0,
+            extreme_rate=self.extreme / float(self.count),
+            reliability=reliability_from_mad(self.deviation_sum / self.count),
+        )
+
+
+def stream_rater_stats(
+    qs,
+    fields: EvaluationFields,
+    RaterStats,
+    chunk_size: int = 5000,
+    batch_size: int = 1000,
+    progress: Optional[Callable[[StreamReport], None]] = None,
+) -> StreamReport:
+    """
+    Bounded-memory engine: stream rows ordered by rater and keep only one rater's accumulators.
+
+    The pair consensus is a window AVG evaluated by the database, rows arrive through
+    ``.iterator(chunk_size=...)`` (a server-side cursor on PostgreSQL), and RaterStats are
+    upserted and committed every ``batch_size`` raters. ``progress`` is called after each flush.
+    Pass ``RaterStats=None`` to compute without writing.
+    """
+
+    rater_key = f"{fields.rater}_id"
+    consensus = Window(
+        Avg(fields.score, output_field=FloatField()),
+        partition_by=[F(f"{fields.subject}_id"), F(f"{fields.criterion}_id")],
+    )
+    rows = (
+        qs.exclude(**{f"{rater_key}__isnull": True})
+        .annotate(consensus=consensus)
+        .values_list(rater_key, fields.score, "consensus")
+        .order_by(rater_key)
+    )
+
+    started = time.monotonic()
+    seen_rows = 0
+    written = 0
+    pending: List[RaterStatsRow] = []
+    current: Optional[_RaterAccumulator] = None
+
+    def flush() -> None:
+        nonlocal written
+        if not pending:
+            return
+        if RaterStats is not None:
+            with transaction.atomic():
+                upsert_rater_stats(RaterStats, pending, batch_size=batch_size)
+        written += len(pending)
+        pending.clear()
+        if progress is not None:
+            progress(StreamReport(seen_rows, written, time.monotonic() - started))
+
+    for rater_id, score, pair_avg in rows.iterator(chunk_size=chunk_size):
+        seen_rows += 1
+        if current is None or current.user_id != rater_id:
+            if current is not None:
+                pending.append(current.row())
+                if len(pending) >= batch_size:
+                    flush()
+            current = _RaterAccumulator(int(rater_id))
+        current.add(float(score), float(pair_avg))
+
+    if current is not None:
+        pending.append(current.row())
+    flush()
+
+    return StreamReport(seen_rows, written, time.monotonic() - started)
+
+
+def write_consensus_arrays(qs, fields: EvaluationFields, directory: str) -> Optional[Tuple[str, str]]:
+    """
+    Aggregate pair consensus once in the database and save it as sorted .npy arrays.
+    Returns the (keys, means) paths, or None when there are no pairs; workers open the files with
+    mmap_mode="r" so the pages are shared.
+    """
+
+    import numpy as np
+
+    subject_key = f"{fields.subject}_id"
+    criterion_key = f"{fields.criterion}_id"
+    agg = (
+        qs.values(subject_key, criterion_key)
+        .annotate(avg=Avg(fields.score, output_field=FloatField()))
+        .values_list(subject_key, criterion_key, "avg")
+        .order_by()
+    )
+    table = np.fromiter(chain.from_iterable(agg.iterator()), dtype=np.float64).reshape(-1, 3)
+    if not table.size:
+        return None
+    keys = encode_pairs(table[:, 0].astype(np.int64), table[:, 1].astype(np.int64))
+    order = np.argsort(keys)
+
+    keys_path = os.path.join(directory, "pair_keys.npy")
+    means_path = os.path.join(directory, "pair_means.npy")
+    np.save(keys_path, keys[order])
+    np.save(means_path, table[:, 2][order])
+    return keys_path, means_path
+
+
+def _init_shard_worker() -> None:
+    import django
+    from django.apps import apps
+
+    if not apps.ready:  # spawn start method: fresh interpreter
+        django.setup()
+
+
+def compute_shard(
+    query,
+    fields: EvaluationFields,
+    shard: int,
+    workers: int,
+    consensus_paths: Tuple[str, str],
+    write: bool = True,
+    batch_size: int = 1000,
+) -> ShardReport:
+    """
+    Compute and upsert RaterStats for raters with ``rater_id % workers == shard``.
+
+    ``query`` is the pickled-safe ``QuerySet.query`` of the evaluations to aggregate. Consensus comes
+    from the shared memory-mapped arrays; rows whose pair is missing from the snapshot (written after
+    it was taken) are skipped until the next run.
+    """
+
+    from django.apps import apps
+
+    import numpy as np
+
+    started = time.monotonic()
+    Evaluation = apps.get_model("evaluations", "Evaluation")
+    qs = Evaluation.objects.all()
+    qs.query = query
+
+    rater_key = f"{fields.rater}_id"
+    shard_qs = qs.annotate(_shard=Mod(F(rater_key), Value(workers))).filter(_shard=shard)
+    raters, subjects, criteria, scores = load_columns(shard_qs, fields)
+
+    pair_keys = np.load(consensus_paths[0], mmap_mode="r")
+    pair_means = np.load(consensus_paths[1], mmap_mode="r")
+    keys = encode_pairs(subjects, criteria)
+    idx = np.minimum(np.searchsorted(pair_keys, keys), pair_keys.size - 1)
+    known = pair_keys[idx] == keys
+    raters, scores, idx = raters[known], scores[known], idx[known]
+
+    rows = rater_stats_from_arrays(raters, scores, np.abs(scores - pair_means[idx]))
+    if write and rows:
+        RaterStats = apps.get_model("evaluations", "RaterStats")
+        with transaction.atomic():
+            upsert_rater_stats(RaterStats, rows, batch_size=batch_size)
+
+    return ShardReport(shard, int(scores.size), len(rows), time.monotonic() - started)
+
+
+def compute_sharded(
+    qs,
+    fields: EvaluationFields,
+    workers: int,
+    write: bool = True,
+    batch_size: int = 1000,
+    processes: bool = True,
+) -> List[ShardReport]:
+    """
+    Split raters by ``rater_id % workers`` across a process pool; each worker opens its own DB
+    connection, computes its shard and upserts its RaterStats. Pair consensus is computed once
+    here and shared read-only through memory-mapped .npy files. ``processes=False`` runs the
+    shards sequentially in this process (used where the database is not shareable, e.g. tests).
+    """
+
+    workers = max(1, int(workers))
+    with tempfile.TemporaryDirectory(prefix="rater_stats_") as directory:
+        consensus_paths = write_consensus_arrays(qs, fields, directory)
+        if consensus_paths is None:
+            return [ShardReport(shard, 0, 0, 0.0) for shard in range(workers)]
+        tasks = [(qs.query, fields, shard, workers, consensus_paths, write, batch_size) for shard in range(workers)]
+
+        if not processes:
+            return [compute_shard(*task) for task in tasks]
+
+        # Children must not share the parent's DB connection; each opens its own on first query.
+        connections.close_all()
+        method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context(method),
+            initializer=_init_shard_worker,
+        ) as pool:
+            futures = [pool.submit(compute_shard, *task) for task in tasks]
+            return [future.result() for future in futures]
+
+
+def capture_high_water(Evaluation, EvaluationMeta=None) -> HighWater:
+    """Read the current maxima that the next --since run will start after."""
+
+    agg = Evaluation.objects.aggregate(last_id=Max("pk"), last_created=Max("created_at"))
+    meta_updated = None
+    if EvaluationMeta is not None:
+        meta_updated = EvaluationMeta.objects.aggregate(last=Max("updated_at"))["last"]
+    return HighWater(int(agg["last_id"] or 0), agg["last_created"], meta_updated)
+
+
+def touched_rater_ids(Evaluation, qs, fields: EvaluationFields, watermark, has_meta: bool = True) -> Set[int]:
+    """
+    Raters whose stats may have changed since ``watermark``: the raters of every (subject, criterion)
+    pair that gained an evaluation or had its EvaluationMeta updated, plus the raters of those rows.
+    Deleted evaluations leave no trace here; a periodic --full run covers them.
+    """
+
+    rater_key = f"{fields.rater}_id"
+    subject_key = f"{fields.subject}_id"
+    criterion_key = f"{fields.criterion}_id"
+
+    changed = Q(pk__gt=watermark.last_evaluation_id)
+    if watermark.last_created_at is not None:
+        changed |= Q(created_at__gt=watermark.last_created_at)
+    if has_meta and watermark.last_meta_updated_at is not None:
+        changed |= Q(evaluationmeta__updated_at__gt=watermark.last_meta_updated_at)
+
+    raters: Set[int] = set()
+    pairs: Set[Tuple[int, int]] = set()
+    for rater_id, subject_id, criterion_id in (
+        Evaluation.objects.filter(changed).values_list(rater_key, subject_key, criterion_key).distinct()
+    ):
+        if rater_id is not None:
+            raters.add(int(rater_id))
+        pairs.add((int(subject_id), int(criterion_id)))
+
+    if not pairs:
+        return raters
+
+    pair_raters = (
+        qs.filter(
+            **{
+                f"{subject_key}__in": {subject_id for subject_id, _ in pairs},
+                f"{criterion_key}__in": {criterion_id for _, criterion_id in pairs},
+            }
+        )
+        .values_list(rater_key, subject_key, criterion_key)
+        .distinct()
+    )
+    for rater_id, subject_id, criterion_id in pair_raters:
+        if rater_id is not None and (subject_id, criterion_id) in pairs:
+            raters.add(int(rater_id))
+    return raters
+
+
+def compute_for_raters(
+    qs, fields: EvaluationFields, rater_ids: Iterable[int], chunk: int = 1000
+) -> List[RaterStatsRow]:
+    """Recompute a subset of raters from scratch, ``chunk`` raters per round of queries."""
+
+    ids = sorted(set(rater_ids))
+    rows: List[RaterStatsRow] = []
+    for start in range(0, len(ids), chunk):
+        rows.extend(compute_python(qs, fields, rater_ids=ids[start : start + chunk]))
+    return rows
+
+
+def verify_sample(
+    qs, fields: EvaluationFields, RaterStats, sample_size: int, tolerance: float = 1e-6
+) -> Tuple[int, List[int]]:
+    """
+    Recompute a random sample of stored raters from scratch and compare with RaterStats.
+    Returns (checked, mismatched_user_ids).
+    """
+
+    stored_ids = list(RaterStats.objects.values_list("user_id", flat=True))
+    sample = random.sample(stored_ids, min(sample_size, len(stored_ids)))
+    if not sample:
+        return 0, []
+
+    fresh = {row.user_id: row for row in compute_for_raters(qs, fields, sample)}
+    stored = {
+        row["user_id"]: row
+        for row in RaterStats.objects.filter(user_id__in=sample).values("user_id", *RATER_STATS_FIELDS)
+    }
+
+    mismatched: List[int] = []
+    for user_id in sample:
+        expected = fresh.get(user_id)
+        actual = stored.get(user_id)
+        if expected is None or actual is None:
+            if expected is not None or (actual is not None and actual["ratings_count"]):
+                mismatched.append(user_id)
+            continue
+        if expected.ratings_count != actual["ratings_count"] or any(
+            abs(getattr(expected, name) - actual[name]) > tolerance for name in RATER_STATS_FIELDS[1:]
+        ):
+            mismatched.append(user_id)
+    return len(sample), mismatched
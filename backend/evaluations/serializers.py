@@ -30,6 +30,11 @@ class EvaluationSerializer(serializers.ModelSerializer):
         write_only=True,
     )
 
+    # Derived from the evaluator's RaterStats via Evaluation.objects.with_normalization()
+    rater_mean = serializers.FloatField(read_only=True, allow_null=True)
+    rater_stddev = serializers.FloatField(read_only=True, allow_null=True)
+    normalized_score = serializers.FloatField(read_only=True, allow_null=True)
+
     class Meta:
         model = Evaluation
         fields = [
@@ -1,12 +1,41 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, Tuple
-
-from django.db.models import Avg, Q
-from django.db.models.signals import post_delete, post_save
+import threading
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    FloatField,
+    IntegerField,
+    Min,
+    Q,
+    Value,
+    When,
+)
+from django.db.models.functions import Greatest, Sqrt
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import Signal, receiver
-
-from .models import Evaluation
+from django.utils import timezone
+
+from userprofiles.models import Friendship
+
+from .consensus_models import PairConsensus
+from .deviation_models import RaterDeviation
+from .deviations import apply_pair_deviations, deviation_totals, resync_rater_deviations
+from .meta_models import EvaluationMeta
+from .models import Criterion, Evaluation
+from .pending_tasks import add_criterion, record_evaluations, refresh_after_delete, sync_friendship
+from .queue_models import DirtyPair, DirtyRater
+from .rater_models import RaterStats
+from .rater_stats import is_extreme
+from .subject_summaries import refresh_subject_summaries, refresh_summaries_for_raters
+from .summary_cache import bump_generations
 
 Pair = Tuple[int, int]
 
@@ -14,105 +43,615 @@ Pair = Tuple[int, int]
 evaluation_submitted = Signal()
 
 
-def _build_consensus_map(pairs: Iterable[Pair]) -> Dict[Pair, float]:
-    """Return a mapping of (subject_id, criterion_id) -> average score."""
+def _bump_pair_consensus(pair: Pair, count_delta: int, sum_delta: float, sq_delta: float) -> None:
+    """Atomically apply a delta to the running aggregate of one (subject, criterion) pair."""
+
+    subject_id, criterion_id = pair
+    if not (count_delta or sum_delta or sq_delta):
+        return
+
+    def _apply() -> int:
+        return PairConsensus.objects.filter(subject_id=subject_id, criterion_id=criterion_id).update(
+            score_count=F("score_count") + count_delta,
+            score_sum=F("score_sum") + sum_delta,
+            score_sq_sum=F("score_sq_sum") + sq_delta,
+            updated_at=timezone.now(),
+        )
+
+    with transaction.atomic():
+        if _apply() or count_delta <= 0:
+            # Removals never create rows: a missing row means the pair (or its subject) is already gone.
+            return
+        PairConsensus.objects.bulk_create(
+            [PairConsensus(subject_id=subject_id, criterion_id=criterion_id)],
+            ignore_conflicts=True,
+        )
+        _apply()
+
+
+def _add_to_consensus(pair: Pair, score: float) -> None:
+    _bump_pair_consensus(pair, 1, score, score * score)
 
-    query = Q()
+
+def _remove_from_consensus(pair: Pair, score: float) -> None:
+    _bump_pair_consensus(pair, -1, -score, -(score * score))
+
+
+def _pair_filter(pairs: Iterable[Pair]) -> Q:
+    query = Q(pk__in=[])
     for subject_id, criterion_id in pairs:
-        if subject_id is None or criterion_id is None:  # pragma: no cover - defensive
-            continue
         query |= Q(subject_id=subject_id, criterion_id=criterion_id)
+    return query
+
+
+def _update_consensus_deltas(deltas: Dict[Pair, Tuple[int, float, float]]) -> None:
+    def case(index: int, output_field):
+        return Case(
+            *[
+                When(subject_id=subject_id, criterion_id=criterion_id, then=Value(delta[index]))
+                for (subject_id, criterion_id), delta in deltas.items()
+            ],
+            default=Value(0),
+            output_field=output_field,
+        )
+
+    PairConsensus.objects.filter(_pair_filter(deltas)).update(
+        score_count=F("score_count") + case(0, IntegerField()),
+        score_sum=F("score_sum") + case(1, FloatField()),
+        score_sq_sum=F("score_sq_sum") + case(2, FloatField()),
+        updated_at=timezone.now(),
+    )
 
-    if not query:
-        return {}
 
-    rows = Evaluation.objects.filter(query).values("subject_id", "criterion_id").annotate(avg=Avg("score"))
+def _add_many_to_consensus(deltas: Dict[Pair, Tuple[int, float, float]]) -> None:
+    """
+    Add per-pair (count, sum, sum of squares) deltas for many pairs with one insert and one UPDATE.
+    Used for bulk-created rows, so every delta is an addition.
+    """
 
-    return {(int(row["subject_id"]), int(row["criterion_id"])): float(row["avg"]) for row in rows}
+    if not deltas:
+        return
+    with transaction.atomic():
+        PairConsensus.objects.bulk_create(
+            [PairConsensus(subject_id=subject_id, criterion_id=criterion_id) for subject_id, criterion_id in deltas],
+            ignore_conflicts=True,
+        )
+        _update_consensus_deltas(deltas)
 
 
-def _compute_weights_for_rater(rater_id: int) -> None:
-    """Recompute reliability/extreme-rate weights for every evaluation by a rater."""
+def _remove_many_from_consensus(deltas: Dict[Pair, Tuple[int, float, float]]) -> None:
+    """Subtract per-pair deltas of bulk-deleted rows with one UPDATE (removals never create rows)."""
+
+    if deltas:
+        _update_consensus_deltas({pair: tuple(-value for value in delta) for pair, delta in deltas.items()})
 
-    rater_evaluations = list(Evaluation.objects.filter(evaluator_id=rater_id))
-    if not rater_evaluations:
+
+def _upsert_rater_stats_update(rater_id: int, create: bool, **updates) -> None:
+    """Apply an F-expression UPDATE to a rater's RaterStats row, creating an empty row first if needed."""
+
+    with transaction.atomic():
+        if RaterStats.objects.filter(user_id=rater_id).update(**updates, updated_at=timezone.now()) or not create:
+            return
+        RaterStats.objects.bulk_create([RaterStats(user_id=rater_id)], ignore_conflicts=True)
+        RaterStats.objects.filter(user_id=rater_id).update(**updates, updated_at=timezone.now())
+
+
+def add_rater_scores(rater_id: int, scores: Iterable[float]) -> None:
+    """
+    Fold a batch of scores into the rater's running count/mean/M2 in a single UPDATE, merging the
+    batch's own moments with the stored ones (Chan et al.'s parallel form of Welford's update).
+    Every right-hand side reads the pre-update row, so concurrent submissions serialise on the row lock
+    instead of overwriting each other's reads.
+    """
+
+    values = [float(score) for score in scores]
+    if not values:
         return
+    batch_n = len(values)
+    batch_mean = sum(values) / batch_n
+    batch_m2 = sum((value - batch_mean) ** 2 for value in values)
+    batch_extreme = sum(1 for value in values if is_extreme(value))
+
+    n = F("ratings_count")
+    total = n + batch_n
+    delta = Value(batch_mean, output_field=FloatField()) - F("mean_score")
+    m2_new = F("m2") + Value(batch_m2) + delta * delta * n * batch_n / total
+    _upsert_rater_stats_update(
+        rater_id,
+        create=True,
+        outbound_count=F("outbound_count") + batch_n,
+        ratings_count=total,
+        mean_score=F("mean_score") + delta * batch_n / total,
+        m2=m2_new,
+        std_score=Sqrt(m2_new / total),
+        extreme_rate=(F("extreme_rate") * n + Value(float(batch_extreme))) / total,
+    )
 
-    pairs = {
-        (ev.subject_id, ev.criterion_id)
-        for ev in rater_evaluations
-        if ev.subject_id is not None and ev.criterion_id is not None
+
+def add_rater_score(rater_id: int, score: float) -> None:
+    """Fold one score into the rater's running moments (the single-row case of add_rater_scores)."""
+
+    add_rater_scores(rater_id, [score])
+
+
+def remove_rater_scores(rater_id: int, scores: Iterable[float]) -> None:
+    """
+    Take a batch of deleted scores out of the rater's running moments in a single UPDATE
+    (the inverse of add_rater_scores' merge). Removing every remaining score resets the row.
+    """
+
+    values = [float(score) for score in scores]
+    if not values:
+        return
+    batch_n = len(values)
+    batch_mean = sum(values) / batch_n
+    batch_m2 = sum((value - batch_mean) ** 2 for value in values)
+    batch_extreme = sum(1 for value in values if is_extreme(value))
+
+    n = F("ratings_count")
+    rest = n - batch_n
+    last = Q(ratings_count__lte=batch_n)
+    mean_new = (F("mean_score") * n - Value(batch_mean * batch_n)) / rest
+    delta = Value(batch_mean, output_field=FloatField()) - mean_new
+    m2_new = Greatest(F("m2") - Value(batch_m2) - delta * delta * rest * batch_n / n, Value(0.0))
+
+    def unless_last(expr):
+        return Case(When(last, then=Value(0.0)), default=expr, output_field=FloatField())
+
+    _upsert_rater_stats_update(
+        rater_id,
+        create=False,
+        outbound_count=Greatest(F("outbound_count") - batch_n, Value(0)),
+        ratings_count=Case(When(last, then=Value(0)), default=rest),
+        mean_score=unless_last(mean_new),
+        m2=unless_last(m2_new),
+        std_score=unless_last(Sqrt(m2_new / rest)),
+        extreme_rate=unless_last((F("extreme_rate") * n - Value(float(batch_extreme))) / rest),
+    )
+
+
+def remove_rater_score(rater_id: int, score: float) -> None:
+    """Inverse Welford step for a deleted (or re-scored) evaluation."""
+
+    remove_rater_scores(rater_id, [score])
+
+
+def _build_consensus_map(pairs: Iterable[Pair]) -> Dict[Pair, float]:
+    """Return a mapping of (subject_id, criterion_id) -> average score."""
+
+    wanted = {
+        (int(subject_id), int(criterion_id))
+        for subject_id, criterion_id in pairs
+        if subject_id is not None and criterion_id is not None
+    }
+    if not wanted:
+        return {}
+
+    # One indexed fetch over the maintained aggregates; the subject/criterion IN-lists may
+    # over-select a few pairs, which are dropped below.
+    rows = PairConsensus.objects.filter(
+        subject_id__in={subject_id for subject_id, _ in wanted},
+        criterion_id__in={criterion_id for _, criterion_id in wanted},
+        score_count__gt=0,
+    ).values_list("subject_id", "criterion_id", "score_sum", "score_count")
+
+    return {
+        (subject_id, criterion_id): float(score_sum) / score_count
+        for subject_id, criterion_id, score_sum, score_count in rows
+        if (subject_id, criterion_id) in wanted
     }
-    consensus_map = _build_consensus_map(pairs)
 
-    deviations: list[float] = []
-    total_scores = 0
-    extreme_scores = 0
 
-    for ev in rater_evaluations:
-        key = (ev.subject_id, ev.criterion_id)
-        consensus = consensus_map.get(key)
-        if consensus is None:
-            continue
+# Raters per bulk UPDATE; bounds the CASE size while keeping the query count independent of history.
+WEIGHT_UPDATE_CHUNK = 500
+
 
-        score = float(ev.score)
-        deviations.append(abs(score - consensus))
-        total_scores += 1
-        if score <= 1.0 or score >= 5.0:
-            extreme_scores += 1
+def _weights_from_aggregates(
+    avg_deviation: Optional[float], total_scores: int, extreme_scores: int
+) -> Tuple[float, float]:
+    """Map a rater's deviation/extremity aggregates to (reliability_weight, extreme_rate_weight)."""
 
     if not total_scores:
-        reliability_weight = 1.0
-        extreme_rate_weight = 1.0
-    else:
-        avg_deviation = sum(deviations) / len(deviations) if deviations else 0.0
-        reliability_weight = 1.0 / (1.0 + avg_deviation)
-        reliability_weight = max(0.2, min(1.0, reliability_weight))
-
-        extreme_frequency = extreme_scores / float(total_scores)
-        extreme_rate_weight = 1.0 - 0.5 * extreme_frequency
-        extreme_rate_weight = max(0.5, min(1.0, extreme_rate_weight))
-
-    objectivity = reliability_weight * extreme_rate_weight
-
-    Evaluation.objects.filter(evaluator_id=rater_id).update(
-        reliability_weight=reliability_weight,
-        extreme_rate_weight=extreme_rate_weight,
-        objectivity_score=objectivity,
+        return 1.0, 1.0
+
+    reliability_weight = 1.0 / (1.0 + float(avg_deviation or 0.0))
+    reliability_weight = max(0.2, min(1.0, reliability_weight))
+
+    extreme_frequency = extreme_scores / float(total_scores)
+    extreme_rate_weight = 1.0 - 0.5 * extreme_frequency
+    extreme_rate_weight = max(0.5, min(1.0, extreme_rate_weight))
+    return reliability_weight, extreme_rate_weight
+
+
+def _case_by_rater(values: Dict[int, float]) -> Case:
+    return Case(
+        *[When(evaluator_id=rater_id, then=Value(value)) for rater_id, value in values.items()],
+        output_field=FloatField(),
+    )
+
+
+def recompute_rater_weights(rater_ids: Iterable[Optional[int]]) -> int:
+    """
+    Recompute reliability/extreme-rate weights for a set of raters exactly.
+
+    The raters' RaterDeviation accumulators are first re-derived from scratch (one grouped query
+    per WEIGHT_UPDATE_CHUNK raters against the PairConsensus averages), then the weights are
+    written with one CASE-based UPDATE per chunk. Returns the number of raters that have evaluations.
+    """
+
+    ids = sorted({int(rater_id) for rater_id in rater_ids if rater_id is not None})
+    updated = 0
+    for start in range(0, len(ids), WEIGHT_UPDATE_CHUNK):
+        chunk = ids[start : start + WEIGHT_UPDATE_CHUNK]
+        resync_rater_deviations(chunk)
+        updated += _write_weights(deviation_totals(chunk))
+    return updated
+
+
+def apply_rater_weights(rater_ids: Iterable[Optional[int]]) -> int:
+    """
+    Write weights from the maintained RaterDeviation accumulators, without reading the raters'
+    evaluation history (apply_pair_deviations keeps the accumulators current).
+    """
+
+    ids = sorted({int(rater_id) for rater_id in rater_ids if rater_id is not None})
+    updated = 0
+    for start in range(0, len(ids), WEIGHT_UPDATE_CHUNK):
+        updated += _write_weights(deviation_totals(ids[start : start + WEIGHT_UPDATE_CHUNK]))
+    return updated
+
+
+def _write_weights(totals: Dict[int, Tuple[float, int, int]]) -> int:
+    reliability: Dict[int, float] = {}
+    extremity: Dict[int, float] = {}
+    objectivity: Dict[int, float] = {}
+    for rater_id, (dev_sum, scored_count, extreme_count) in totals.items():
+        if not scored_count:
+            continue
+        rel, ext = _weights_from_aggregates(dev_sum / scored_count, scored_count, extreme_count)
+        reliability[rater_id] = rel
+        extremity[rater_id] = ext
+        objectivity[rater_id] = rel * ext
+
+    if not reliability:
+        return 0
+
+    Evaluation.objects.filter(evaluator_id__in=list(reliability)).update(
+        reliability_weight=_case_by_rater(reliability),
+        extreme_rate_weight=_case_by_rater(extremity),
+        objectivity_score=_case_by_rater(objectivity),
         pending=False,
     )
+    return len(reliability)
+
 
+def _compute_weights_for_rater(rater_id: int) -> None:
+    """Recompute reliability/extreme-rate weights for every evaluation by a rater."""
 
-def _handle_weight_refresh(instance: Evaluation) -> None:
-    """Shared helper to refresh rater weights for a saved evaluation."""
+    recompute_rater_weights([rater_id])
 
-    if instance.subject_id is None or instance.criterion_id is None:
+
+def _weights_sync() -> bool:
+    return bool(getattr(settings, "EVALUATIONS_WEIGHTS_SYNC", False))
+
+
+def mark_raters_dirty(rater_ids: Iterable[Optional[int]]) -> None:
+    """
+    Queue raters for a weight recompute and a refresh of the subject summaries those weights feed.
+    In sync mode (EVALUATIONS_WEIGHTS_SYNC, used by tests) the weights are also written inline; the
+    summary refresh, which touches every subject the raters ever rated, is always left to the worker.
+    """
+
+    ids = sorted({int(rater_id) for rater_id in rater_ids if rater_id is not None})
+    if not ids:
         return
 
-    affected_rater_ids = (
-        Evaluation.objects.filter(subject_id=instance.subject_id, criterion_id=instance.criterion_id)
-        .values_list("evaluator_id", flat=True)
-        .distinct()
+    if _weights_sync():
+        apply_rater_weights(ids)
+
+    _queue_marks(DirtyRater, [DirtyRater(rater_id=rater_id) for rater_id in ids], ["rater_id"])
+
+
+def _queue_marks(model, rows, unique_fields) -> None:
+    """
+    Insert queue rows, or re-stamp the ``mark`` token of the ones already queued.
+    The unique columns coalesce repeat marks and an existing row keeps its older marked_at; the new
+    token stops a drain that claimed the row before this mark from deleting it.
+    """
+
+    model.objects.bulk_create(rows, update_conflicts=True, unique_fields=unique_fields, update_fields=["mark"])
+
+
+_deferred = threading.local()
+
+
+def _deferred_state():
+    if not hasattr(_deferred, "depth"):
+        _deferred.depth, _deferred.pairs, _deferred.raters = 0, set(), set()
+    return _deferred
+
+
+def _refresh_pair_raters(pairs: Iterable[Pair], rater_ids: Iterable[Optional[int]] = ()) -> None:
+    """
+    The consensus of ``pairs`` moved: their raters' deviation deltas are due, and ``rater_ids``
+    need new weights. In sync mode the deltas apply inline and the raters whose accumulators
+    changed are marked dirty with ``rater_ids``; otherwise the pairs are queued as DirtyPair for
+    drain_dirty_pairs(). Inside defer_rater_weight_updates() the pairs and raters are only collected.
+    """
+
+    pairs = set(pairs)
+    state = _deferred_state()
+    if state.depth:
+        state.pairs.update(pairs)
+        state.raters.update(int(rater_id) for rater_id in rater_ids if rater_id is not None)
+        return
+
+    if _weights_sync():
+        changed = apply_pair_deviations(pairs)
+        mark_raters_dirty([*rater_ids, *changed])
+        return
+
+    _queue_dirty(pairs, ())
+    mark_raters_dirty(rater_ids)
+
+
+@contextmanager
+def defer_rater_weight_updates():
+    """
+    Context manager (and decorator) for bulk writes: Evaluation saves/deletes inside the block
+    only collect their affected raters and pairs, and one batched weight refresh runs on exit
+    instead of one per row. Nested blocks flush when the outermost one exits.
+    If the outermost block raises, the exception propagates untouched and the collected ids are
+    queued for the worker once the enclosing transaction commits: writes that committed before the
+    failure (autocommit, or an enclosing transaction that goes on to commit) still get their weights.
+    If that transaction rolls back, the writes and the queueing are dropped together.
+    """
+
+    state = _deferred_state()
+    state.depth += 1
+    completed = False
+    try:
+        yield
+        completed = True
+    finally:
+        state.depth -= 1
+        if not state.depth:
+            pairs, raters = state.pairs, state.raters
+            state.pairs, state.raters = set(), set()
+            if completed:
+                _refresh_pair_raters(pairs, raters)
+            elif pairs or raters:
+                transaction.on_commit(lambda: _queue_dirty(pairs, raters))
+
+
+def _queue_dirty(pairs: Iterable[Pair], rater_ids: Iterable[int]) -> None:
+    """Queue pairs and raters for the process_dirty_raters worker, whatever the sync setting."""
+
+    if pairs:
+        _queue_marks(
+            DirtyPair,
+            [DirtyPair(subject_id=subject_id, criterion_id=criterion_id) for subject_id, criterion_id in sorted(pairs)],
+            ["subject_id", "criterion_id"],
+        )
+    if rater_ids:
+        _queue_marks(DirtyRater, [DirtyRater(rater_id=rater_id) for rater_id in sorted(rater_ids)], ["rater_id"])
+
+
+def drain_dirty_pairs(batch_size: int = 500) -> int:
+    """
+    Apply the deviation deltas of up to ``batch_size`` queued pairs, oldest marks first, and queue
+    the raters whose accumulators changed. Claimed like drain_dirty_raters(); run it before that so
+    the weights are written from current accumulators.
+    """
+
+    with transaction.atomic():
+        claimed = list(
+            DirtyPair.objects.select_for_update(skip_locked=True)
+            .order_by("marked_at")
+            .values_list("pk", "mark", "subject_id", "criterion_id")[:batch_size]
+        )
+        if not claimed:
+            return 0
+
+        changed = apply_pair_deviations((subject_id, criterion_id) for _, _, subject_id, criterion_id in claimed)
+        mark_raters_dirty(changed)
+        _delete_claimed(DirtyPair, claimed)
+
+    return len(claimed)
+
+
+def drain_dirty_raters(batch_size: int = 500) -> int:
+    """
+    Recompute weights for up to ``batch_size`` queued raters, oldest marks first.
+    Rows are claimed and removed in the same transaction as the recompute, so a failure
+    leaves them queued. A row re-marked mid-drain carries a new token and is left for the next batch.
+    """
+
+    with transaction.atomic():
+        claimed = list(
+            DirtyRater.objects.select_for_update(skip_locked=True)
+            .order_by("marked_at")
+            .values_list("pk", "mark", "rater_id")[:batch_size]
+        )
+        if not claimed:
+            return 0
+
+        rater_ids = [rater_id for _, _, rater_id in claimed]
+        apply_rater_weights(rater_ids)
+        refresh_summaries_for_raters(rater_ids)
+        _delete_claimed(DirtyRater, claimed)
+
+    return len(claimed)
+
+
+def resync_stale_raters(max_age_seconds: float, batch_size: int = 500) -> int:
+    """
+    Recompute exactly the accumulators of up to ``batch_size`` raters not resynced within
+    ``max_age_seconds`` (never-synced first) and queue them, so the next drain rewrites their weights
+    and summaries. Bounds the float drift of the delta updates; returns the number of raters resynced.
+    """
+
+    cutoff = timezone.now() - timedelta(seconds=max_age_seconds)
+    rater_ids = list(
+        RaterDeviation.objects.exclude(synced_at__gte=cutoff)
+        .order_by(F("synced_at").asc(nulls_first=True), "rater_id")
+        .values_list("rater_id", flat=True)[:batch_size]
     )
+    if not rater_ids:
+        return 0
 
-    for rater_id in affected_rater_ids:
-        if rater_id is None:
-            continue
-        _compute_weights_for_rater(int(rater_id))
+    with transaction.atomic():
+        resync_rater_deviations(rater_ids)
+        _queue_dirty((), rater_ids)
+    return len(rater_ids)
+
+
+def _delete_claimed(model, claimed) -> None:
+    """Delete the claimed (pk, mark, ...) queue rows that were not re-marked since the claim."""
+
+    model.objects.filter(pk__in=[row[0] for row in claimed], mark__in=[row[1] for row in claimed]).delete()
+
+
+def dirty_rater_backlog() -> Dict[str, float]:
+    """Return the depth of the rater and pair queues and the age in seconds of the oldest pending mark."""
+
+    raters = DirtyRater.objects.aggregate(pending=Count("id"), oldest=Min("marked_at"))
+    pairs = DirtyPair.objects.aggregate(pending=Count("id"), oldest=Min("marked_at"))
+    oldest = min((agg["oldest"] for agg in (raters, pairs) if agg["oldest"]), default=None)
+    staleness = (timezone.now() - oldest).total_seconds() if oldest else 0.0
+    return {
+        "pending": int(raters["pending"] or 0),
+        "pending_pairs": int(pairs["pending"] or 0),
+        "max_staleness_seconds": max(0.0, staleness),
+    }
+
+
+def _handle_weight_refresh(instance: Evaluation, previous=None) -> None:
+    """Shared helper to refresh rater weights for a saved evaluation (and the pair it left, if any)."""
+
+    pairs = {
+        key
+        for key in (
+            _consensus_key(instance.subject_id, instance.criterion_id),
+            _consensus_key(*previous[:2]) if previous else None,
+        )
+        if key is not None
+    }
+    if pairs:
+        _refresh_pair_raters(pairs)
+
+
+def apply_bulk_evaluations(evaluations: Iterable[Evaluation]) -> None:
+    """
+    Apply the post_save side effects to rows inserted with bulk_create, which fires no signals.
+    Each step runs once for the whole batch: one consensus insert/UPDATE for all touched pairs,
+    one moments UPDATE per rater, one weight refresh covering every rater of those pairs,
+    one PendingTask upsert for every rated key and one generation bump per rated subject.
+    """
+
+    evaluations = list(evaluations)
+    deltas: Dict[Pair, Tuple[int, float, float]] = {}
+    scores_by_rater: Dict[int, list[float]] = {}
+    for evaluation in evaluations:
+        score = float(evaluation.score)
+        key = _consensus_key(evaluation.subject_id, evaluation.criterion_id)
+        if key is not None:
+            count, total, squares = deltas.get(key, (0, 0.0, 0.0))
+            deltas[key] = (count + 1, total + score, squares + score * score)
+        if evaluation.evaluator_id is not None:
+            scores_by_rater.setdefault(int(evaluation.evaluator_id), []).append(score)
+
+    _add_many_to_consensus(deltas)
+    for rater_id, scores in scores_by_rater.items():
+        add_rater_scores(rater_id, scores)
+
+    _refresh_pair_raters(deltas, scores_by_rater)
+    record_evaluations(evaluations)
+    bump_generations({evaluation.subject_id for evaluation in evaluations})
+
+
+def _consensus_key(subject_id: Optional[int], criterion_id: Optional[int]) -> Optional[Pair]:
+    if subject_id is None or criterion_id is None:
+        return None
+    return int(subject_id), int(criterion_id)
+
+
+@receiver(pre_save, sender=Evaluation)
+def remember_consensus_contribution(sender, instance: Evaluation, **kwargs) -> None:
+    """Capture the stored pair/score/rater of an existing row so post_save can apply exact deltas."""
+
+    instance._consensus_previous = None
+    if instance.pk is None or kwargs.get("raw"):
+        return
+    instance._consensus_previous = (
+        Evaluation.objects.filter(pk=instance.pk)
+        .values_list("subject_id", "criterion_id", "score", "evaluator_id")
+        .first()
+    )
 
 
 @receiver(post_save, sender=Evaluation)
-def update_rater_weights(sender, instance: Evaluation, created: bool, **kwargs) -> None:
-    """Whenever an evaluation is saved, update weights for affected raters."""
+def update_pair_consensus(sender, instance: Evaluation, created: bool, **kwargs) -> None:
+    """Keep PairConsensus in step with evaluation creates and updates."""
+
+    previous = getattr(instance, "_consensus_previous", None)
+    new_key = _consensus_key(instance.subject_id, instance.criterion_id)
+    new_score = float(instance.score)
+
+    if previous is None:
+        if new_key is not None:
+            _add_to_consensus(new_key, new_score)
+        return
+
+    old_key = _consensus_key(previous[0], previous[1])
+    old_score = float(previous[2])
+    if old_key == new_key:
+        if new_key is not None:
+            _bump_pair_consensus(new_key, 0, new_score - old_score, new_score**2 - old_score**2)
+        return
+
+    if old_key is not None:
+        _remove_from_consensus(old_key, old_score)
+    if new_key is not None:
+        _add_to_consensus(new_key, new_score)
+
+
+@receiver(post_save, sender=Evaluation)
+def update_rater_moments(sender, instance: Evaluation, created: bool, **kwargs) -> None:
+    """Keep the rater's running count/mean/M2 in RaterStats in step with evaluation writes."""
+
+    previous = getattr(instance, "_consensus_previous", None)
+    new_score = float(instance.score)
+
+    if previous is not None:
+        old_score, old_rater = float(previous[2]), previous[3]
+        if old_rater == instance.evaluator_id and old_score == new_score:
+            return
+        if old_rater is not None:
+            remove_rater_score(int(old_rater), old_score)
+
+    if instance.evaluator_id is not None:
+        add_rater_score(int(instance.evaluator_id), new_score)
 
-    _handle_weight_refresh(instance)
 
+@receiver(post_delete, sender=Evaluation)
+def remove_from_pair_consensus(sender, instance: Evaluation, **kwargs) -> None:
+    """Subtract a deleted evaluation from its pair aggregate."""
+
+    key = _consensus_key(instance.subject_id, instance.criterion_id)
+    if key is not None:
+        _remove_from_consensus(key, float(instance.score))
+    if instance.evaluator_id is not None:
+        remove_rater_score(int(instance.evaluator_id), float(instance.score))
 
-@receiver(evaluation_submitted)
-def update_rater_weights_on_submission(sender, evaluation: Evaluation, **kwargs) -> None:
-    """Refresh rater weights when the manual signal is emitted."""
 
-    _handle_weight_refresh(evaluation)
+@receiver(post_save, sender=Evaluation)
+def update_rater_weights(sender, instance: Evaluation, created: bool, **kwargs) -> None:
+    """Whenever an evaluation is saved, update weights for affected raters."""
+
+    previous = getattr(instance, "_consensus_previous", None)
+    instance._consensus_previous = None
+    _handle_weight_refresh(instance, previous)
 
 
 @receiver(post_delete, sender=Evaluation)
@@ -121,17 +660,71 @@ def update_rater_weights_on_delete(sender, instance: Evaluation, **kwargs) -> No
     if instance.subject_id is None or instance.criterion_id is None:
         return
 
-    # Recompute for the rater of the deleted row (if any)
-    if instance.evaluator_id is not None:
-        _compute_weights_for_rater(int(instance.evaluator_id))
+    # The rater of the deleted row plus any raters with remaining evals on this subject/criterion
+    _refresh_pair_raters([(int(instance.subject_id), int(instance.criterion_id))], [instance.evaluator_id])
 
-    # Also recompute for any other raters who have remaining evals on this subject/criterion
-    affected_rater_ids = (
-        Evaluation.objects.filter(subject_id=instance.subject_id, criterion_id=instance.criterion_id)
-        .values_list("evaluator_id", flat=True)
-        .distinct()
-    )
-    for rater_id in affected_rater_ids:
-        if rater_id is None:
-            continue
-        _compute_weights_for_rater(int(rater_id))
+
+@receiver(post_save, sender=Evaluation)
+def update_pending_task(sender, instance: Evaluation, created: bool, **kwargs) -> None:
+    """Push the rated (evaluator, subject, criterion) task out by the cooldown."""
+
+    if created and not kwargs.get("raw"):
+        record_evaluations([instance])
+
+
+@receiver(post_delete, sender=Evaluation)
+def refresh_pending_task_on_delete(sender, instance: Evaluation, **kwargs) -> None:
+    """Re-derive the task's due date from the evaluations that remain."""
+
+    if None in (instance.evaluator_id, instance.subject_id, instance.criterion_id):
+        return
+    refresh_after_delete(instance.evaluator_id, instance.subject_id, instance.criterion_id)
+
+
+@receiver(post_save, sender=Friendship)
+@receiver(post_delete, sender=Friendship)
+def sync_pending_tasks_for_friendship(sender, instance: Friendship, **kwargs) -> None:
+    """Queue or park the pair's tasks when a friendship is confirmed, unconfirmed or removed."""
+
+    if kwargs.get("raw"):
+        return
+    sync_friendship(instance.from_user_id, instance.to_user_id)
+
+
+@receiver(post_save, sender=Criterion)
+def queue_pending_tasks_for_criterion(sender, instance: Criterion, created: bool, **kwargs) -> None:
+    """A new criterion is due now for every confirmed friendship."""
+
+    if created and not kwargs.get("raw"):
+        add_criterion(instance.pk)
+
+
+@receiver(post_delete, sender=Evaluation)
+def refresh_subject_summary_on_delete(sender, instance: Evaluation, **kwargs) -> None:
+    """Drop a deleted evaluation from its subject's summary rows."""
+
+    refresh_subject_summaries([instance.subject_id])
+
+
+@receiver(post_save, sender=EvaluationMeta)
+@receiver(post_delete, sender=EvaluationMeta)
+def refresh_subject_summary_on_meta(sender, instance: EvaluationMeta, **kwargs) -> None:
+    """
+    EvaluationMeta is a compatibility mirror of Evaluation.is_active: a status written through it
+    (or a deleted meta row) is copied onto the evaluation, then the subject's summary rows refresh.
+    """
+
+    if kwargs.get("raw"):
+        return
+    active = kwargs.get("signal") is post_save and instance.status == EvaluationMeta.STATUS_ACTIVE
+    evaluation = Evaluation.objects.filter(pk=instance.evaluation_id)
+    if evaluation.exclude(is_active=active).update(is_active=active):
+        refresh_subject_summaries(evaluation.values_list("subject_id", flat=True))
+
+
+@receiver(post_save, sender=Evaluation)
+@receiver(post_delete, sender=Evaluation)
+def bump_summary_generation(sender, instance: Evaluation, **kwargs) -> None:
+    """Invalidate cached summaries covering the evaluation's subject."""
+
+    bump_generations([instance.subject_id])
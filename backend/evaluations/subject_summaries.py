@@ -0,0 +1,143 @@
+"""
+Maintenance of the SubjectCriterionSummary table read by summary-v2.
+
+Each row is the weighted aggregate of one (subject, criterion) pair over ACTIVE evaluations
+(Evaluation.is_active).
+Rater weights and normalization (RaterStats moments) shift for every evaluation of a pair when
+any rater of it changes, so rows are refreshed per subject with one grouped query over that
+subject's evaluations rather than patched with per-row deltas. A weight change fans out to every
+subject its raters rated, so refresh_summaries_for_raters() only runs from the process_dirty_raters
+worker (drain_dirty_raters), never on the write path; writes refresh just their own subject.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Count, ExpressionWrapper, F, FloatField, Sum, Value
+from django.db.models.functions import Coalesce
+
+from .models import Evaluation, normalized_score_expression
+from .summary_cache import bump_generations
+from .summary_models import SubjectCriterionSummary
+
+SUMMARY_FIELDS = ("raw_count", "score_sum", "weighted_sum", "normalized_weighted_sum", "weight_sum")
+
+# Subjects per refresh query; bounds the IN-list while keeping the query count per chunk constant.
+REFRESH_CHUNK = 500
+
+
+def final_weight_expression() -> ExpressionWrapper:
+    """
+    Weight = rel_weight * ext_weight * fam_weight
+      - rel_weight = evaluation.reliability_weight (defaults 1.0)
+      - ext_weight = evaluation.extreme_rate_weight (defaults 1.0)
+      - fam_weight = 1.0 (familiarity is not weighted yet)
+    """
+
+    fam_weight = Value(1.0)
+    rel_weight = Coalesce(F("reliability_weight"), Value(1.0))
+    ext_weight = Coalesce(F("extreme_rate_weight"), Value(1.0))
+    return ExpressionWrapper(fam_weight * rel_weight * ext_weight, output_field=FloatField())
+
+
+def summary_aggregates(queryset):
+    """Group ``queryset`` by (subject, criterion) into the SubjectCriterionSummary columns."""
+
+    final_weight_expr = final_weight_expression()
+    return (
+        queryset.values("subject_id", "criterion_id")
+        .annotate(
+            raw_count=Count("id"),
+            score_sum=Sum("score", output_field=FloatField()),
+            weighted_sum=Sum(ExpressionWrapper(F("score") * final_weight_expr, output_field=FloatField())),
+            normalized_weighted_sum=Sum(
+                ExpressionWrapper(normalized_score_expression() * final_weight_expr, output_field=FloatField())
+            ),
+            weight_sum=Sum(final_weight_expr),
+        )
+        .order_by()
+    )
+
+
+def _active_evaluations():
+    return Evaluation.objects.filter(is_active=True)
+
+
+def _summary_row(row) -> SubjectCriterionSummary:
+    values = {name: float(row[name] or 0.0) for name in SUMMARY_FIELDS}
+    values["raw_count"] = int(row["raw_count"] or 0)
+    return SubjectCriterionSummary(subject_id=row["subject_id"], criterion_id=row["criterion_id"], **values)
+
+
+def refresh_subject_summaries(subject_ids: Iterable[Optional[int]]) -> int:
+    """Recompute the summary rows of the given subjects. Returns the number of rows written."""
+
+    ids = sorted({int(subject_id) for subject_id in subject_ids if subject_id is not None})
+    written = 0
+    for start in range(0, len(ids), REFRESH_CHUNK):
+        chunk = ids[start : start + REFRESH_CHUNK]
+        rows = [_summary_row(row) for row in summary_aggregates(_active_evaluations().filter(subject_id__in=chunk))]
+        with transaction.atomic():
+            SubjectCriterionSummary.objects.filter(subject_id__in=chunk).delete()
+            SubjectCriterionSummary.objects.bulk_create(rows)
+        bump_generations(chunk)
+        written += len(rows)
+    return written
+
+
+def refresh_summaries_for_raters(rater_ids: Iterable[Optional[int]]) -> int:
+    """Refresh every subject rated by ``rater_ids`` (their weights/normalization just changed)."""
+
+    ids = sorted({int(rater_id) for rater_id in rater_ids if rater_id is not None})
+    written = 0
+    for start in range(0, len(ids), REFRESH_CHUNK):
+        subjects = (
+            Evaluation.objects.filter(evaluator_id__in=ids[start : start + REFRESH_CHUNK])
+            .values_list("subject_id", flat=True)
+            .distinct()
+        )
+        written += refresh_subject_summaries(list(subjects))
+    return written
+
+
+def rebuild_subject_summaries(batch_size: int = 1000) -> int:
+    """Recompute the whole table from ACTIVE evaluations. Returns the number of rows written."""
+
+    with transaction.atomic():
+        SubjectCriterionSummary.objects.all().delete()
+        SubjectCriterionSummary.objects.bulk_create(
+            (_summary_row(row) for row in summary_aggregates(_active_evaluations()).iterator()),
+            batch_size=batch_size,
+        )
+    bump_generations([])
+    return SubjectCriterionSummary.objects.count()
+
+
+def check_subject_summaries(tolerance: float = 1e-6) -> List[Tuple[int, int, str]]:
+    """
+    Compare the maintained rows with a fresh aggregation.
+    Returns (subject_id, criterion_id, reason) for every missing, extra or drifted row.
+    """
+
+    expected: Dict[Tuple[int, int], SubjectCriterionSummary] = {
+        (row.subject_id, row.criterion_id): row
+        for row in (_summary_row(agg) for agg in summary_aggregates(_active_evaluations()).iterator())
+    }
+    problems: List[Tuple[int, int, str]] = []
+    for stored in SubjectCriterionSummary.objects.iterator():
+        key = (stored.subject_id, stored.criterion_id)
+        fresh = expected.pop(key, None)
+        if fresh is None:
+            problems.append((*key, "extra"))
+            continue
+        drifted = [
+            name
+            for name in SUMMARY_FIELDS
+            if abs(float(getattr(stored, name)) - float(getattr(fresh, name))) > tolerance
+        ]
+        if drifted:
+            problems.append((*key, "drift: " + ", ".join(drifted)))
+    problems.extend((*key, "missing") for key in expected)
+    return sorted(problems)
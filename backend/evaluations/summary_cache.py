@@ -0,0 +1,175 @@
+"""
+Generation counters and a single-flight cache for evaluation summaries.
+
+Every Evaluation/EvaluationMeta write (and every SubjectCriterionSummary refresh) bumps the
+subject's counter and the global one. Cached entries record the generation they were computed
+under, so an entry is never invalidated explicitly: a bump makes it stale, and the next reader
+that wins the refresh lock recomputes it while concurrent readers keep serving the stale value.
+Bumps wait for the surrounding transaction to commit: a reader that saw the new generation
+earlier could cache the pre-commit rows under it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+GLOBAL_GENERATION_KEY = "evaluations:summary-gen"
+
+
+def _subject_generation_key(subject_id: int) -> str:
+    return f"{GLOBAL_GENERATION_KEY}:{subject_id}"
+
+
+def _fresh_generation() -> int:
+    # Counters start from the clock, so a counter evicted from the cache never restarts at a value
+    # an older, still-cached entry was keyed under.
+    return int(time.time() * 1000)
+
+
+def _read(keys: list[str]) -> Dict[str, int]:
+    found = cache.get_many(keys)
+    for key in keys:
+        if key not in found:
+            cache.add(key, _fresh_generation(), timeout=None)
+            found[key] = cache.get(key) or _fresh_generation()
+    return found
+
+
+def global_generation() -> int:
+    return _read([GLOBAL_GENERATION_KEY])[GLOBAL_GENERATION_KEY]
+
+
+def subject_generations(subject_ids: Iterable[int]) -> Dict[int, int]:
+    ids = sorted({int(subject_id) for subject_id in subject_ids})
+    found = _read([_subject_generation_key(subject_id) for subject_id in ids])
+    return {subject_id: found[_subject_generation_key(subject_id)] for subject_id in ids}
+
+
+def _bump(key: str) -> None:
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, _fresh_generation(), timeout=None)
+
+
+def bump_generations(subject_ids: Iterable[Optional[int]]) -> None:
+    """
+    Invalidate cached summaries of ``subject_ids`` and every unfiltered summary, once the current
+    transaction commits (immediately in autocommit; never if it rolls back).
+    """
+
+    keys = [_subject_generation_key(subject_id) for subject_id in {int(pk) for pk in subject_ids if pk is not None}]
+    keys.append(GLOBAL_GENERATION_KEY)
+
+    def bump() -> None:
+        for key in keys:
+            _bump(key)
+
+    transaction.on_commit(bump)
+
+
+def summary_generation(subject_ids: Optional[Iterable[int]] = None) -> str:
+    """
+    Generation token for a summary: the listed subjects' counters, or the global counter when
+    the summary can span every subject.
+    """
+
+    if subject_ids is None:
+        return f"g{global_generation()}"
+    return ",".join(f"{pk}:{gen}" for pk, gen in subject_generations(subject_ids).items())
+
+
+def summary_cache_key(name: str, params: Dict[str, Any]) -> str:
+    """Stable cache key for a summary response; the generation is stored inside the entry."""
+
+    encoded = "&".join(f"{key}={value}" for key, value in sorted(params.items()))
+    return f"evaluations:{name}:{hashlib.sha1(encoded.encode()).hexdigest()}"
+
+
+def cache_timeout() -> int:
+    """Hard TTL: how long an entry may be served at all (stale or not)."""
+
+    return int(getattr(settings, "EVALUATIONS_SUMMARY_CACHE_TIMEOUT", 3600))
+
+
+def cache_soft_timeout() -> int:
+    """Soft TTL: after this an entry is refreshed even if no generation moved."""
+
+    return int(getattr(settings, "EVALUATIONS_SUMMARY_CACHE_SOFT_TIMEOUT", 300))
+
+
+# Seconds a refresh lock is held at most; a crashed worker cannot block refreshes for longer.
+REFRESH_LOCK_TIMEOUT = 30
+
+CACHE_STATS_KEY = "evaluations:summary-cache-stats"
+CACHE_STATS = ("hit", "miss", "stale")
+
+
+def _count(stat: str) -> None:
+    key = f"{CACHE_STATS_KEY}:{stat}"
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def summary_cache_stats() -> Dict[str, int]:
+    """Shared hit / miss / stale-served counters of single_flight()."""
+
+    found = cache.get_many([f"{CACHE_STATS_KEY}:{stat}" for stat in CACHE_STATS])
+    return {stat: int(found.get(f"{CACHE_STATS_KEY}:{stat}") or 0) for stat in CACHE_STATS}
+
+
+def reset_summary_cache_stats() -> None:
+    cache.delete_many([f"{CACHE_STATS_KEY}:{stat}" for stat in CACHE_STATS])
+
+
+def single_flight(
+    key: str,
+    generation: str,
+    compute: Callable[[], Any],
+    soft_timeout: Optional[int] = None,
+    hard_timeout: Optional[int] = None,
+) -> Any:
+    """
+    Return the cached value for ``key``, recomputing it at most once across workers.
+
+    - hit: the entry matches ``generation`` and is within the soft TTL.
+    - stale: the entry is outdated (generation moved or soft TTL passed); the caller that wins
+      the ``<key>:lock`` add() recomputes it, every other caller serves the stale value.
+    - miss: no entry at all (never computed, or past the hard TTL); the caller computes.
+    """
+
+    soft_timeout = cache_soft_timeout() if soft_timeout is None else soft_timeout
+    hard_timeout = cache_timeout() if hard_timeout is None else hard_timeout
+    lock_key = f"{key}:lock"
+
+    entry = cache.get(key)
+    if entry is not None and entry["generation"] == generation and entry["fresh_until"] > time.time():
+        _count("hit")
+        return entry["value"]
+
+    locked = cache.add(lock_key, 1, timeout=REFRESH_LOCK_TIMEOUT)
+    if entry is not None and not locked:
+        _count("stale")
+        return entry["value"]
+
+    _count("miss")
+    try:
+        value = compute()
+        cache.set(
+            key,
+            {"generation": generation, "fresh_until": time.time() + soft_timeout, "value": value},
+            hard_timeout,
+        )
+    finally:
+        if locked:
+            cache.delete(lock_key)
+    return value
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.db import models
+
+
+class SubjectCriterionSummary(models.Model):
+    """
+    Maintained summary-v2 aggregate for one (subject, criterion) pair over ACTIVE evaluations.
+    Refreshed per subject by evaluations.subject_summaries whenever evaluations, rater weights or
+    meta status change, so summary-v2 reads rows instead of aggregating the Evaluation table.
+    """
+
+    subject = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="criterion_summaries",
+    )
+    criterion = models.ForeignKey(
+        "evaluations.Criterion",
+        on_delete=models.CASCADE,
+        related_name="subject_summaries",
+    )
+    raw_count = models.PositiveIntegerField(default=0)
+    # Unweighted sum of scores; score_sum / raw_count is the plain average.
+    score_sum = models.FloatField(default=0.0)
+    weighted_sum = models.FloatField(default=0.0)
+    normalized_weighted_sum = models.FloatField(default=0.0)
+    weight_sum = models.FloatField(default=0.0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Subject Criterion Summary"
+        verbose_name_plural = "Subject Criterion Summaries"
+        constraints = [
+            models.UniqueConstraint(fields=["subject", "criterion"], name="uniq_subject_criterion_summary"),
+        ]
+        indexes = [
+            # EVALUATIONS_MIN_RATINGS gate: raw_count >= threshold is a range scan.
+            models.Index(fields=["raw_count"], name="subject_summary_count_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"SubjectCriterionSummary<{self.subject_id}:{self.criterion_id}>"
@@ -1,16 +1,58 @@
 from __future__ import annotations
 
+import base64
+import binascii
+
 from django.conf import settings
-from django.db.models import Count, ExpressionWrapper, F, FloatField, Sum, Value
-from django.db.models.functions import Coalesce
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
+from django.db.models import Q
 
+from rest_framework import permissions, status
+from rest_framework.authentication import TokenAuthentication
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .meta_models import EvaluationMeta
-from .models import Criterion, Evaluation  # noqa: F401 (used via F-expressions)
+from .summary_cache import single_flight, summary_cache_key, summary_generation
+from .summary_models import SubjectCriterionSummary
+
+# Upper bound for ?limit on summary-v2 pages.
+MAX_PAGE_SIZE = 500
+
+
+def _average(total: float, count: float) -> float:
+    return round(total / count, 3) if count else 0.0
+
+
+def _encode_cursor(subject_id: int, criterion_id: int) -> str:
+    return base64.urlsafe_b64encode(f"{subject_id}:{criterion_id}".encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[int, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        subject_id, criterion_id = raw.split(":")
+        return int(subject_id), int(criterion_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("cursor is invalid.") from None
+
+
+def _int_param(params, name: str) -> int | None:
+    raw = params.get(name)
+    if raw in (None, ""):
+        return None
+    try:
+        return int(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer.") from None
+
+
+def _int_list_param(params, name: str) -> list[int] | None:
+    raw = params.get(name)
+    if raw in (None, ""):
+        return None
+    try:
+        return [int(part) for part in raw.split(",") if part.strip()]
+    except ValueError:
+        raise ValueError(f"{name} must be a comma-separated list of integers.") from None
 
 
 class EvaluationSummaryV2View(APIView):
@@ -22,57 +64,91 @@ class EvaluationSummaryV2View(APIView):
       - ext_weight = evaluation.extreme_rate_weight (defaults 1.0)
       - fam_weight = 1.0 (no familiarity field in current schema)
 
-    Rows with raw_count < settings.EVALUATIONS_MIN_RATINGS are excluded.
+    Reads the maintained SubjectCriterionSummary rows (see evaluations.subject_summaries)
+    instead of aggregating the Evaluation table on every request.
+    Rows with raw_count < settings.EVALUATIONS_MIN_RATINGS are excluded (indexed filter).
+
+    Optional filters: ?subject_id=<int>, ?subject_ids=<int,int,...>, ?criterion_id=<int>.
+    Optional keyset paging over (subject_id, criterion_id): ?limit=<n>&cursor=<opaque>;
+    paged responses carry "next_cursor" (null on the last page). Calls without
+    limit/cursor keep the unpaged response shape.
+
+    Responses are cached with single_flight() under the summary generation counters
+    (evaluations.summary_cache): subject-filtered calls depend only on those subjects'
+    counters, everything else on the global one. Outdated entries are recomputed by one
+    worker while concurrent requests serve the stale copy.
     """
 
-    @method_decorator(cache_page(30))  # light caching
     def get(self, request):
-        # Infer field names used by Evaluation
-        subject_field = "subject"
-        criterion_field = "criterion"
-        score_field = "score"
-
         min_ratings = int(getattr(settings, "EVALUATIONS_MIN_RATINGS", 10))
+        params = request.query_params
+
+        try:
+            subject_id = _int_param(params, "subject_id")
+            subject_ids = _int_list_param(params, "subject_ids")
+            criterion_id = _int_param(params, "criterion_id")
+            limit = _int_param(params, "limit")
+            cursor = _decode_cursor(params["cursor"]) if params.get("cursor") else None
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        if limit is not None and not 1 <= limit <= MAX_PAGE_SIZE:
+            return Response(
+                {"detail": f"limit must be between 1 and {MAX_PAGE_SIZE}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        # Base queryset
-        qs = Evaluation.objects.filter(evaluationmeta__status=EvaluationMeta.STATUS_ACTIVE)
-
-        # Weights (gracefully degrade if no RaterStats)
-        fam_weight = Value(1.0)
-        rel_weight = Coalesce(F("reliability_weight"), Value(1.0))
-        ext_weight = Coalesce(F("extreme_rate_weight"), Value(1.0))
-
-        final_weight_expr = ExpressionWrapper(fam_weight * rel_weight * ext_weight, output_field=FloatField())
-        weighted_score_expr = ExpressionWrapper(F(score_field) * final_weight_expr, output_field=FloatField())
-        normalized_weighted_expr = ExpressionWrapper(
-            Coalesce(F("normalized_score"), Value(0.0)) * final_weight_expr,
-            output_field=FloatField(),
+        scope = None
+        if subject_id is not None or subject_ids is not None:
+            scope = [*([subject_id] if subject_id is not None else []), *(subject_ids or [])]
+        key = summary_cache_key(
+            "summary-v2",
+            {
+                "min_ratings": min_ratings,
+                "subject_id": subject_id,
+                "subject_ids": subject_ids,
+                "criterion_id": criterion_id,
+                "limit": limit,
+                "cursor": cursor,
+            },
         )
-
-        # Aggregate by subject + criterion
-        agg = (
-            qs.values(f"{subject_field}_id", f"{criterion_field}_id")
-            .annotate(
-                raw_count=Count("id"),  # ← real count of rows
-                weighted_sum=Sum(weighted_score_expr),
-                normalized_weighted_sum=Sum(normalized_weighted_expr),
-                weight_sum=Sum(final_weight_expr),
-            )
-            .order_by()
+        payload = single_flight(
+            key,
+            summary_generation(scope),
+            lambda: self._build_payload(min_ratings, subject_id, subject_ids, criterion_id, limit, cursor),
         )
+        return Response(payload)
 
+    def _build_payload(self, min_ratings, subject_id, subject_ids, criterion_id, limit, cursor) -> dict:
         # Gate by minimum ratings
-        agg = agg.filter(raw_count__gte=min_ratings)
+        qs = SubjectCriterionSummary.objects.filter(raw_count__gte=min_ratings)
+        if subject_id is not None:
+            qs = qs.filter(subject_id=subject_id)
+        if subject_ids is not None:
+            qs = qs.filter(subject_id__in=subject_ids)
+        if criterion_id is not None:
+            qs = qs.filter(criterion_id=criterion_id)
+
+        paged = limit is not None or cursor is not None
+        if cursor is not None:
+            after_subject, after_criterion = cursor
+            qs = qs.filter(
+                Q(subject_id__gt=after_subject) | Q(subject_id=after_subject, criterion_id__gt=after_criterion)
+            )
+        qs = qs.order_by("subject_id", "criterion_id")
+
+        page_size = limit or MAX_PAGE_SIZE
+        rows = qs.values_list(
+            "subject_id", "criterion_id", "raw_count", "weighted_sum", "normalized_weighted_sum", "weight_sum"
+        )
+        if paged:
+            # One extra row tells us whether another page exists.
+            rows = list(rows[: page_size + 1])
+            has_more = len(rows) > page_size
+            rows = rows[:page_size]
 
         # Build response payload
         result = []
-        for row in agg:
-            subj_id = row[f"{subject_field}_id"]
-            crit_id = row[f"{criterion_field}_id"]
-            weighted_sum = float(row.get("weighted_sum") or 0.0)
-            normalized_weighted_sum = float(row.get("normalized_weighted_sum") or 0.0)
-            weight_sum = float(row.get("weight_sum") or 0.0)
-
+        for subj_id, crit_id, raw_count, weighted_sum, normalized_weighted_sum, weight_sum in rows:
             weighted_avg = weighted_sum / weight_sum if weight_sum else 0.0
             normalized_avg = normalized_weighted_sum / weight_sum if weight_sum else 0.0
 
@@ -82,7 +158,7 @@ class EvaluationSummaryV2View(APIView):
                     "criterion_id": crit_id,
                     "weighted_average": round(weighted_avg, 3),
                     "normalized_average": round(normalized_avg, 3),
-                    "raw_count": int(row.get("raw_count") or 0),
+                    "raw_count": int(raw_count),
                 }
             )
 
@@ -92,4 +168,88 @@ class EvaluationSummaryV2View(APIView):
             "outbound_count": len(result),
         }
 
-        return Response({"results": result, "gating": gating})
+        payload = {"results": result, "gating": gating}
+        if paged:
+            last = result[-1] if result else None
+            payload["next_cursor"] = (
+                _encode_cursor(last["subject_id"], last["criterion_id"]) if has_more and last else None
+            )
+        return payload
+
+
+class EvaluationSummaryBatchView(APIView):
+    """
+    Per-criterion summaries for many subjects in one request (friend lists, task screens).
+
+    Expects: ?subject_ids=<int,int,...> (at most settings.EVALUATIONS_SUMMARY_BATCH_MAX_SUBJECTS)
+    Response: {"results": {"<subject_id>": [{criterion_id, criterion_name, active_average,
+    weighted_average, normalized_average, raw_count}, ...]}, "threshold": <min ratings>}
+
+    Rows follow summary-v2, not /summary/: they cover ACTIVE evaluations only and criteria below
+    the EVALUATIONS_MIN_RATINGS gate are left out, so "active_average" (the unweighted mean of
+    those evaluations) can differ from /summary/'s "average_score", which averages every
+    evaluation of the subject without a gate.
+
+    Every requested subject is present in "results" (an empty list when nothing passes the
+    gate). All subjects are read from SubjectCriterionSummary with one query, and the response
+    is cached with single_flight() under those subjects' generations.
+    """
+
+    authentication_classes = [TokenAuthentication]
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        min_ratings = int(getattr(settings, "EVALUATIONS_MIN_RATINGS", 10))
+        max_subjects = int(getattr(settings, "EVALUATIONS_SUMMARY_BATCH_MAX_SUBJECTS", 100))
+
+        try:
+            subject_ids = _int_list_param(request.query_params, "subject_ids")
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        if not subject_ids:
+            return Response(
+                {"detail": "subject_ids query parameter is required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        subject_ids = sorted(set(subject_ids))
+        if len(subject_ids) > max_subjects:
+            return Response(
+                {"detail": f"At most {max_subjects} subject_ids per request."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        payload = single_flight(
+            summary_cache_key("summary-batch", {"min_ratings": min_ratings, "subject_ids": subject_ids}),
+            summary_generation(subject_ids),
+            lambda: self._build_payload(min_ratings, subject_ids),
+        )
+        return Response(payload)
+
+    def _build_payload(self, min_ratings: int, subject_ids: list[int]) -> dict:
+        results = {str(subject_id): [] for subject_id in subject_ids}
+        rows = (
+            SubjectCriterionSummary.objects.filter(subject_id__in=subject_ids, raw_count__gte=min_ratings)
+            .order_by("subject_id", "criterion_id")
+            .values_list(
+                "subject_id",
+                "criterion_id",
+                "criterion__name",
+                "raw_count",
+                "score_sum",
+                "weighted_sum",
+                "normalized_weighted_sum",
+                "weight_sum",
+            )
+        )
+        for subj_id, crit_id, crit_name, raw_count, score_sum, weighted_sum, normalized_sum, weight_sum in rows:
+            results[str(subj_id)].append(
+                {
+                    "criterion_id": crit_id,
+                    "criterion_name": crit_name,
+                    "active_average": _average(score_sum, raw_count),
+                    "weighted_average": _average(weighted_sum, weight_sum),
+                    "normalized_average": _average(normalized_sum, weight_sum),
+                    "raw_count": int(raw_count),
+                }
+            )
+        return {"results": results, "threshold": min_ratings}
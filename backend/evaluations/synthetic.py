@@ -0,0 +1,372 @@
+"""
+Deterministic synthetic datasets for reproducing production-scale performance locally.
+
+generate() creates users with profiles, a friendship graph, questions with answers and
+evaluations whose scores follow ``subject quality + criterion bias + rater leniency + noise``.
+Everything is drawn from one random.Random(seed), so a seed always yields the same rows.
+
+Rows are written with bulk_create in batches, which sends no model signals. The maintained
+tables the signals would have kept current are built instead from aggregates collected while
+generating: PairConsensus and RaterStats are computed in memory. Outbound gating is known up
+front because each rater's evaluation count is drawn before any row is written. The deviation
+accumulators and weights (recompute_rater_weights), PendingTask rows and subject summaries are
+rebuilt with their set-based helpers. Memory grows with users and pairs, not with evaluations,
+so tens of millions of evaluations fit on a laptop.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from datetime import timedelta
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.db.models import F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from questions.models import Answer, Question, Tag
+
+from userprofiles.models import Friendship, Profile
+
+from .activation import min_outbound
+from .consensus_models import PairConsensus
+from .management.commands.seed_data import DEFAULT_CRITERIA
+from .meta_models import EvaluationMeta
+from .models import Criterion, Evaluation
+from .pending_tasks import rebuild_pending_tasks
+from .rater_models import RaterStats
+from .rater_stats import is_extreme
+from .signals import WEIGHT_UPDATE_CHUNK, recompute_rater_weights
+from .subject_summaries import refresh_subject_summaries
+
+DEGREE_DISTRIBUTIONS = ("uniform", "powerlaw")
+COUNTRIES = ["US", "GB", "DE", "FR", "BR", "IN", "JP", "NG", "GE", "CA"]
+AGE_GROUPS = ["18-24", "25-34", "35-44", "45-54", "55+"]
+
+
+class SyntheticConfig(NamedTuple):
+    users: int = 1000
+    evaluations: int = 10_000
+    degree: int = 20
+    distribution: str = "powerlaw"
+    confirmed_rate: float = 0.9
+    questions: int = 100
+    answers_per_question: int = 20
+    leniency: float = 0.6
+    noise: float = 0.8
+    days: int = 180
+    seed: int = 0
+    prefix: str = "synth"
+    batch_size: int = 5000
+
+
+class SyntheticReport(NamedTuple):
+    users: int
+    friendships: int
+    questions: int
+    answers: int
+    evaluations: int
+    seconds: float
+
+
+class _Moments:
+    __slots__ = ("count", "mean", "m2", "extreme")
+
+    def __init__(self):
+        self.count, self.mean, self.m2, self.extreme = 0, 0.0, 0.0, 0
+
+    def add(self, score: float) -> None:
+        # Welford's update, as add_rater_scores applies it in SQL.
+        self.count += 1
+        delta = score - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (score - self.mean)
+        self.extreme += int(is_extreme(score))
+
+
+def _batches(rows: Iterator, size: int) -> Iterator[list]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _create_users(config: SyntheticConfig, rng: random.Random) -> List[int]:
+    User = get_user_model()
+    # One hash for everyone: hashing per user would dominate the run and break determinism.
+    password = make_password(f"{config.prefix}-password", salt=f"{config.prefix}{config.seed}")
+    for batch in _batches(iter(range(config.users)), config.batch_size):
+        with transaction.atomic():
+            User.objects.bulk_create(
+                [
+                    User(username=f"{config.prefix}{i}", email=f"{config.prefix}{i}@example.com", password=password)
+                    for i in batch
+                ]
+            )
+    user_ids = list(User.objects.filter(username__startswith=config.prefix).order_by("pk").values_list("pk", flat=True))
+    for batch in _batches(iter(user_ids), config.batch_size):
+        Profile.objects.bulk_create(
+            [
+                Profile(
+                    user_id=user_id,
+                    bio=f"Synthetic user {user_id}",
+                    age_group=rng.choice(AGE_GROUPS),
+                    location_country=rng.choice(COUNTRIES),
+                )
+                for user_id in batch
+            ]
+        )
+    return user_ids
+
+
+def _degrees(config: SyntheticConfig, rng: random.Random) -> List[int]:
+    if config.distribution == "uniform":
+        return [rng.randint(0, 2 * config.degree) for _ in range(config.users)]
+    # Pareto(alpha=2) has mean 2 * scale: a few hubs, most users near the minimum.
+    return [min(config.users - 1, int(rng.paretovariate(2.0) * config.degree / 2)) for _ in range(config.users)]
+
+
+def _create_friendships(
+    config: SyntheticConfig, rng: random.Random, user_ids: List[int]
+) -> Tuple[int, List[List[int]]]:
+    """Write the graph (one row per pair) and return confirmed neighbours by user index."""
+
+    edges: Dict[Tuple[int, int], bool] = {}
+    n = len(user_ids)
+    for a, degree in enumerate(_degrees(config, rng)):
+        # Each user initiates half of its degree; the other half arrives from other users.
+        for _ in range((degree + 1) // 2):
+            b = rng.randrange(n)
+            if a != b and (a, b) not in edges and (b, a) not in edges:
+                edges[(a, b)] = rng.random() < config.confirmed_rate
+
+    neighbours: List[List[int]] = [[] for _ in range(n)]
+    for (a, b), confirmed in edges.items():
+        if confirmed:
+            neighbours[a].append(b)
+            neighbours[b].append(a)
+    for batch in _batches(iter(edges.items()), config.batch_size):
+        with transaction.atomic():
+            Friendship.objects.bulk_create(
+                [
+                    Friendship(from_user_id=user_ids[a], to_user_id=user_ids[b], is_confirmed=confirmed)
+                    for (a, b), confirmed in batch
+                ]
+            )
+    return len(edges), neighbours
+
+
+def _create_questions(config: SyntheticConfig, rng: random.Random, user_ids: List[int]) -> Tuple[int, int]:
+    tags = list(Tag.objects.order_by("pk").values_list("pk", flat=True)) or [None]
+    kinds = [choice for choice, _ in Question.QuestionType.choices]
+    questions = []
+    for i in range(config.questions):
+        kind = rng.choice(kinds)
+        questions.append(
+            Question(
+                author_id=rng.choice(user_ids),
+                text=f"Synthetic question {i}",
+                tag_id=rng.choice(tags),
+                question_type=kind,
+                options=["A", "B", "C", "D"] if kind == Question.QuestionType.MULTIPLE_CHOICE else ["Yes", "No"],
+                is_anonymous=rng.random() < 0.3,
+            )
+        )
+    questions = Question.objects.bulk_create(questions, batch_size=config.batch_size)
+
+    def answers():
+        per_question = min(config.answers_per_question, len(user_ids))
+        for question in questions:
+            for user_id in rng.sample(user_ids, per_question):
+                rating = option = None
+                if question.question_type == Question.QuestionType.RATING:
+                    rating = rng.randint(1, 10)
+                else:
+                    option = rng.randrange(len(question.options))
+                yield Answer(question_id=question.pk, user_id=user_id, selected_option_index=option, rating=rating)
+
+    answered = 0
+    for batch in _batches(answers(), config.batch_size):
+        with transaction.atomic():
+            Answer.objects.bulk_create(batch)
+        answered += len(batch)
+    return len(questions), answered
+
+
+def _rater_counts(config: SyntheticConfig, rng: random.Random, neighbours: List[List[int]]) -> List[int]:
+    """Split the evaluations across raters by a heavy-tailed activity (raters without friends get none)."""
+
+    activity = [rng.lognormvariate(0.0, 1.0) if friends else 0.0 for friends in neighbours]
+    total = sum(activity)
+    if not total:
+        return [0] * len(neighbours)
+    counts = [int(config.evaluations * weight / total) for weight in activity]
+    active = [i for i, weight in enumerate(activity) if weight]
+    for i in range(config.evaluations - sum(counts)):
+        counts[active[i % len(active)]] += 1
+    return counts
+
+
+def _create_evaluations(
+    config: SyntheticConfig,
+    rng: random.Random,
+    user_ids: List[int],
+    neighbours: List[List[int]],
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    criteria = list(Criterion.objects.order_by("pk").values_list("pk", flat=True))
+    counts = _rater_counts(config, rng, neighbours)
+    gate = min_outbound()
+    active = {user_ids[i] for i, count in enumerate(counts) if count >= gate}
+
+    quality = [rng.gauss(3.0, 0.7) for _ in user_ids]
+    criterion_bias = {criterion_id: rng.gauss(0.0, 0.3) for criterion_id in criteria}
+    leniency = [rng.gauss(0.0, config.leniency) for _ in user_ids]
+    now = timezone.now()
+    span = config.days * 86400
+
+    pairs: Dict[Tuple[int, int], List[float]] = {}
+    moments: Dict[int, _Moments] = {}
+
+    def rows():
+        for rater, count in enumerate(counts):
+            rater_id = user_ids[rater]
+            stats = moments.setdefault(rater_id, _Moments()) if count else None
+            for _ in range(count):
+                subject = rng.choice(neighbours[rater])
+                criterion_id = rng.choice(criteria)
+                raw = quality[subject] + criterion_bias[criterion_id] + leniency[rater] + rng.gauss(0.0, config.noise)
+                score = min(5, max(1, round(raw)))
+                subject_id = user_ids[subject]
+                stats.add(score)
+                aggregate = pairs.setdefault((subject_id, criterion_id), [0, 0.0, 0.0])
+                aggregate[0] += 1
+                aggregate[1] += score
+                aggregate[2] += score * score
+                yield Evaluation(
+                    evaluator_id=rater_id,
+                    subject_id=subject_id,
+                    criterion_id=criterion_id,
+                    score=score,
+                    familiarity=rng.randint(1, 5),
+                    created_at=now - timedelta(seconds=rng.randrange(span or 1)),
+                    is_active=subject_id in active,
+                )
+
+    written = 0
+    for batch in _batches(rows(), config.batch_size):
+        # auto_now_add stamps created_at on insert; the drawn timestamps go back in with one bulk UPDATE.
+        created = [evaluation.created_at for evaluation in batch]
+        with transaction.atomic():
+            Evaluation.objects.bulk_create(batch)
+            for evaluation, created_at in zip(batch, created):
+                evaluation.created_at = created_at
+            Evaluation.objects.bulk_update(batch, ["created_at"])
+            EvaluationMeta.objects.bulk_create(
+                [
+                    EvaluationMeta(
+                        evaluation_id=evaluation.pk,
+                        status=EvaluationMeta.STATUS_ACTIVE if evaluation.is_active else EvaluationMeta.STATUS_PENDING,
+                    )
+                    for evaluation in batch
+                ]
+            )
+        written += len(batch)
+        if progress:
+            progress(written)
+
+    PairConsensus.objects.bulk_create(
+        (
+            PairConsensus(
+                subject_id=subject_id,
+                criterion_id=criterion_id,
+                score_count=count,
+                score_sum=total,
+                score_sq_sum=squares,
+            )
+            for (subject_id, criterion_id), (count, total, squares) in pairs.items()
+        ),
+        batch_size=config.batch_size,
+    )
+    RaterStats.objects.bulk_create(
+        (
+            RaterStats(
+                user_id=rater_id,
+                ratings_count=stats.count,
+                outbound_count=stats.count,
+                mean_score=stats.mean,
+                m2=stats.m2,
+                std_score=(stats.m2 / stats.count) ** 0.5,
+                extreme_rate=stats.extreme / stats.count,
+            )
+            for rater_id, stats in moments.items()
+        ),
+        batch_size=config.batch_size,
+    )
+    return written
+
+
+def _rebuild_derived(user_ids: List[int]) -> None:
+    # Chunked so no id list outgrows the backend's bound-parameter limit at any user count.
+    for start in range(0, len(user_ids), WEIGHT_UPDATE_CHUNK):
+        chunk = user_ids[start : start + WEIGHT_UPDATE_CHUNK]
+        recompute_rater_weights(chunk)
+        # Mirror the fresh weight, as the create path does.
+        RaterStats.objects.filter(user_id__in=chunk).update(
+            reliability=Coalesce(
+                Subquery(Evaluation.objects.filter(evaluator_id=OuterRef("user_id")).values("reliability_weight")[:1]),
+                F("reliability"),
+            )
+        )
+        rebuild_pending_tasks(evaluator_ids=chunk)
+        refresh_subject_summaries(chunk)
+
+
+def generate(
+    config: SyntheticConfig,
+    rebuild: bool = True,
+    progress: Optional[Callable[[int], None]] = None,
+) -> SyntheticReport:
+    """
+    Write the dataset described by ``config``. ``rebuild=False`` skips the maintained tables that are
+    rebuilt after the insert (deviations, weights, PendingTask rows and subject summaries), for
+    runs that only need the raw rows. ``progress`` is called with the evaluation count after each batch.
+    """
+
+    if config.distribution not in DEGREE_DISTRIBUTIONS:
+        raise ValueError(f"distribution must be one of {', '.join(DEGREE_DISTRIBUTIONS)}.")
+    if config.users < 2:
+        raise ValueError("At least two users are needed.")
+    if not connection.features.can_return_rows_from_bulk_insert:
+        raise ValueError("The database backend must return primary keys from bulk inserts.")
+    if get_user_model().objects.filter(username__startswith=config.prefix).exists():
+        raise ValueError(f"Users with the prefix {config.prefix!r} already exist.")
+
+    started = time.perf_counter()
+    rng = random.Random(config.seed)
+    for name in DEFAULT_CRITERIA:
+        Criterion.objects.get_or_create(name=name)
+
+    user_ids = _create_users(config, rng)
+    friendships, neighbours = _create_friendships(config, rng, user_ids)
+    questions, answers = _create_questions(config, rng, user_ids)
+    evaluations = _create_evaluations(config, rng, user_ids, neighbours, progress)
+    if rebuild:
+        _rebuild_derived(user_ids)
+
+    return SyntheticReport(
+        users=len(user_ids),
+        friendships=friendships,
+        questions=questions,
+        answers=answers,
+        evaluations=evaluations,
+        seconds=time.perf_counter() - started,
+    )
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.db import models
+
+
+class PendingTask(models.Model):
+    """
+    Materialized due-task queue: one row per (evaluator, subject, criterion).
+
+    next_due_at is the last rating's created_at + EVALUATIONS_REPEAT_DAYS (or the time the row
+    appeared for never-rated pairs), so the tasks view is a range scan and the create cooldown is a
+    unique-key lookup. ``active`` is True while evaluator and subject are confirmed friends; rows for rated
+    non-friends are kept (inactive) because they still carry the cooldown.
+    Maintained by evaluations.signals; ``manage.py rebuild_pending_tasks`` recomputes it (also
+    needed after changing EVALUATIONS_REPEAT_DAYS, which is stamped into next_due_at).
+    """
+
+    evaluator = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="pending_tasks",
+    )
+    subject = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    criterion = models.ForeignKey(
+        "evaluations.Criterion",
+        on_delete=models.CASCADE,
+        related_name="pending_tasks",
+    )
+    next_due_at = models.DateTimeField()
+    last_rated_at = models.DateTimeField(null=True, blank=True)
+    active = models.BooleanField(default=False)
+
+    class Meta:
+        verbose_name = "Pending Task"
+        verbose_name_plural = "Pending Tasks"
+        constraints = [
+            models.UniqueConstraint(fields=["evaluator", "subject", "criterion"], name="uniq_pending_task"),
+        ]
+        indexes = [
+            models.Index(fields=["evaluator", "active", "next_due_at"], name="pending_task_due_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"PendingTask<{self.evaluator_id}:{self.subject_id}:{self.criterion_id}>"
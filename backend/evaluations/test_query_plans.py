@@ -0,0 +1,106 @@
+"""
+Query-plan regression tests: each hot query must be answered from an index on SQLite.
+
+EXPLAIN QUERY PLAN reports "SCAN <table>" for a full table (or full index) scan and
+"SEARCH <table> USING ... INDEX" for an index lookup; any SCAN of a table fails the test.
+"""
+
+from __future__ import annotations
+
+from django.db import connection
+from django.db.models import Max
+from django.test import TestCase
+from django.utils import timezone
+
+from evaluations.consensus_models import PairConsensus
+from evaluations.deviation_models import RaterPairContribution
+from evaluations.meta_models import EvaluationMeta
+from evaluations.models import Evaluation
+from evaluations.task_models import PendingTask
+from userprofiles.models import Friendship
+
+
+class QueryPlanTests(TestCase):
+    def setUp(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("Reads SQLite EXPLAIN QUERY PLAN output.")
+
+    def _plan(self, queryset):
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            return [row[-1] for row in cursor.fetchall()]
+
+    def assertNoFullScan(self, queryset):
+        plan = self._plan(queryset)
+        scans = [step for step in plan if step.startswith("SCAN ")]
+        self.assertFalse(scans, "Full scan in query plan:\n" + "\n".join(plan))
+        return plan
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = self.assertNoFullScan(queryset)
+        self.assertTrue(any(index_name in step for step in plan), "\n".join(plan))
+
+    def test_last_rating_per_rater_pair(self):
+        # pending_tasks.refresh_after_delete
+        self.assertUsesIndex(
+            Evaluation.objects.filter(evaluator_id=1, subject_id=2, criterion_id=3)
+            .values("evaluator_id")
+            .annotate(last=Max("created_at")),
+            "COVERING INDEX evaluation_rater_pair_idx",
+        )
+
+    def test_pair_evaluations(self):
+        # deviations.apply_pair_deviations
+        self.assertUsesIndex(
+            Evaluation.objects.filter(subject_id=2, criterion_id=3).values_list(
+                "evaluator_id", "subject_id", "criterion_id", "score"
+            ),
+            "COVERING INDEX evaluation_pair_score_idx",
+        )
+
+    def test_rater_scores(self):
+        # Rater moments and deviation resyncs
+        self.assertUsesIndex(
+            Evaluation.objects.filter(evaluator_id__in=[1, 2]).values_list("score", flat=True),
+            "COVERING INDEX evaluation_rater_score_idx",
+        )
+        self.assertNoFullScan(
+            Evaluation.objects.filter(evaluator_id__in=[1, 2]).values_list("subject_id", "criterion_id", "score")
+        )
+
+    def test_active_subject_aggregate(self):
+        # subject_summaries._active_evaluations for one subject
+        self.assertNoFullScan(
+            Evaluation.objects.filter(is_active=True, subject_id=2).values("criterion_id").annotate(last=Max("score"))
+        )
+
+    def test_meta_status_join(self):
+        self.assertNoFullScan(
+            Evaluation.objects.filter(evaluationmeta__status=EvaluationMeta.STATUS_ACTIVE, subject_id=2).values_list(
+                "criterion_id", "score"
+            )
+        )
+        self.assertUsesIndex(
+            EvaluationMeta.objects.filter(status=EvaluationMeta.STATUS_ACTIVE).values_list("evaluation_id", flat=True),
+            "COVERING INDEX evaluation_meta_status_idx",
+        )
+
+    def test_consensus_and_contributions_by_pair(self):
+        self.assertNoFullScan(
+            PairConsensus.objects.filter(subject_id__in=[1, 2], criterion_id__in=[3], score_count__gt=0)
+        )
+        self.assertNoFullScan(RaterPairContribution.objects.filter(subject_id=2, criterion_id=3))
+
+    def test_due_tasks(self):
+        self.assertNoFullScan(PendingTask.objects.filter(evaluator_id=1, active=True, next_due_at__lte=timezone.now()))
+
+    def test_confirmed_friends_both_directions(self):
+        self.assertUsesIndex(
+            Friendship.objects.filter(from_user_id=1, is_confirmed=True).values_list("to_user_id", flat=True),
+            "friendship_from_confirmed_idx",
+        )
+        self.assertUsesIndex(
+            Friendship.objects.filter(to_user_id=1, is_confirmed=True).values_list("from_user_id", flat=True),
+            "friendship_to_confirmed_idx",
+        )
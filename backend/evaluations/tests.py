@@ -1,19 +1,71 @@
+import json
+import os
+import sqlite3
+import tempfile
 from datetime import timedelta
+from io import StringIO
+from statistics import mean, pstdev
+from unittest import mock
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection, transaction
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
-from rest_framework.test import APITestCase
+from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
 
+from evaluations.activation import min_outbound
+from evaluations.benchmarks import BENCHMARKS, compare_results, run_benchmarks
+from evaluations.consensus_models import PairConsensus
+from evaluations.deviation_models import RaterDeviation
+from evaluations.deviations import apply_pair_deviations, check_rater_deviations
 from evaluations.meta_models import EvaluationMeta
 from evaluations.models import Criterion, Evaluation
-from evaluations.rater_models import RaterStats
-from evaluations.views import REPEAT_DAYS
+from evaluations.pending_tasks import rebuild_pending_tasks, repeat_days
+from evaluations.queue_models import DirtyPair, DirtyRater
+from evaluations.rater_models import RaterStats, RaterStatsWatermark
+from evaluations.rater_stats import EvaluationFields, compute_sharded
+from evaluations.signals import (
+    _build_consensus_map,
+    _refresh_pair_raters,
+    apply_rater_weights,
+    defer_rater_weight_updates,
+    dirty_rater_backlog,
+    drain_dirty_pairs,
+    drain_dirty_raters,
+    mark_raters_dirty,
+    recompute_rater_weights,
+    resync_stale_raters,
+)
+from evaluations.subject_summaries import check_subject_summaries
+from evaluations.summary_cache import (
+    bump_generations,
+    single_flight,
+    subject_generations,
+    summary_cache_key,
+    summary_cache_stats,
+)
+from evaluations.summary_models import SubjectCriterionSummary
+from evaluations.synthetic import SyntheticConfig, generate
+from evaluations.task_models import PendingTask
+from evaluations.views import EvaluationSummaryView
+from evaluations.writes import create_evaluation
 from userprofiles.models import Friendship
 
 
+def backdate_evaluations(queryset, days=None):
+    """Move evaluations past the cooldown window and re-derive their PendingTask rows."""
+
+    days = repeat_days() + 1 if days is None else days
+    evaluator_ids = set(queryset.values_list("evaluator_id", flat=True))
+    queryset.update(created_at=timezone.now() - timedelta(days=days))
+    rebuild_pending_tasks(evaluator_ids=evaluator_ids)
+
+
 class EvaluationTasksViewTests(APITestCase):
     def setUp(self):
         User = get_user_model()
@@ -54,17 +106,72 @@ class EvaluationTasksViewTests(APITestCase):
         self.assertNotIn((self.friend.id, self.criterion.id), pairs)
 
         # Backdate the evaluation beyond repeat interval, expect requeue
-        Evaluation.objects.filter(
-            evaluator=self.user,
-            subject=self.friend,
-            criterion=self.criterion,
-        ).update(created_at=timezone.now() - timedelta(days=REPEAT_DAYS + 1))
+        backdate_evaluations(
+            Evaluation.objects.filter(
+                evaluator=self.user,
+                subject=self.friend,
+                criterion=self.criterion,
+            )
+        )
 
         response = self.client.get(reverse("evaluation-tasks"))
         tasks = response.data["tasks"]
         pairs = {(t["subjectId"], t["criterionId"]) for t in tasks}
         self.assertIn((self.friend.id, self.criterion.id), pairs)
 
+    def test_tasks_query_count_is_constant(self):
+        User = get_user_model()
+        for name in ("Warmth", "Humor", "Focus"):
+            Criterion.objects.create(name=name)
+        self._auth()
+
+        def queries_with_friends(count):
+            for i in range(count):
+                friend = User.objects.create_user(username=f"f{count}-{i}", email=f"f{count}-{i}@example.com")
+                Friendship.objects.create(from_user=self.user, to_user=friend, is_confirmed=True)
+                Evaluation.objects.create(evaluator=self.user, subject=friend, criterion=self.criterion, score=3)
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(reverse("evaluation-tasks"))
+            self.assertEqual(response.status_code, 200)
+            return len(ctx.captured_queries), response.data["tasks"]
+
+        few, _ = queries_with_friends(2)
+        many, tasks = queries_with_friends(10)
+        self.assertEqual(few, many)
+        # 12 friends x 4 criteria minus the 12 recently rated (friend, Kindness) pairs
+        self.assertEqual(len(tasks), 36)
+        self.assertTrue(all(t["firstTime"] for t in tasks))
+
+    def test_seeded_paging_is_stable(self):
+        User = get_user_model()
+        for i in range(5):
+            friend = User.objects.create_user(username=f"pal{i}", email=f"pal{i}@example.com")
+            Friendship.objects.create(from_user=friend, to_user=self.user, is_confirmed=True)
+        Criterion.objects.create(name="Patience")
+        self._auth()
+        url = reverse("evaluation-tasks")
+
+        full = self.client.get(url, {"seed": 42}).data
+        self.assertEqual(full["total"], 10)
+        self.assertIsNone(full["nextOffset"])
+
+        pages, offset = [], 0
+        while offset is not None:
+            page = self.client.get(url, {"seed": 42, "limit": 4, "offset": offset}).data
+            self.assertEqual(page["seed"], 42)
+            pages.extend(page["tasks"])
+            offset = page["nextOffset"]
+        self.assertEqual(pages, full["tasks"])
+
+        generated = self.client.get(url, {"limit": 3}).data
+        self.assertEqual(len(generated["tasks"]), 3)
+        self.assertEqual(generated["nextOffset"], 3)
+        replay = self.client.get(url, {"seed": generated["seed"], "limit": 3}).data
+        self.assertEqual(generated["tasks"], replay["tasks"])
+
+        self.assertEqual(self.client.get(url, {"limit": 0}).status_code, 400)
+        self.assertEqual(self.client.get(url, {"seed": "x"}).status_code, 400)
+
     def test_repeat_evaluation_allowed_after_cooldown(self):
         Friendship.objects.create(from_user=self.user, to_user=self.friend, is_confirmed=True)
         self._auth()
@@ -80,11 +187,13 @@ class EvaluationTasksViewTests(APITestCase):
         response = self.client.post(url, data)
         self.assertEqual(response.status_code, 201)
 
-        Evaluation.objects.filter(
-            evaluator=self.user,
-            subject=self.friend,
-            criterion=self.criterion,
-        ).update(created_at=timezone.now() - timedelta(days=REPEAT_DAYS + 1))
+        backdate_evaluations(
+            Evaluation.objects.filter(
+                evaluator=self.user,
+                subject=self.friend,
+                criterion=self.criterion,
+            )
+        )
 
         data2 = {
             "subject_id": self.friend.id,
@@ -137,6 +246,32 @@ class EvaluationWeightsTests(APITestCase):
         self.assertAlmostEqual(eval_peer.reliability_weight, 0.5)
         self.assertAlmostEqual(eval_peer.extreme_rate_weight, 0.5)
 
+    def test_set_based_recompute_uses_constant_queries(self):
+        User = get_user_model()
+        other_criterion = Criterion.objects.create(name="Warmth")
+        raters = [self.rater, self.peer] + [
+            User.objects.create_user(username=f"extra{i}", email=f"extra{i}@example.com", password="pw")
+            for i in range(4)
+        ]
+        scores = [5, 3, 1, 4, 2, 5]
+        with override_settings(EVALUATIONS_WEIGHTS_SYNC=False):
+            for rater, score in zip(raters, scores):
+                Evaluation.objects.create(evaluator=rater, subject=self.subject, criterion=self.criterion, score=score)
+            Evaluation.objects.create(evaluator=self.rater, subject=self.peer, criterion=other_criterion, score=2)
+            Evaluation.objects.create(evaluator=raters[2], subject=self.peer, criterion=other_criterion, score=4)
+
+        with self.assertNumQueries(9):
+            updated = recompute_rater_weights([r.id for r in raters] + [None])
+        self.assertEqual(updated, len(raters))
+
+        # Primary rater: |5 - 10/3| on the shared pair and |2 - 3| on the second pair.
+        expected_deviation = (abs(5 - 20 / 6) + 1.0) / 2
+        for ev in Evaluation.objects.filter(evaluator=self.rater):
+            self.assertAlmostEqual(ev.reliability_weight, 1.0 / (1.0 + expected_deviation))
+            self.assertAlmostEqual(ev.extreme_rate_weight, 0.75)
+            self.assertAlmostEqual(ev.objectivity_score, 0.75 / (1.0 + expected_deviation))
+            self.assertFalse(ev.pending)
+
     @override_settings(EVALUATIONS_MIN_RATINGS=1)
     def test_summary_v2_uses_evaluation_weights(self):
         Evaluation.objects.create(
@@ -154,6 +289,8 @@ class EvaluationWeightsTests(APITestCase):
 
         Evaluation.objects.filter(score=4).update(reliability_weight=1.0, extreme_rate_weight=1.0)
         Evaluation.objects.filter(score=2).update(reliability_weight=0.5, extreme_rate_weight=0.5)
+        # Pin both raters' moments so the derived z-scores are +1 and -1.
+        RaterStats.objects.filter(user__in=[self.rater, self.peer]).update(mean_score=3.0, std_score=1.0)
 
         high_eval = Evaluation.objects.get(score=4)
         low_eval = Evaluation.objects.get(score=2)
@@ -166,10 +303,6 @@ class EvaluationWeightsTests(APITestCase):
             status=EvaluationMeta.STATUS_ACTIVE,
         )
 
-        # Normalize the scores manually so the summary can verify aggregation logic.
-        Evaluation.objects.filter(pk=high_eval.pk).update(normalized_score=1.0)
-        Evaluation.objects.filter(pk=low_eval.pk).update(normalized_score=-1.0)
-
         response = self.client.get(reverse("evaluations:evaluation-summary-v2"))
         self.assertEqual(response.status_code, 200)
 
@@ -180,6 +313,108 @@ class EvaluationWeightsTests(APITestCase):
         self.assertEqual(payload[0]["raw_count"], 2)
 
 
+class PendingTaskTests(APITestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.user = User.objects.create_user(username="rater", email="rater@example.com", password="pw")
+        self.friend = User.objects.create_user(username="friend", email="friend@example.com", password="pw")
+        self.criterion = Criterion.objects.create(name="Kindness")
+
+    def _snapshot(self):
+        return sorted(
+            PendingTask.objects.values_list(
+                "evaluator_id", "subject_id", "criterion_id", "active", "last_rated_at", "next_due_at"
+            )
+        )
+
+    def test_queue_follows_friendships_criteria_and_evaluations(self):
+        friendship = Friendship.objects.create(from_user=self.user, to_user=self.friend, is_confirmed=False)
+        self.assertFalse(PendingTask.objects.exists())
+
+        friendship.is_confirmed = True
+        friendship.save()
+        self.assertEqual(PendingTask.objects.filter(active=True).count(), 2)
+
+        other = Criterion.objects.create(name="Humor")
+        self.assertEqual(PendingTask.objects.filter(criterion=other, active=True).count(), 2)
+
+        evaluation = Evaluation.objects.create(
+            evaluator=self.user, subject=self.friend, criterion=self.criterion, score=4
+        )
+        task = PendingTask.objects.get(evaluator=self.user, subject=self.friend, criterion=self.criterion)
+        self.assertEqual(task.last_rated_at, evaluation.created_at)
+        self.assertEqual(task.next_due_at, evaluation.created_at + timedelta(days=repeat_days()))
+
+        self.client.force_authenticate(user=self.user)
+        with self.assertNumQueries(1):
+            tasks = self.client.get(reverse("evaluation-tasks")).data["tasks"]
+        self.assertEqual({(t["subjectId"], t["criterionId"]) for t in tasks}, {(self.friend.id, other.id)})
+
+        friendship.delete()
+        self.assertFalse(PendingTask.objects.filter(active=True).exists())
+        # The cooldown survives the unfriending.
+        self.assertTrue(PendingTask.objects.filter(evaluator=self.user, next_due_at__gt=timezone.now()).exists())
+
+        evaluation.delete()
+        task.refresh_from_db()
+        self.assertIsNone(task.last_rated_at)
+        self.assertLessEqual(task.next_due_at, timezone.now())
+
+    def test_cooldown_applies_without_friendship(self):
+        self.client.force_authenticate(user=self.user)
+        url = reverse("evaluation-create") + f"?subject_id={self.friend.id}"
+        payload = {"subject_id": self.friend.id, "criterion_id": self.criterion.id, "score": 3}
+        self.assertEqual(self.client.post(url, payload).status_code, 201)
+        self.assertEqual(self.client.post(url, payload).status_code, 400)
+        self.assertFalse(PendingTask.objects.get(evaluator=self.user).active)
+
+    def test_rebuild_command_matches_incremental_state(self):
+        User = get_user_model()
+        peer = User.objects.create_user(username="peer", email="peer@example.com", password="pw")
+        Friendship.objects.create(from_user=self.user, to_user=self.friend, is_confirmed=True)
+        Friendship.objects.create(from_user=peer, to_user=self.user, is_confirmed=True)
+        Criterion.objects.create(name="Focus")
+        Evaluation.objects.create(evaluator=self.user, subject=self.friend, criterion=self.criterion, score=4)
+        Evaluation.objects.create(evaluator=peer, subject=self.friend, criterion=self.criterion, score=2)
+
+        incremental = self._snapshot()
+        PendingTask.objects.all().delete()
+
+        out = StringIO()
+        call_command("rebuild_pending_tasks", stdout=out)
+        self.assertIn(f"Rebuilt {len(incremental)} pending tasks.", out.getvalue())
+        rebuilt = self._snapshot()
+
+        # Never-rated rows are stamped "due now" at insert time; compare everything else exactly.
+        self.assertEqual([row[:5] for row in rebuilt], [row[:5] for row in incremental])
+        for before, after in zip(incremental, rebuilt):
+            if before[4] is not None:
+                self.assertEqual(before[5], after[5])
+
+        call_command("rebuild_pending_tasks", "--user", str(peer.id), stdout=StringIO())
+        self.assertEqual([row[:5] for row in self._snapshot()], [row[:5] for row in incremental])
+
+    def test_cooldown_setting_is_read_per_write_and_applied_by_rebuild(self):
+        def due_at():
+            return PendingTask.objects.get(
+                evaluator=self.user, subject=self.friend, criterion=self.criterion
+            ).next_due_at
+
+        evaluation = Evaluation.objects.create(
+            evaluator=self.user, subject=self.friend, criterion=self.criterion, score=4
+        )
+        self.assertEqual(due_at(), evaluation.created_at + timedelta(days=repeat_days()))
+
+        with override_settings(EVALUATIONS_REPEAT_DAYS=2):
+            call_command("rebuild_pending_tasks", stdout=StringIO())
+            self.assertEqual(due_at(), evaluation.created_at + timedelta(days=2))
+
+            later = Evaluation.objects.create(
+                evaluator=self.user, subject=self.friend, criterion=self.criterion, score=3
+            )
+            self.assertEqual(due_at(), later.created_at + timedelta(days=2))
+
+
 class EvaluationCreateNormalizationTests(APITestCase):
     def setUp(self):
         User = get_user_model()
@@ -203,7 +438,7 @@ class EvaluationCreateNormalizationTests(APITestCase):
         response = self.client.post(url, first_payload)
         self.assertEqual(response.status_code, 201)
 
-        first_eval = Evaluation.objects.get(evaluator=self.rater, subject=self.subject)
+        first_eval = Evaluation.objects.with_normalization().get(evaluator=self.rater, subject=self.subject)
         self.assertAlmostEqual(first_eval.rater_mean, 4.0)
         self.assertAlmostEqual(first_eval.rater_stddev, 0.0)
         self.assertAlmostEqual(first_eval.normalized_score, 0.0)
@@ -217,7 +452,7 @@ class EvaluationCreateNormalizationTests(APITestCase):
         response = self.client.post(second_url, second_payload)
         self.assertEqual(response.status_code, 201)
 
-        evals = Evaluation.objects.filter(evaluator=self.rater).order_by("id")
+        evals = Evaluation.objects.with_normalization().filter(evaluator=self.rater).order_by("id")
         self.assertEqual(evals.count(), 2)
 
         expected_mean = 3.0
@@ -235,6 +470,480 @@ class EvaluationCreateNormalizationTests(APITestCase):
         self.assertAlmostEqual(stats.extreme_rate, 0.0)
         self.assertGreater(stats.reliability, 0.0)
 
+    @override_settings(EVALUATIONS_WEIGHTS_SYNC=False)
+    def test_submission_write_amplification_is_independent_of_history(self):
+        """Rows written by one submission stay flat as the rater's history grows (no per-row rewrite)."""
+        if connection.vendor != "sqlite":
+            self.skipTest("Counts written rows via sqlite3 total_changes.")
+        self._auth()
+        User = get_user_model()
+
+        def rows_written(username):
+            subject = User.objects.create_user(username=username, email=f"{username}@example.com", password="pw")
+            url = reverse("evaluation-create") + f"?subject_id={subject.id}"
+            payload = {"subject_id": subject.id, "criterion_id": self.criterion.id, "score": 3}
+            connection.ensure_connection()
+            before = connection.connection.total_changes
+            response = self.client.post(url, payload)
+            self.assertEqual(response.status_code, 201)
+            return connection.connection.total_changes - before
+
+        rows_written("warmup")
+        short_history = rows_written("short")
+
+        criteria = [Criterion.objects.create(name=f"History {i}") for i in range(50)]
+        Evaluation.objects.bulk_create(
+            Evaluation(evaluator=self.rater, subject=self.other_subject, criterion=c, score=3) for c in criteria
+        )
+        long_history = rows_written("long")
+
+        self.assertEqual(long_history, short_history)
+        # Includes the RaterPairContribution insert and RaterDeviation update of the accumulators.
+        self.assertLess(long_history, 12)
+
+
+class RaterMomentsTests(APITestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.rater = User.objects.create_user(username="rater", email="rater@example.com", password="pw")
+        self.subjects = [
+            User.objects.create_user(username=f"subject{i}", email=f"subject{i}@example.com", password="pw")
+            for i in range(40)
+        ]
+        self.criterion = Criterion.objects.create(name="Tact")
+        cache.clear()  # summary-v2 responses are page-cached
+
+    def _assert_stats_match(self, scores):
+        stats = RaterStats.objects.get(user=self.rater)
+        self.assertEqual(stats.ratings_count, len(scores))
+        self.assertAlmostEqual(stats.mean_score, mean(scores))
+        self.assertAlmostEqual(stats.std_score, pstdev(scores))
+        self.assertAlmostEqual(stats.m2, pstdev(scores) ** 2 * len(scores))
+        self.assertAlmostEqual(stats.extreme_rate, sum(1 for s in scores if s <= 1 or s >= 10) / len(scores))
+
+    def test_running_moments_follow_create_update_and_delete(self):
+        evals = [
+            Evaluation.objects.create(evaluator=self.rater, subject=subject, criterion=self.criterion, score=score)
+            for subject, score in zip(self.subjects, [4, 2, 10, 5, 1])
+        ]
+        self._assert_stats_match([4, 2, 10, 5, 1])
+
+        evals[0].score = 3
+        evals[0].save()
+        self._assert_stats_match([3, 2, 10, 5, 1])
+
+        evals[2].delete()
+        self._assert_stats_match([3, 2, 5, 1])
+
+        for ev in evals[:2] + evals[3:]:
+            ev.delete()
+        stats = RaterStats.objects.get(user=self.rater)
+        self.assertEqual((stats.ratings_count, stats.mean_score, stats.m2, stats.std_score), (0, 0.0, 0.0, 0.0))
+
+    def _post_query_count(self, subject):
+        url = reverse("evaluation-create") + f"?subject_id={subject.id}"
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(url, {"criterion_id": self.criterion.id, "score": 3})
+        self.assertEqual(response.status_code, 201)
+        return len(ctx.captured_queries)
+
+    def test_create_query_count_does_not_grow_with_history(self):
+        self.client.force_authenticate(user=self.rater)
+        with override_settings(EVALUATIONS_WEIGHTS_SYNC=False):
+            self._post_query_count(self.subjects[0])
+            baseline = self._post_query_count(self.subjects[1])
+            for subject in self.subjects[2:30]:
+                Evaluation.objects.create(evaluator=self.rater, subject=subject, criterion=self.criterion, score=4)
+            self.assertEqual(self._post_query_count(self.subjects[30]), baseline)
+
+
+class DeferredWeightUpdateTests(APITestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.raters = [
+            User.objects.create_user(username=f"dw{i}", email=f"dw{i}@example.com", password="pw") for i in range(4)
+        ]
+        self.subject = User.objects.create_user(username="dws", email="dws@example.com", password="pw")
+        self.criterion = Criterion.objects.create(name="Warmth")
+
+    def _weights(self):
+        return dict(Evaluation.objects.order_by("pk").values_list("pk", "reliability_weight"))
+
+    def test_block_runs_one_batched_recompute_matching_per_row_updates(self):
+        for rater, score in zip(self.raters, [1, 3, 4, 5]):
+            Evaluation.objects.create(evaluator=rater, subject=self.subject, criterion=self.criterion, score=score)
+        expected = self._weights()
+        Evaluation.objects.all().delete()
+
+        with mock.patch("evaluations.signals.apply_rater_weights", wraps=apply_rater_weights) as recompute:
+            with defer_rater_weight_updates():
+                for rater, score in zip(self.raters, [1, 3, 4, 5]):
+                    Evaluation.objects.create(
+                        evaluator=rater, subject=self.subject, criterion=self.criterion, score=score
+                    )
+                with defer_rater_weight_updates():  # nested blocks flush with the outermost one
+                    Evaluation.objects.create(
+                        evaluator=self.raters[0], subject=self.raters[1], criterion=self.criterion, score=2
+                    )
+                    Evaluation.objects.filter(subject=self.raters[1]).delete()
+                self.assertEqual(recompute.call_count, 0)
+        recompute.assert_called_once()
+        self.assertEqual(sorted(recompute.call_args.args[0]), sorted(r.id for r in self.raters))
+        self.assertEqual(list(self._weights().values()), list(expected.values()))
+
+    def test_failed_block_queues_committed_writes_and_keeps_the_error(self):
+        pair = (self.subject.id, self.criterion.id)
+        with mock.patch("evaluations.signals.apply_rater_weights", wraps=apply_rater_weights) as recompute:
+            # Rolled back together with its writes: nothing is queued.
+            with self.captureOnCommitCallbacks(execute=True):
+                with self.assertRaises(ValueError):
+                    with transaction.atomic(), defer_rater_weight_updates():
+                        Evaluation.objects.create(
+                            evaluator=self.raters[0], subject=self.subject, criterion=self.criterion, score=3
+                        )
+                        raise ValueError("bulk write failed")
+            self.assertFalse(DirtyPair.objects.exists())
+
+            # The write survives the failure (the transaction around it commits): its pair is queued.
+            with self.captureOnCommitCallbacks(execute=True):
+                with self.assertRaises(ValueError):
+                    with defer_rater_weight_updates():
+                        Evaluation.objects.create(
+                            evaluator=self.raters[2], subject=self.subject, criterion=self.criterion, score=5
+                        )
+                        raise ValueError("bulk write failed")
+            recompute.assert_not_called()
+            self.assertEqual(list(DirtyPair.objects.values_list("subject_id", "criterion_id")), [pair])
+            call_command("process_dirty_raters", stdout=StringIO())
+            self.assertIsNotNone(Evaluation.objects.get(evaluator=self.raters[2]).reliability_weight)
+            recompute.reset_mock()
+
+            with defer_rater_weight_updates():
+                Evaluation.objects.create(
+                    evaluator=self.raters[1], subject=self.subject, criterion=self.criterion, score=4
+                )
+        recompute.assert_called_once()
+        # The new score moves the shared pair's consensus, so the surviving rater is reweighted too.
+        self.assertEqual(sorted(recompute.call_args.args[0]), [self.raters[1].id, self.raters[2].id])
+
+
+class RaterDeviationTests(APITestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.raters = [
+            User.objects.create_user(username=f"rd{i}", email=f"rd{i}@example.com", password="pw") for i in range(4)
+        ]
+        self.subjects = [
+            User.objects.create_user(username=f"rds{i}", email=f"rds{i}@example.com", password="pw") for i in range(2)
+        ]
+        self.criteria = [Criterion.objects.create(name="Patience"), Criterion.objects.create(name="Tact")]
+
+    def _weights(self):
+        return {
+            pk: (reliability, extremity)
+            for pk, reliability, extremity in Evaluation.objects.values_list(
+                "pk", "reliability_weight", "extreme_rate_weight"
+            )
+        }
+
+    def test_delta_updates_match_exact_recompute(self):
+        evaluations = []
+        for index, rater in enumerate(self.raters):
+            for subject in self.subjects:
+                for criterion in self.criteria:
+                    evaluations.append(
+                        Evaluation.objects.create(
+                            evaluator=rater,
+                            subject=subject,
+                            criterion=criterion,
+                            score=1 + (index * 3 + subject.id) % 5,
+                        )
+                    )
+        evaluations[0].score = 5
+        evaluations[0].save()
+        evaluations[1].criterion = self.criteria[0]  # moves to another pair
+        evaluations[1].save()
+        evaluations[5].delete()
+        Evaluation.objects.filter(evaluator=self.raters[3], subject=self.subjects[1]).delete()
+
+        self.assertEqual(check_rater_deviations(), [])
+        weights = self._weights()
+        recompute_rater_weights([rater.id for rater in self.raters])
+        for pk, (reliability, extremity) in self._weights().items():
+            self.assertAlmostEqual(weights[pk][0], reliability)
+            self.assertAlmostEqual(weights[pk][1], extremity)
+
+    def test_pair_update_queries_do_not_grow_with_history(self):
+        def rate_and_count(score):
+            with CaptureQueriesContext(connection) as ctx:
+                Evaluation.objects.create(
+                    evaluator=self.raters[0], subject=self.subjects[0], criterion=self.criteria[0], score=score
+                )
+            return len(ctx.captured_queries)
+
+        rate_and_count(3)
+        baseline = rate_and_count(4)
+        for subject in self.subjects[1:]:
+            for criterion in self.criteria:
+                Evaluation.objects.create(evaluator=self.raters[0], subject=subject, criterion=criterion, score=2)
+        Evaluation.objects.create(evaluator=self.raters[0], subject=self.raters[1], criterion=self.criteria[1], score=4)
+        self.assertEqual(rate_and_count(5), baseline)
+
+    def test_command_detects_and_repairs_drift(self):
+        for rater, score in zip(self.raters, [1, 2, 4, 5]):
+            Evaluation.objects.create(
+                evaluator=rater, subject=self.subjects[0], criterion=self.criteria[0], score=score
+            )
+        call_command("resync_rater_deviations", "--check", stdout=StringIO())
+
+        RaterDeviation.objects.filter(rater_id=self.raters[0].id).update(dev_sum=42.0)
+        with self.assertRaises(CommandError):
+            call_command("resync_rater_deviations", "--check", stdout=StringIO())
+
+        out = StringIO()
+        call_command("resync_rater_deviations", stdout=out)
+        self.assertIn("Resynced 4 raters.", out.getvalue())
+        self.assertEqual(check_rater_deviations(), [])
+        self.assertIsNotNone(RaterDeviation.objects.get(rater_id=self.raters[0].id).synced_at)
+
+    def test_worker_resyncs_raters_not_synced_within_the_interval(self):
+        for rater, score in zip(self.raters, [1, 2, 4, 5]):
+            Evaluation.objects.create(
+                evaluator=rater, subject=self.subjects[0], criterion=self.criteria[0], score=score
+            )
+        RaterDeviation.objects.update(synced_at=timezone.now())
+        RaterDeviation.objects.filter(rater_id=self.raters[0].id).update(
+            dev_sum=42.0, synced_at=timezone.now() - timedelta(days=2)
+        )
+
+        DirtyRater.objects.all().delete()
+
+        self.assertEqual(resync_stale_raters(86400), 1)
+        self.assertEqual(check_rater_deviations(), [])
+        self.assertEqual(list(DirtyRater.objects.values_list("rater_id", flat=True)), [self.raters[0].id])
+        self.assertEqual(resync_stale_raters(86400), 0)
+
+
+class PurgeUsersTests(APITestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.raters = [
+            User.objects.create_user(username=f"pu{i}", email=f"pu{i}@example.com", password="pw") for i in range(3)
+        ]
+        self.subjects = [
+            User.objects.create_user(username=f"pus{i}", email=f"pus{i}@example.com", password="pw") for i in range(2)
+        ]
+        self.doomed = User.objects.create_user(username="doomed", email="doomed@example.com", password="pw")
+        self.criterion = Criterion.objects.create(name="Courage")
+        for rater, scores in zip([*self.raters, self.doomed], [(1, 4), (3, 5), (2, 2), (5, 1)]):
+            for subject, score in zip(self.subjects, scores):
+                self._rate(rater, subject, score)
+        for rater, score in zip(self.raters, [4, 2, 5]):
+            self._rate(rater, self.doomed, score)
+
+    def _rate(self, rater, subject, score):
+        evaluation = Evaluation.objects.create(evaluator=rater, subject=subject, criterion=self.criterion, score=score)
+        EvaluationMeta.objects.create(evaluation=evaluation, status=EvaluationMeta.STATUS_ACTIVE)
+
+    def test_purge_removes_everything_and_refreshes_survivors_once(self):
+        subject_ids = [s.id for s in [*self.subjects, self.doomed]]
+        generations = subject_generations(subject_ids)
+        with mock.patch("evaluations.signals.apply_rater_weights", wraps=apply_rater_weights) as recompute:
+            out = StringIO()
+            with self.captureOnCommitCallbacks(execute=True):
+                call_command("purge_users", str(self.doomed.id), stdout=out)
+        recompute.assert_called_once()
+        self.assertIn("Purged 1 users and 5 evaluations; refreshed 3 raters and 2 pairs", out.getvalue())
+        self.assertFalse(get_user_model().objects.filter(pk=self.doomed.id).exists())
+        self.assertEqual(Evaluation.objects.count(), 6)
+        self.assertEqual(EvaluationMeta.objects.count(), 6)
+
+        for rater in self.raters:
+            scores = list(Evaluation.objects.filter(evaluator=rater).values_list("score", flat=True))
+            stats = RaterStats.objects.get(user=rater)
+            self.assertEqual(stats.ratings_count, len(scores))
+            self.assertAlmostEqual(stats.mean_score, mean(scores))
+            self.assertAlmostEqual(stats.std_score, pstdev(scores))
+        for subject in self.subjects:
+            scores = list(Evaluation.objects.filter(subject=subject).values_list("score", flat=True))
+            consensus = PairConsensus.objects.get(subject=subject, criterion=self.criterion)
+            self.assertEqual((consensus.score_count, consensus.score_sum), (len(scores), float(sum(scores))))
+        self.assertEqual(check_subject_summaries(), [])
+        after = subject_generations(subject_ids)
+        self.assertTrue(all(after[pk] != generations[pk] for pk in subject_ids))
+
+        weights = dict(Evaluation.objects.values_list("pk", "reliability_weight"))
+        recompute_rater_weights([rater.id for rater in self.raters])
+        self.assertEqual(dict(Evaluation.objects.values_list("pk", "reliability_weight")), weights)
+
+
+class SyntheticDataTests(APITestCase):
+    def _generate(self, prefix, seed=7):
+        call_command(
+            "generate_synthetic_data",
+            "--users=30",
+            "--evaluations=400",
+            "--degree=6",
+            "--questions=5",
+            "--answers-per-question=4",
+            f"--seed={seed}",
+            f"--prefix={prefix}",
+            "--batch-size=64",
+            stdout=StringIO(),
+        )
+        rows = Evaluation.objects.filter(evaluator__username__startswith=prefix).order_by("pk")
+        return [
+            (e[len(prefix) :], s[len(prefix) :], criterion, score)
+            for e, s, criterion, score in rows.values_list(
+                "evaluator__username", "subject__username", "criterion__name", "score"
+            )
+        ]
+
+    def test_generated_data_is_deterministic_and_consistent(self):
+        first = self._generate("a")
+        self.assertEqual(len(first), 400)
+        self.assertEqual(self._generate("b"), first)
+        self.assertNotEqual(self._generate("c", seed=8), first)
+
+        User = get_user_model()
+        self.assertEqual(User.objects.filter(userprofile_profile__isnull=False).count(), 90)
+        self.assertTrue(Friendship.objects.filter(is_confirmed=True).exists())
+        self.assertEqual(EvaluationMeta.objects.count(), Evaluation.objects.count())
+        # The drawn timestamps replace the insert-time auto_now_add stamps.
+        oldest = Evaluation.objects.order_by("created_at").values_list("created_at", flat=True).first()
+        self.assertLess(oldest, timezone.now() - timedelta(days=1))
+
+        for stats in RaterStats.objects.all():
+            scores = list(Evaluation.objects.filter(evaluator_id=stats.user_id).values_list("score", flat=True))
+            self.assertEqual(stats.ratings_count, len(scores))
+            self.assertAlmostEqual(stats.mean_score, mean(scores))
+            self.assertAlmostEqual(stats.std_score, pstdev(scores))
+            self.assertEqual(stats.outbound_count, len(scores))
+            active = stats.outbound_count >= min_outbound()
+            self.assertFalse(Evaluation.objects.filter(subject_id=stats.user_id).exclude(is_active=active).exists())
+        for consensus in PairConsensus.objects.all():
+            scores = list(
+                Evaluation.objects.filter(subject=consensus.subject, criterion=consensus.criterion).values_list(
+                    "score", flat=True
+                )
+            )
+            self.assertEqual((consensus.score_count, consensus.score_sum), (len(scores), float(sum(scores))))
+        self.assertEqual(check_subject_summaries(), [])
+        self.assertEqual(check_rater_deviations(), [])
+        self.assertFalse(Evaluation.objects.filter(reliability_weight__isnull=True).exists())
+
+    def test_rebuild_stays_under_the_sqlite_variable_limit(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("Lowers SQLite's bound-parameter limit.")
+        # More users than the limit allows in one IN-list, at a limit every chunked query fits under.
+        connection.ensure_connection()
+        previous = connection.connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 4000)
+        try:
+            report = generate(SyntheticConfig(users=2100, evaluations=300, degree=2, questions=0, seed=3))
+        finally:
+            connection.connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, previous)
+        self.assertEqual((report.users, report.evaluations), (2100, 300))
+        self.assertEqual(check_subject_summaries(), [])
+
+    def test_existing_prefix_is_rejected(self):
+        self._generate("a")
+        with self.assertRaises(CommandError):
+            self._generate("a")
+
+
+class BenchmarkTests(APITestCase):
+    def test_every_case_runs_and_reports_json(self):
+        results = run_benchmarks(sizes=[120], repeat=1)
+        self.assertEqual(set(results["results"]), set(BENCHMARKS))
+        for by_size in results["results"].values():
+            self.assertGreater(by_size["120"]["median"], 0)
+            self.assertGreaterEqual(by_size["120"]["queries"], 1)
+        self.assertEqual(json.loads(json.dumps(results)), results)
+
+    def test_compare_mode_flags_regressions_beyond_threshold(self):
+        baseline = {"results": {"a": {"100": {"median": 1.0}}, "b": {"100": {"median": 1.0}}}}
+        current = {
+            "results": {"a": {"100": {"median": 1.1}}, "b": {"100": {"median": 1.5}}, "c": {"100": {"median": 9}}}
+        }
+        self.assertEqual([(r.name, r.size) for r in compare_results(baseline, current, threshold=0.2)], [("b", "100")])
+        self.assertEqual(compare_results(baseline, current, threshold=0.6), [])
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths = {}
+            for name, data in (("baseline", baseline), ("current", current)):
+                paths[name] = os.path.join(directory, f"{name}.json")
+                with open(paths[name], "w") as handle:
+                    json.dump(data, handle)
+            with self.assertRaises(CommandError):
+                call_command(
+                    "benchmark_evaluations",
+                    f"--input={paths['current']}",
+                    f"--baseline={paths['baseline']}",
+                    stdout=StringIO(),
+                )
+            out = StringIO()
+            call_command(
+                "benchmark_evaluations",
+                f"--input={paths['current']}",
+                f"--baseline={paths['baseline']}",
+                "--threshold=0.6",
+                stdout=out,
+            )
+            self.assertIn("No regressions.", out.getvalue())
+
+
+class EvaluationWriteServiceTests(APITestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.rater = User.objects.create_user(username="writer", email="writer@example.com", password="pw")
+        self.subjects = [
+            User.objects.create_user(username=f"ws{i}", email=f"ws{i}@example.com", password="pw") for i in range(33)
+        ]
+        self.criterion = Criterion.objects.create(name="Focus")
+
+    def test_both_create_views_share_the_write_path(self):
+        self.client.force_authenticate(user=self.rater)
+        v2 = reverse("evaluations:evaluation-create-v2") + f"?subject_id={self.subjects[0].id}"
+        v1 = reverse("evaluation-create") + f"?subject_id={self.subjects[0].id}"
+
+        # Field names were resolved at app ready; requests do no model reflection.
+        with mock.patch("evaluations.writes._pick_fk_field", side_effect=AssertionError):
+            response = self.client.post(v2, {"criterion_id": self.criterion.id, "score": 4})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["status"], EvaluationMeta.STATUS_PENDING)
+        self.assertTrue(EvaluationMeta.objects.filter(evaluation_id=response.data["id"]).exists())
+
+        response = self.client.post(v1, {"criterion_id": self.criterion.id, "score": 2})
+        self.assertEqual((response.status_code, response.data["detail"]), (400, "Evaluation cooldown active."))
+        self.assertEqual(self.client.post(v1, {"criterion_id": 999999, "score": 2}).status_code, 404)
+        self.assertEqual(self.client.post(v2, {"criterion_id": "x", "score": 2}).status_code, 400)
+        v1_other = reverse("evaluation-create") + f"?subject_id={self.subjects[1].id}"
+        response = self.client.post(v1_other, {"criterion_id": self.criterion.id, "score": 11})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["detail"], "score must be an integer from 1 to 10.")
+
+    @override_settings(EVALUATIONS_WEIGHTS_SYNC=False)
+    def test_weights_are_refreshed_once_per_submission(self):
+        create_evaluation(self.rater, self.subjects[0].id, self.criterion.id, 3)
+        # One pass of each side effect; a second weight refresh (e.g. a receiver on evaluation_submitted)
+        # would queue the pair and the rater again.
+        with mock.patch("evaluations.signals._refresh_pair_raters", wraps=_refresh_pair_raters) as refresh:
+            with self.assertNumQueries(23):
+                create_evaluation(self.rater, self.subjects[1].id, self.criterion.id, 3)
+        refresh.assert_called_once()
+
+    @override_settings(EVALUATIONS_WEIGHTS_SYNC=False)
+    def test_query_count_does_not_depend_on_history_size(self):
+        create_evaluation(self.rater, self.subjects[0].id, self.criterion.id, 3)
+        with CaptureQueriesContext(connection) as ctx:
+            create_evaluation(self.rater, self.subjects[1].id, self.criterion.id, 3)
+        baseline = len(ctx.captured_queries)
+
+        for subject in self.subjects[2:32]:
+            Evaluation.objects.create(evaluator=self.rater, subject=subject, criterion=self.criterion, score=4)
+        with self.assertNumQueries(baseline):
+            create_evaluation(self.rater, self.subjects[32].id, self.criterion.id, 3)
+
 
 class EvaluationMetaGatingTests(APITestCase):
     def setUp(self):
@@ -264,7 +973,7 @@ class EvaluationMetaGatingTests(APITestCase):
         self.assertEqual(meta.status, EvaluationMeta.STATUS_PENDING)
 
         # Allow another evaluation past the cooldown window.
-        Evaluation.objects.filter(pk=evaluation.pk).update(created_at=timezone.now() - timedelta(days=REPEAT_DAYS + 1))
+        backdate_evaluations(Evaluation.objects.filter(pk=evaluation.pk))
 
         # Subject submits two outbound evaluations to satisfy the threshold.
         Evaluation.objects.create(
@@ -292,3 +1001,683 @@ class EvaluationMetaGatingTests(APITestCase):
         metas = EvaluationMeta.objects.filter(evaluation__subject=self.subject)
         self.assertTrue(metas.exists())
         self.assertTrue(all(m.status == EvaluationMeta.STATUS_ACTIVE for m in metas))
+
+    @override_settings(EVALUATIONS_MIN_OUTBOUND=5)
+    def test_gate_reads_rater_stats_and_activates_on_evaluation(self):
+        self._auth()
+        url = reverse("evaluation-create") + f"?subject_id={self.subject.id}"
+        self.client.post(url, {"criterion_id": self.criterion.id, "score": 3})
+        pending = Evaluation.objects.get(subject=self.subject)
+        self.assertFalse(pending.is_active)
+
+        # The gate is the subject's maintained outbound counter, not a COUNT over Evaluation.
+        RaterStats.objects.update_or_create(user=self.subject, defaults={"outbound_count": 5})
+        other = Criterion.objects.create(name="Patience")
+        self.client.post(url, {"criterion_id": other.id, "score": 4})
+
+        self.assertEqual(Evaluation.objects.filter(subject=self.subject, is_active=True).count(), 2)
+        self.assertFalse(EvaluationMeta.objects.exclude(status=EvaluationMeta.STATUS_ACTIVE).exists())
+
+        # Writes through the EvaluationMeta compatibility layer still reach Evaluation.is_active.
+        meta = pending.evaluationmeta
+        meta.status = EvaluationMeta.STATUS_PENDING
+        meta.save()
+        pending.refresh_from_db()
+        self.assertFalse(pending.is_active)
+
+
+class EvaluationBatchCreateTests(APITestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.rater = User.objects.create_user(username="rater", email="rater@example.com", password="pw")
+        self.subjects = [
+            User.objects.create_user(username=f"batch{i}", email=f"batch{i}@example.com", password="pw")
+            for i in range(6)
+        ]
+        self.criterion = Criterion.objects.create(name="Candor")
+        self.url = reverse("evaluations:evaluation-create-batch")
+        self.client.force_authenticate(user=self.rater)
+
+    def _items(self, subjects, score=3):
+        return [{"subject_id": s.id, "criterion_id": self.criterion.id, "score": score} for s in subjects]
+
+    def test_batch_reports_out_of_range_values_per_item(self):
+        items = self._items(self.subjects[:4])
+        items[0]["score"] = -1
+        items[1]["score"] = 11
+        items[2]["familiarity"] = -2
+        response = self.client.post(self.url, items, format="json")
+        self.assertEqual(response.status_code, 201)
+
+        self.assertEqual([c["index"] for c in response.data["created"]], [3])
+        self.assertEqual(
+            [(e["index"], e["detail"]) for e in response.data["errors"]],
+            [
+                (0, "score must be an integer from 1 to 10."),
+                (1, "score must be an integer from 1 to 10."),
+                (2, "familiarity must be a non-negative integer."),
+            ],
+        )
+
+    def test_batch_reports_item_errors_without_failing(self):
+        Evaluation.objects.create(evaluator=self.rater, subject=self.subjects[0], criterion=self.criterion, score=2)
+        items = [
+            {"subject_id": self.subjects[0].id, "criterion_id": self.criterion.id, "score": 4},  # cooldown
+            {"subject_id": self.subjects[1].id, "criterion_id": self.criterion.id, "score": 4},
+            {"subject_id": self.subjects[1].id, "criterion_id": self.criterion.id, "score": 5},  # duplicate
+            {"subject_id": self.subjects[2].id, "criterion_id": 999999, "score": 4},
+            {"subject_id": self.subjects[3].id, "score": 4},
+            {"subject_id": self.subjects[4].id, "criterion_id": self.criterion.id, "score": 2, "familiarity": 3},
+        ]
+        response = self.client.post(self.url, items, format="json")
+        self.assertEqual(response.status_code, 201)
+
+        self.assertEqual([c["index"] for c in response.data["created"]], [1, 5])
+        self.assertEqual([e["index"] for e in response.data["errors"]], [0, 2, 3, 4])
+        self.assertEqual(response.data["errors"][0]["detail"], "Evaluation cooldown active.")
+        self.assertEqual(Evaluation.objects.get(subject=self.subjects[4]).familiarity, 3)
+
+        # Side effects match the one-at-a-time path.
+        stats = RaterStats.objects.get(user=self.rater)
+        self.assertEqual(stats.ratings_count, 3)
+        self.assertAlmostEqual(stats.mean_score, mean([2, 4, 2]))
+        self.assertAlmostEqual(stats.std_score, pstdev([2, 4, 2]))
+        consensus = PairConsensus.objects.get(subject=self.subjects[1], criterion=self.criterion)
+        self.assertEqual((consensus.score_count, consensus.score_sum), (1, 4.0))
+        self.assertEqual(
+            EvaluationMeta.objects.filter(evaluation__evaluator=self.rater).count(),
+            2,
+        )
+        self.assertFalse(Evaluation.objects.filter(evaluator=self.rater, pending=True).exists())
+
+    def test_batch_rejected_when_nothing_is_created(self):
+        response = self.client.post(self.url, [{"subject_id": self.subjects[0].id}], format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["created"], [])
+
+        response = self.client.post(self.url, {"items": "nope"}, format="json")
+        self.assertEqual(response.status_code, 400)
+
+    @override_settings(EVALUATIONS_WEIGHTS_SYNC=False)
+    def test_batch_bumps_summary_generations_of_rated_subjects(self):
+        # With weights queued, no summary refresh runs inline to bump the generations as a side effect.
+        subject_ids = [s.id for s in self.subjects]
+        before = subject_generations(subject_ids)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.url, self._items(self.subjects[:2]), format="json")
+        self.assertEqual(response.status_code, 201)
+
+        after = subject_generations(subject_ids)
+        self.assertEqual([s for s in subject_ids if after[s] != before[s]], subject_ids[:2])
+
+    @override_settings(EVALUATIONS_MIN_OUTBOUND=1)
+    def test_batch_activates_subjects_past_the_outbound_gate(self):
+        Evaluation.objects.create(evaluator=self.subjects[0], subject=self.rater, criterion=self.criterion, score=3)
+        response = self.client.post(self.url, self._items(self.subjects[:2]), format="json")
+        self.assertEqual(response.status_code, 201)
+
+        statuses = dict(
+            EvaluationMeta.objects.filter(evaluation__evaluator=self.rater).values_list(
+                "evaluation__subject_id", "status"
+            )
+        )
+        self.assertEqual(statuses[self.subjects[0].id], EvaluationMeta.STATUS_ACTIVE)
+        self.assertEqual(statuses[self.subjects[1].id], EvaluationMeta.STATUS_PENDING)
+
+    def test_batch_query_count_does_not_grow_with_batch_size(self):
+        def queries_for(subjects, name):
+            criterion = Criterion.objects.create(name=name)
+            items = [{"subject_id": s.id, "criterion_id": criterion.id, "score": 3} for s in subjects]
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.post(self.url, items, format="json")
+            self.assertEqual(response.status_code, 201)
+            return len(ctx.captured_queries)
+
+        queries_for(self.subjects[:1], "Warmup")
+        self.assertEqual(queries_for(self.subjects, "Large"), queries_for(self.subjects[:2], "Small"))
+
+
+class SubjectCriterionSummaryTests(APITestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.raters = [
+            User.objects.create_user(username=f"sr{i}", email=f"sr{i}@example.com", password="pw") for i in range(3)
+        ]
+        self.subject = User.objects.create_user(username="summary", email="summary@example.com", password="pw")
+        self.criterion = Criterion.objects.create(name="Tact")
+        cache.clear()  # summary-v2 responses are page-cached
+
+    def _rate(self, rater, score, status=EvaluationMeta.STATUS_ACTIVE):
+        evaluation = Evaluation.objects.create(
+            evaluator=rater, subject=self.subject, criterion=self.criterion, score=score
+        )
+        EvaluationMeta.objects.create(evaluation=evaluation, status=status)
+        return evaluation
+
+    def test_rows_track_evaluations_meta_and_weights(self):
+        first = self._rate(self.raters[0], 5)
+        self._rate(self.raters[1], 2)
+        pending = self._rate(self.raters[2], 4, status=EvaluationMeta.STATUS_PENDING)
+        self.assertEqual(SubjectCriterionSummary.objects.get().raw_count, 2)
+        # Weights are written inline in sync mode, but the raters' summary fan-out waits for the worker.
+        self.assertEqual(sorted(DirtyRater.objects.values_list("rater_id", flat=True)), [r.id for r in self.raters])
+        drain_dirty_raters()
+        self.assertEqual(check_subject_summaries(), [])
+
+        pending.evaluationmeta.status = EvaluationMeta.STATUS_ACTIVE
+        pending.evaluationmeta.save()
+        self.assertEqual(SubjectCriterionSummary.objects.get().raw_count, 3)
+        drain_dirty_raters()
+        self.assertEqual(check_subject_summaries(), [])
+
+        first.delete()
+        self.assertEqual(SubjectCriterionSummary.objects.get().raw_count, 2)
+        drain_dirty_raters()
+        self.assertEqual(check_subject_summaries(), [])
+
+    @override_settings(EVALUATIONS_WEIGHTS_SYNC=False)
+    def test_drained_weights_refresh_summaries(self):
+        self._rate(self.raters[0], 5)
+        self._rate(self.raters[1], 1)
+        self.assertAlmostEqual(SubjectCriterionSummary.objects.get().weight_sum, 2.0)
+
+        call_command("process_dirty_raters", stdout=StringIO())
+        # Both raters sit 2 away from the consensus and only give extreme scores: (1/3 * 0.5) each.
+        self.assertAlmostEqual(SubjectCriterionSummary.objects.get().weight_sum, 1.0 / 3.0)
+        self.assertEqual(check_subject_summaries(), [])
+
+    @override_settings(EVALUATIONS_MIN_RATINGS=2)
+    def test_summary_v2_reads_gated_rows(self):
+        other = Criterion.objects.create(name="Grit")
+        self._rate(self.raters[0], 4)
+        self._rate(self.raters[1], 2)
+        Evaluation.objects.create(evaluator=self.raters[0], subject=self.subject, criterion=other, score=3)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("evaluations:evaluation-summary-v2"))
+        results = response.data["results"]
+        self.assertEqual([(r["criterion_id"], r["raw_count"]) for r in results], [(self.criterion.id, 2)])
+
+    @override_settings(EVALUATIONS_MIN_RATINGS=1)
+    def test_summary_v2_filters_and_keyset_pages(self):
+        criteria = [self.criterion, Criterion.objects.create(name="Grit")]
+        subjects = [self.subject, *self.raters[1:]]
+        for subject in subjects:
+            for criterion in criteria:
+                evaluation = Evaluation.objects.create(
+                    evaluator=self.raters[0], subject=subject, criterion=criterion, score=3
+                )
+                EvaluationMeta.objects.create(evaluation=evaluation, status=EvaluationMeta.STATUS_ACTIVE)
+        url = reverse("evaluations:evaluation-summary-v2")
+        everything = sorted((s.id, c.id) for s in subjects for c in criteria)
+
+        unpaged = self.client.get(url).data
+        self.assertNotIn("next_cursor", unpaged)
+        self.assertEqual(sorted((r["subject_id"], r["criterion_id"]) for r in unpaged["results"]), everything)
+
+        one = self.client.get(url, {"subject_id": self.subject.id}).data["results"]
+        self.assertEqual({r["subject_id"] for r in one}, {self.subject.id})
+        some = self.client.get(
+            url, {"subject_ids": f"{subjects[1].id},{subjects[2].id}", "criterion_id": criteria[1].id}
+        )
+        self.assertEqual(
+            sorted((r["subject_id"], r["criterion_id"]) for r in some.data["results"]),
+            [(subjects[1].id, criteria[1].id), (subjects[2].id, criteria[1].id)],
+        )
+
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 4, **({"cursor": cursor} if cursor else {})}
+            page = self.client.get(url, params).data
+            seen.extend((r["subject_id"], r["criterion_id"]) for r in page["results"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        self.assertEqual(seen, everything)
+
+        self.assertEqual(self.client.get(url, {"cursor": "not-a-cursor"}).status_code, 400)
+        self.assertEqual(self.client.get(url, {"subject_ids": "1,x"}).status_code, 400)
+        self.assertEqual(self.client.get(url, {"limit": 0}).status_code, 400)
+
+    @override_settings(EVALUATIONS_MIN_RATINGS=1)
+    def test_summary_v2_cache_follows_generations(self):
+        other_subject = self.raters[2]
+        self._rate(self.raters[0], 4)
+        url = reverse("evaluations:evaluation-summary-v2")
+
+        first = self.client.get(url).data
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url).data, first)
+        scoped = self.client.get(url, {"subject_id": self.subject.id}).data
+
+        with self.captureOnCommitCallbacks(execute=True):
+            evaluation = Evaluation.objects.create(
+                evaluator=self.raters[1], subject=other_subject, criterion=self.criterion, score=2
+            )
+            EvaluationMeta.objects.create(evaluation=evaluation, status=EvaluationMeta.STATUS_ACTIVE)
+
+        # Another subject's write leaves this subject's entry valid...
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url, {"subject_id": self.subject.id}).data, scoped)
+        # ...but invalidates the unfiltered summary.
+        self.assertEqual(len(self.client.get(url).data["results"]), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._rate(self.raters[1], 2)
+        self.assertEqual(self.client.get(url, {"subject_id": self.subject.id}).data["results"][0]["raw_count"], 2)
+
+    @override_settings(EVALUATIONS_MIN_RATINGS=2, EVALUATIONS_SUMMARY_BATCH_MAX_SUBJECTS=3)
+    def test_summary_batch_returns_every_subject_in_one_query(self):
+        viewer = self.raters[0]
+        other = self.raters[2]
+        self._rate(self.raters[0], 5)
+        self._rate(self.raters[1], 2)
+        Evaluation.objects.create(evaluator=self.raters[0], subject=other, criterion=self.criterion, score=4)
+        url = reverse("evaluations:evaluation-summary-batch")
+
+        self.assertEqual(self.client.get(url, {"subject_ids": self.subject.id}).status_code, 401)
+        self.client.force_authenticate(user=viewer)
+        with self.assertNumQueries(1):
+            response = self.client.get(url, {"subject_ids": f"{other.id},{self.subject.id}"})
+        self.assertEqual(response.status_code, 200)
+        results = response.data["results"]
+        self.assertEqual(results[str(other.id)], [])  # below the minimum-ratings gate
+        (row,) = results[str(self.subject.id)]
+        self.assertEqual((row["criterion_name"], row["raw_count"], row["active_average"]), ("Tact", 2, 3.5))
+        summary = SubjectCriterionSummary.objects.get(subject=self.subject)
+        self.assertEqual(row["weighted_average"], round(summary.weighted_sum / summary.weight_sum, 3))
+
+        self.assertEqual(self.client.get(url).status_code, 400)
+        self.assertEqual(self.client.get(url, {"subject_ids": "1,2,3,4"}).status_code, 400)
+
+    def test_check_and_rebuild_command(self):
+        self._rate(self.raters[0], 4)
+        self._rate(self.raters[1], 2)
+        SubjectCriterionSummary.objects.update(weighted_sum=0.0)
+
+        out = StringIO()
+        with self.assertRaises(CommandError):
+            call_command("rebuild_subject_summaries", "--check", stdout=out)
+        self.assertIn("drift: weighted_sum", out.getvalue())
+
+        out = StringIO()
+        call_command("rebuild_subject_summaries", stdout=out)
+        self.assertIn("Rebuilt 1 subject summaries.", out.getvalue())
+        call_command("rebuild_subject_summaries", "--check", stdout=StringIO())
+
+
+class SummaryCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.calls = 0
+
+    def _compute(self):
+        self.calls += 1
+        return {"value": self.calls}
+
+    def test_single_flight_hits_misses_and_serves_stale_while_locked(self):
+        key = summary_cache_key("test", {"subject_id": 1})
+        self.assertEqual(single_flight(key, "g1", self._compute), {"value": 1})
+        self.assertEqual(single_flight(key, "g1", self._compute), {"value": 1})
+
+        # Generation moved while another worker holds the refresh lock: serve the stale copy.
+        cache.add(f"{key}:lock", 1)
+        self.assertEqual(single_flight(key, "g2", self._compute), {"value": 1})
+        self.assertEqual(self.calls, 1)
+
+        cache.delete(f"{key}:lock")
+        self.assertEqual(single_flight(key, "g2", self._compute), {"value": 2})
+        self.assertFalse(cache.get(f"{key}:lock"))
+
+        # Past the soft TTL the entry is refreshed even though the generation is unchanged.
+        entry = cache.get(key)
+        cache.set(key, {**entry, "fresh_until": 0})
+        self.assertEqual(single_flight(key, "g2", self._compute), {"value": 3})
+        self.assertEqual(single_flight(key, "g2", self._compute), {"value": 3})
+
+        self.assertEqual(summary_cache_stats(), {"hit": 2, "miss": 3, "stale": 1})
+        out = StringIO()
+        call_command("summary_cache_stats", "--reset", stdout=out)
+        self.assertIn("summary_cache hit=2 miss=3 stale=1", out.getvalue())
+        self.assertEqual(summary_cache_stats(), {"hit": 0, "miss": 0, "stale": 0})
+
+    def test_subject_summary_view_is_cached_per_subject_generation(self):
+        User = get_user_model()
+        viewer = User.objects.create_user(username="viewer", email="viewer@example.com", password="pw")
+        subject = User.objects.create_user(username="viewed", email="viewed@example.com", password="pw")
+        criterion = Criterion.objects.create(name="Poise")
+        Evaluation.objects.create(evaluator=viewer, subject=subject, criterion=criterion, score=4)
+
+        def fetch():
+            request = APIRequestFactory().get("/evaluations/summary/", {"subject_id": subject.id})
+            force_authenticate(request, user=viewer)
+            return EvaluationSummaryView.as_view()(request).data
+
+        self.assertEqual(fetch()[0]["average_score"], 4.0)
+        with self.assertNumQueries(0):
+            self.assertEqual(fetch()[0]["average_score"], 4.0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Evaluation.objects.create(evaluator=subject, subject=subject, criterion=criterion, score=2)
+        self.assertEqual(fetch()[0]["average_score"], 3.0)
+
+    def test_generation_bump_waits_for_commit(self):
+        before = subject_generations([42])
+        with self.captureOnCommitCallbacks() as callbacks:
+            bump_generations([42])
+        # Until the transaction commits, readers keep the old generation (and the rows it matches).
+        self.assertEqual(subject_generations([42]), before)
+        self.assertEqual(len(callbacks), 1)
+        callbacks[0]()
+        self.assertNotEqual(subject_generations([42]), before)
+
+
+class PairConsensusTests(APITestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.rater = User.objects.create_user(username="rater", email="rater@example.com", password="pw")
+        self.peer = User.objects.create_user(username="peer", email="peer@example.com", password="pw")
+        self.subject = User.objects.create_user(username="subject", email="subject@example.com", password="pw")
+        self.criterion = Criterion.objects.create(name="Patience")
+        self.other_criterion = Criterion.objects.create(name="Focus")
+
+    def _consensus(self, criterion=None):
+        return PairConsensus.objects.get(subject=self.subject, criterion=criterion or self.criterion)
+
+    def test_aggregate_tracks_create_update_and_delete(self):
+        first = Evaluation.objects.create(evaluator=self.rater, subject=self.subject, criterion=self.criterion, score=4)
+        Evaluation.objects.create(evaluator=self.peer, subject=self.subject, criterion=self.criterion, score=2)
+
+        consensus = self._consensus()
+        self.assertEqual(consensus.score_count, 2)
+        self.assertAlmostEqual(consensus.score_sum, 6.0)
+        self.assertAlmostEqual(consensus.score_sq_sum, 20.0)
+        self.assertAlmostEqual(consensus.mean, 3.0)
+        self.assertAlmostEqual(consensus.variance, 1.0)
+
+        first.score = 5
+        first.save()
+        consensus = self._consensus()
+        self.assertEqual(consensus.score_count, 2)
+        self.assertAlmostEqual(consensus.score_sum, 7.0)
+        self.assertAlmostEqual(consensus.score_sq_sum, 29.0)
+
+        first.criterion = self.other_criterion
+        first.save()
+        self.assertEqual(self._consensus().score_count, 1)
+        self.assertAlmostEqual(self._consensus().score_sum, 2.0)
+        self.assertEqual(self._consensus(self.other_criterion).score_count, 1)
+        self.assertAlmostEqual(self._consensus(self.other_criterion).score_sum, 5.0)
+
+        first.delete()
+        self.assertEqual(self._consensus(self.other_criterion).score_count, 0)
+        self.assertEqual(
+            _build_consensus_map([(self.subject.id, self.criterion.id), (self.subject.id, self.other_criterion.id)]),
+            {(self.subject.id, self.criterion.id): 2.0},
+        )
+
+    def test_consensus_map_is_a_single_query(self):
+        Evaluation.objects.create(evaluator=self.rater, subject=self.subject, criterion=self.criterion, score=4)
+        Evaluation.objects.create(evaluator=self.rater, subject=self.peer, criterion=self.other_criterion, score=1)
+        pairs = [(self.subject.id, self.criterion.id), (self.peer.id, self.other_criterion.id)]
+
+        with self.assertNumQueries(1):
+            consensus = _build_consensus_map(pairs)
+
+        # (subject, other_criterion) is never rated and must not leak in from the IN-list superset.
+        self.assertEqual(consensus, {pairs[0]: 4.0, pairs[1]: 1.0})
+
+    def test_deleting_subject_cascades_cleanly(self):
+        Evaluation.objects.create(evaluator=self.rater, subject=self.subject, criterion=self.criterion, score=3)
+        self.subject.delete()
+        self.assertFalse(PairConsensus.objects.exists())
+
+
+@override_settings(EVALUATIONS_WEIGHTS_SYNC=False)
+class DirtyRaterQueueTests(APITestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.rater = User.objects.create_user(username="rater", email="rater@example.com", password="pw")
+        self.peer = User.objects.create_user(username="peer", email="peer@example.com", password="pw")
+        self.subject = User.objects.create_user(username="subject", email="subject@example.com", password="pw")
+        self.criterion = Criterion.objects.create(name="Candor")
+
+    def test_writes_only_mark_and_worker_drains_once_per_rater(self):
+        peer_eval = Evaluation.objects.create(
+            evaluator=self.peer, subject=self.subject, criterion=self.criterion, score=5
+        )
+        Evaluation.objects.create(evaluator=self.rater, subject=self.subject, criterion=self.criterion, score=3)
+        peer_eval.score = 4
+        peer_eval.save()
+
+        # Weights and deviations are untouched until the worker runs; repeat marks coalesce. The
+        # pair's raters are queued once the worker has applied its deviation deltas.
+        peer_eval.refresh_from_db()
+        self.assertIsNone(peer_eval.reliability_weight)
+        self.assertFalse(RaterDeviation.objects.exists())
+        self.assertEqual(
+            list(DirtyPair.objects.values_list("subject_id", "criterion_id")), [(self.subject.id, self.criterion.id)]
+        )
+        self.assertFalse(DirtyRater.objects.exists())
+        self.assertEqual(dirty_rater_backlog()["pending_pairs"], 1)
+
+        out = StringIO()
+        call_command("process_dirty_raters", batch_size=1, stdout=out)
+        self.assertIn("Recomputed weights for 2 raters.", out.getvalue())
+        self.assertFalse(DirtyPair.objects.exists())
+        self.assertFalse(DirtyRater.objects.exists())
+        self.assertEqual(check_rater_deviations(), [])
+        self.assertEqual(dirty_rater_backlog(), {"pending": 0, "pending_pairs": 0, "max_staleness_seconds": 0.0})
+
+        peer_eval.refresh_from_db()
+        self.assertAlmostEqual(peer_eval.reliability_weight, 1.0 / 1.5)
+        self.assertAlmostEqual(peer_eval.extreme_rate_weight, 1.0)
+
+    def test_backlog_reports_oldest_mark(self):
+        DirtyRater.objects.create(rater_id=self.rater.id, marked_at=timezone.now() - timedelta(minutes=5))
+        DirtyRater.objects.create(rater_id=self.peer.id)
+
+        backlog = dirty_rater_backlog()
+        self.assertEqual(backlog["pending"], 2)
+        self.assertGreaterEqual(backlog["max_staleness_seconds"], 300.0)
+
+        out = StringIO()
+        call_command("process_dirty_raters", stats=True, stdout=out)
+        self.assertIn("pending=2", out.getvalue())
+
+    def test_mark_arriving_mid_drain_stays_queued(self):
+        pair = (self.subject.id, self.criterion.id)
+        DirtyRater.objects.create(rater_id=self.rater.id)
+        DirtyPair.objects.create(subject_id=pair[0], criterion_id=pair[1])
+
+        # A rating lands while the worker holds the claimed rows.
+        def remark_rater(rater_ids):
+            mark_raters_dirty([self.rater.id])
+            return apply_rater_weights(rater_ids)
+
+        def remark_pair(pairs):
+            _refresh_pair_raters([pair])
+            return apply_pair_deviations(pairs)
+
+        with mock.patch("evaluations.signals.apply_rater_weights", side_effect=remark_rater):
+            self.assertEqual(drain_dirty_raters(), 1)
+        with mock.patch("evaluations.signals.apply_pair_deviations", side_effect=remark_pair):
+            self.assertEqual(drain_dirty_pairs(), 1)
+        self.assertEqual(list(DirtyRater.objects.values_list("rater_id", flat=True)), [self.rater.id])
+        self.assertEqual(list(DirtyPair.objects.values_list("subject_id", "criterion_id")), [pair])
+
+        self.assertEqual(drain_dirty_pairs(), 1)
+        self.assertEqual(drain_dirty_raters(), 1)
+        self.assertFalse(DirtyPair.objects.exists())
+        self.assertFalse(DirtyRater.objects.exists())
+
+    def test_deleting_a_rater_leaves_a_harmless_mark(self):
+        Evaluation.objects.create(evaluator=self.rater, subject=self.subject, criterion=self.criterion, score=2)
+        DirtyRater.objects.all().delete()
+
+        rater_id = self.rater.id
+        self.rater.delete()
+        self.assertTrue(DirtyRater.objects.filter(rater_id=rater_id).exists())
+
+        call_command("process_dirty_raters", stdout=StringIO())
+        self.assertFalse(DirtyRater.objects.exists())
+
+
+class RecomputeRaterStatsCommandTests(APITestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.users = [
+            User.objects.create_user(username=f"user{i}", email=f"user{i}@example.com", password="pw") for i in range(4)
+        ]
+        self.criteria = [Criterion.objects.create(name=name) for name in ("Wit", "Grit")]
+        scores = iter([1, 7, 10, 4, 6, 2, 9, 3, 5, 8, 10, 1])
+        for rater in self.users:
+            for subject in self.users:
+                if subject == rater:
+                    continue
+                criterion = self.criteria[(rater.id + subject.id) % 2]
+                ev = Evaluation.objects.create(
+                    evaluator=rater, subject=subject, criterion=criterion, score=next(scores)
+                )
+                EvaluationMeta.objects.create(evaluation=ev, status=EvaluationMeta.STATUS_ACTIVE)
+        # Pending evaluations count too, as they do in the live moments.
+        pending = Evaluation.objects.create(
+            evaluator=self.users[0], subject=self.users[1], criterion=self.criteria[0], score=10
+        )
+        EvaluationMeta.objects.create(evaluation=pending)
+
+    def _snapshot(self):
+        return {
+            row["user_id"]: row
+            for row in RaterStats.objects.values(
+                "user_id", "ratings_count", "mean_score", "std_score", "extreme_rate", "reliability"
+            )
+        }
+
+    def _run(self, **options):
+        out = StringIO()
+        call_command("recompute_rater_stats", stdout=out, **options)
+        return out.getvalue()
+
+    def test_numpy_engine_matches_python_engine(self):
+        self.assertIn("Updated RaterStats for 4 users.", self._run())
+        expected = self._snapshot()
+        self.assertEqual(expected[self.users[0].id]["ratings_count"], 4)
+
+        RaterStats.objects.update(ratings_count=0, mean_score=0.0, std_score=0.0, extreme_rate=0.0, reliability=0.0)
+        self.assertIn("Updated RaterStats for 4 users.", self._run(engine="numpy"))
+        actual = self._snapshot()
+
+        self.assertEqual(actual.keys(), expected.keys())
+        for user_id, row in expected.items():
+            self.assertEqual(actual[user_id]["ratings_count"], row["ratings_count"])
+            for field in ("mean_score", "std_score", "extreme_rate", "reliability"):
+                self.assertAlmostEqual(actual[user_id][field], row[field], places=9)
+
+    def test_single_worker_shard_matches_python_engine(self):
+        self._run()
+        expected = self._snapshot()
+        RaterStats.objects.all().delete()
+
+        output = self._run(workers=1)
+        self.assertIn("shard 0: 13 rows, 4 raters", output)
+        self.assertIn("Updated RaterStats for 4 users from 13 rows across 1 shards", output)
+        actual = self._snapshot()
+        for user_id, row in expected.items():
+            self.assertEqual(actual[user_id]["ratings_count"], row["ratings_count"])
+            self.assertAlmostEqual(actual[user_id]["reliability"], row["reliability"], places=9)
+
+    def test_shards_partition_raters_and_share_one_consensus(self):
+        self._run()
+        expected = self._snapshot()
+        RaterStats.objects.all().delete()
+
+        qs = Evaluation.objects.all()
+        fields = EvaluationFields(rater="evaluator", subject="subject", criterion="criterion", score="score")
+        reports = compute_sharded(qs, fields, workers=3, processes=False)
+
+        self.assertEqual([r.shard for r in reports], [0, 1, 2])
+        self.assertEqual(sum(r.rows for r in reports), 13)
+        self.assertEqual(sum(r.raters for r in reports), 4)
+        actual = self._snapshot()
+        self.assertEqual(actual.keys(), expected.keys())
+        for user_id, row in expected.items():
+            for field in ("mean_score", "std_score", "extreme_rate", "reliability"):
+                self.assertAlmostEqual(actual[user_id][field], row[field], places=9)
+
+    def test_since_only_recomputes_raters_of_touched_pairs(self):
+        self._run()
+        watermark = RaterStatsWatermark.objects.get(name="default")
+        self.assertEqual(watermark.last_evaluation_id, Evaluation.objects.order_by("-pk").first().pk)
+
+        # Mark every row stale so we can see which raters the incremental run rewrites.
+        RaterStats.objects.update(reliability=0.0)
+        u0, u1, u2, u3 = self.users
+        ev = Evaluation.objects.create(evaluator=u3, subject=u1, criterion=self.criteria[0], score=2)
+        EvaluationMeta.objects.create(evaluation=ev, status=EvaluationMeta.STATUS_ACTIVE)
+
+        touched = set(
+            Evaluation.objects.filter(subject=u1, criterion=self.criteria[0]).values_list("evaluator_id", flat=True)
+        )
+        output = self._run(since=True)
+        self.assertIn(f"Updated RaterStats for {len(touched)} users", output)
+
+        refreshed = set(RaterStats.objects.exclude(reliability=0.0).values_list("user_id", flat=True))
+        self.assertEqual(refreshed, touched)
+        self.assertEqual(RaterStats.objects.get(user=u3).ratings_count, 4)
+
+        # A later incremental run with nothing new touches nobody; --full recomputes everyone.
+        self.assertIn("Updated RaterStats for 0 users", self._run(since=True))
+        self.assertIn("Updated RaterStats for 4 users.", self._run(since=True, full=True))
+        self.assertFalse(RaterStats.objects.filter(reliability=0.0).exists())
+        self.assertIn("Verified 4 sampled raters", self._run(since=True, verify=4))
+
+    def test_recompute_matches_live_moments(self):
+        # The signal handlers and the recompute engines write the same columns: same rows, same extreme bound.
+        live = self._snapshot()
+        self._run()
+        recomputed = self._snapshot()
+        self.assertEqual(recomputed.keys(), live.keys())
+        for user_id, row in live.items():
+            self.assertEqual(recomputed[user_id]["ratings_count"], row["ratings_count"])
+            for field in ("mean_score", "std_score", "extreme_rate"):
+                self.assertAlmostEqual(recomputed[user_id][field], row[field], places=9)
+
+        pending = Evaluation.objects.create(
+            evaluator=self.users[2], subject=self.users[3], criterion=self.criteria[1], score=5
+        )
+        EvaluationMeta.objects.create(evaluation=pending)
+        self.assertIn("Verified 4 sampled raters", self._run(since=True, verify=4))
+
+    def test_recompute_leaves_the_outbound_counter_alone(self):
+        for user in self.users:
+            self.assertEqual(
+                RaterStats.objects.get(user=user).outbound_count, Evaluation.objects.filter(evaluator=user).count()
+            )
+        RaterStats.objects.update(outbound_count=99)
+        self._run()
+        self._run(engine="stream")
+        self.assertEqual(set(RaterStats.objects.values_list("outbound_count", flat=True)), {99})
+
+    def test_verify_fails_on_drifted_stats(self):
+        self._run()
+        RaterStats.objects.update(mean_score=99.0)
+        with self.assertRaises(CommandError):
+            self._run(since=True, verify=4)
+
+    def test_stream_engine_matches_python_engine_across_batches(self):
+        self._run()
+        expected = self._snapshot()
+        RaterStats.objects.all().delete()
+
+        output = self._run(engine="stream", chunk_size=2, batch_size=3)
+        self.assertIn("Updated RaterStats for 4 users from 13 rows", output)
+        # One progress line per committed batch of three raters, plus the final partial batch.
+        self.assertEqual(output.count("rows/s"), 2)
+
+        actual = self._snapshot()
+        self.assertEqual(actual.keys(), expected.keys())
+        for user_id, row in expected.items():
+            self.assertEqual(actual[user_id]["ratings_count"], row["ratings_count"])
+            for field in ("mean_score", "std_score", "extreme_rate", "reliability"):
+                self.assertAlmostEqual(actual[user_id][field], row[field], places=9)
@@ -5,15 +5,20 @@ from .views import EvaluationCreateView, EvaluationTasksView
 
 # Optional v2 endpoints (import if present)
 try:
-    from .summary_views import EvaluationSummaryV2View  # type: ignore
+    from .summary_views import EvaluationSummaryBatchView, EvaluationSummaryV2View  # type: ignore
 except Exception:  # pragma: no cover
-    EvaluationSummaryV2View = None  # type: ignore
+    EvaluationSummaryV2View = EvaluationSummaryBatchView = None  # type: ignore
 
 try:
     from .create_views import EvaluationCreateV2View  # type: ignore
 except Exception:  # pragma: no cover
     EvaluationCreateV2View = None  # type: ignore
 
+try:
+    from .batch_views import EvaluationBatchCreateView  # type: ignore
+except Exception:  # pragma: no cover
+    EvaluationBatchCreateView = None  # type: ignore
+
 # Namespace (so reverse('evaluations:evaluation-tasks') would also work if namespaced)
 app_name = "evaluations"
 
@@ -31,5 +36,9 @@ if EvaluationSummaryV2View is not None:
             name="evaluation-summary-v2",
         )
     )
+if EvaluationSummaryBatchView is not None:
+    urlpatterns.append(path("summary-batch/", EvaluationSummaryBatchView.as_view(), name="evaluation-summary-batch"))
 if EvaluationCreateV2View is not None:
     urlpatterns.append(path("create-v2/", EvaluationCreateV2View.as_view(), name="evaluation-create-v2"))
+if EvaluationBatchCreateView is not None:
+    urlpatterns.append(path("create-batch/", EvaluationBatchCreateView.as_view(), name="evaluation-create-batch"))
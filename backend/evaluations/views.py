@@ -1,13 +1,8 @@
 from __future__ import annotations
 
-import math
-import os as _os
 import random
-from datetime import timedelta
 
-from django.conf import settings
-from django.contrib.auth import get_user_model
-from django.db.models import Avg, Max
+from django.db.models import Avg
 from django.utils import timezone
 
 from rest_framework import generics, permissions, status
@@ -15,19 +10,11 @@ from rest_framework.authentication import TokenAuthentication
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from userprofiles.models import Friendship
-
-from .meta_models import EvaluationMeta
 from .models import Criterion, Evaluation
-from .rater_models import RaterStats
 from .serializers import CriterionSerializer, EvaluationSerializer
-from .signals import evaluation_submitted
-
-# Backwards-compat constant for tests
-try:  # noqa: SIM105
-    REPEAT_DAYS  # type: ignore[name-defined]
-except NameError:
-    REPEAT_DAYS = int(_os.getenv("EVALUATIONS_REPEAT_DAYS", "7"))
+from .summary_cache import single_flight, summary_cache_key, summary_generation
+from .task_models import PendingTask
+from .writes import EvaluationWriteError, create_evaluation
 
 
 class CriterionListCreateView(generics.ListCreateAPIView):
@@ -43,7 +30,7 @@ class EvaluationListCreateView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        queryset = Evaluation.objects.all()
+        queryset = Evaluation.objects.with_normalization()
         subject_id = self.request.query_params.get("subject_id")
         if subject_id:
             queryset = queryset.filter(subject__id=subject_id)
@@ -51,7 +38,9 @@ class EvaluationListCreateView(generics.ListCreateAPIView):
 
     def perform_create(self, serializer):
         subject_id = self.request.query_params.get("subject_id")
-        serializer.save(evaluator=self.request.user, subject_id=subject_id)
+        instance = serializer.save(evaluator=self.request.user, subject_id=subject_id)
+        # Re-read with the RaterStats join so the response carries the derived normalization.
+        serializer.instance = Evaluation.objects.with_normalization().get(pk=instance.pk)
 
 
 class EvaluationTasksView(APIView):
@@ -59,61 +48,84 @@ class EvaluationTasksView(APIView):
     Return a shuffled list of evaluation tasks for the current user.
     Only confirmed friends are considered.
     A task is included if the last evaluation on (subject, criterion)
-    is older than REPEAT_DAYS (or never rated).
+    is older than settings.EVALUATIONS_REPEAT_DAYS (or never rated).
+
+    Tasks come from the materialized PendingTask queue (maintained by evaluations.signals),
+    so a request is a single indexed range scan on (evaluator, next_due_at).
+
+    Optional paging: ?limit=<n>&offset=<k>&seed=<int>. Tasks are shuffled with a
+    seeded RNG over a stable base order, so the same seed pages through the same
+    sequence. Without a seed one is generated and returned for follow-up pages.
     """
 
     authentication_classes = [TokenAuthentication]
     permission_classes = [permissions.IsAuthenticated]
 
-    def _confirmed_friend_ids(self, user_id: int) -> set[int]:
-        sent = Friendship.objects.filter(from_user_id=user_id, is_confirmed=True).values_list("to_user_id", flat=True)
-        received = Friendship.objects.filter(to_user_id=user_id, is_confirmed=True).values_list(
-            "from_user_id", flat=True
-        )
-        return set(sent).union(set(received))
+    def _paging_params(self, request):
+        params = {}
+        for name in ("limit", "offset", "seed"):
+            raw = request.query_params.get(name)
+            if raw in (None, ""):
+                params[name] = None
+                continue
+            try:
+                params[name] = int(raw)
+            except ValueError:
+                raise ValueError(f"{name} must be an integer.") from None
+        if params["limit"] is not None and params["limit"] < 1:
+            raise ValueError("limit must be positive.")
+        if params["offset"] is not None and params["offset"] < 0:
+            raise ValueError("offset must not be negative.")
+        return params
 
     def get(self, request):
         user = request.user
-        User = get_user_model()
-
-        # Only confirmed friends
-        friend_ids = self._confirmed_friend_ids(user.id)
-        subjects = User.objects.filter(id__in=friend_ids)
-
-        criteria = list(Criterion.objects.all())
-        if not criteria or not subjects.exists():
-            return Response({"tasks": []})
-
-        # Cooldown cutoff
-        cutoff = timezone.now() - timedelta(days=REPEAT_DAYS)
-
-        # For each (subject, criterion), include if last eval is <= cutoff or never rated
-        tasks = []
-        for subject in subjects:
-            for criterion in criteria:
-                qs = Evaluation.objects.filter(evaluator=user, subject=subject, criterion=criterion)
-                last_ts = qs.aggregate(last=Max("created_at"))["last"]
-                include = last_ts is None or last_ts <= cutoff
-                if include:
-                    first_time = not qs.exists()
-                    tasks.append(
-                        {
-                            "subjectId": subject.id,
-                            "subjectName": getattr(subject, "username", str(subject)),
-                            "criterionId": criterion.id,
-                            "criterionName": criterion.name,
-                            "firstTime": first_time,
-                        }
-                    )
-
-        random.shuffle(tasks)
-        return Response({"tasks": tasks})
+
+        try:
+            paging = self._paging_params(request)
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Due tasks for confirmed friends: one range scan on (evaluator, active, next_due_at)
+        due = (
+            PendingTask.objects.filter(evaluator=user, active=True, next_due_at__lte=timezone.now())
+            .select_related("subject", "criterion")
+            .order_by()
+        )
+        tasks = [
+            {
+                "subjectId": task.subject_id,
+                "subjectName": getattr(task.subject, "username", str(task.subject)),
+                "criterionId": task.criterion_id,
+                "criterionName": task.criterion.name,
+                "firstTime": task.last_rated_at is None,
+            }
+            for task in sorted(due, key=lambda task: (task.subject_id, task.criterion_id))
+        ]
+
+        if paging["limit"] is None and paging["seed"] is None:
+            random.shuffle(tasks)
+            return Response({"tasks": tasks})
+
+        seed = paging["seed"] if paging["seed"] is not None else random.randrange(2**31)
+        random.Random(seed).shuffle(tasks)
+        offset = paging["offset"] or 0
+        end = len(tasks) if paging["limit"] is None else offset + paging["limit"]
+        return Response(
+            {
+                "tasks": tasks[offset:end],
+                "seed": seed,
+                "total": len(tasks),
+                "nextOffset": end if end < len(tasks) else None,
+            }
+        )
 
 
 class EvaluationCreateView(APIView):
     """
     Create an evaluation for the current user, enforcing a cooldown
-    of REPEAT_DAYS for the same (subject, criterion) pair.
+    of settings.EVALUATIONS_REPEAT_DAYS for the same (subject, criterion) pair.
+    The write itself is evaluations.writes.create_evaluation (shared with create-v2).
     """
 
     authentication_classes = [TokenAuthentication]
@@ -134,102 +146,10 @@ class EvaluationCreateView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Enforce cooldown
-        cutoff = timezone.now() - timedelta(days=REPEAT_DAYS)
-        exists_recent = Evaluation.objects.filter(
-            evaluator=user,
-            subject_id=subject_id,
-            criterion_id=criterion_id,
-            created_at__gte=cutoff,
-        ).exists()
-        if exists_recent:
-            return Response(
-                {"detail": "Evaluation cooldown active."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        create_kwargs = {
-            "evaluator": user,
-            "subject_id": subject_id,
-            "criterion_id": criterion_id,
-            "score": score,
-        }
-        if familiarity is not None:
-            create_kwargs["familiarity"] = familiarity
-
-        evaluation = Evaluation.objects.create(**create_kwargs)
-
-        # Notify downstream listeners so reliability/objectivity are recalculated.
-        evaluation_submitted.send(sender=Evaluation, evaluation=evaluation)
-
-        # Recompute normalization statistics for this evaluator.
-        rater_evaluations = list(Evaluation.objects.filter(evaluator=user))
-        scores = [float(ev.score) for ev in rater_evaluations]
-        count = len(scores)
-
-        if count:
-            mean_score = sum(scores) / count
-            if count > 1:
-                variance = sum((s - mean_score) ** 2 for s in scores) / count
-                std_score = math.sqrt(variance)
-            else:
-                std_score = 0.0
-        else:  # pragma: no cover - defensive guard
-            mean_score = 0.0
-            std_score = 0.0
-
-        normalized_denominator = std_score if std_score > 0 else None
-        for ev in rater_evaluations:
-            ev.rater_mean = mean_score
-            ev.rater_stddev = std_score
-            if normalized_denominator:
-                ev.normalized_score = (float(ev.score) - mean_score) / normalized_denominator
-            else:
-                ev.normalized_score = 0.0
-
-        if rater_evaluations:
-            Evaluation.objects.bulk_update(
-                rater_evaluations,
-                ["rater_mean", "rater_stddev", "normalized_score"],
-            )
-
-        # Persist/update rater statistics.
-        if rater_evaluations:
-            stats, _ = RaterStats.objects.get_or_create(user=user)
-            extreme_count = sum(1 for s in scores if s <= 1.0 or s >= 5.0)
-            stats.ratings_count = count
-            stats.mean_score = mean_score
-            stats.std_score = std_score
-            stats.extreme_rate = (extreme_count / count) if count else 0.0
-
-            reliability_agg = (
-                Evaluation.objects.filter(evaluator=user)
-                .exclude(reliability_weight__isnull=True)
-                .aggregate(avg_rel=Avg("reliability_weight"))
-            )
-            avg_rel = reliability_agg.get("avg_rel")
-            if avg_rel is not None:
-                stats.reliability = float(avg_rel)
-            stats.save()
-
-        # Evaluate outbound gating for the subject being rated.
-        min_outbound = int(getattr(settings, "EVALUATIONS_MIN_OUTBOUND", 10))
-        outbound_count = Evaluation.objects.filter(evaluator_id=subject_id).count()
-        status_value = EvaluationMeta.STATUS_ACTIVE if outbound_count >= min_outbound else EvaluationMeta.STATUS_PENDING
-
-        meta, created = EvaluationMeta.objects.get_or_create(
-            evaluation=evaluation,
-            defaults={"status": status_value},
-        )
-        if not created and meta.status != status_value:
-            meta.status = status_value
-            meta.save(update_fields=["status"])
-
-        if status_value == EvaluationMeta.STATUS_ACTIVE:
-            EvaluationMeta.objects.filter(
-                evaluation__subject_id=subject_id,
-                status=EvaluationMeta.STATUS_PENDING,
-            ).update(status=EvaluationMeta.STATUS_ACTIVE)
+        try:
+            evaluation, _ = create_evaluation(user, subject_id, criterion_id, score, familiarity)
+        except EvaluationWriteError as exc:
+            return Response({"detail": exc.detail}, status=exc.status_code)
 
         return Response({"id": evaluation.id}, status=status.HTTP_201_CREATED)
 
@@ -240,6 +160,8 @@ class EvaluationSummaryView(APIView):
 
     Expects: ?subject_id=<int>
     Response: list of {criterion_id, criterion_name, average_score}
+
+    Cached with single_flight() under the subject's summary generation.
     """
 
     authentication_classes = [TokenAuthentication]
@@ -253,9 +175,25 @@ class EvaluationSummaryView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        try:
+            subject_id = int(subject_id)
+        except ValueError:
+            return Response(
+                {"detail": "subject_id must be an integer"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        results = single_flight(
+            summary_cache_key("summary", {"subject_id": subject_id}),
+            summary_generation([subject_id]),
+            lambda: self._build_results(subject_id),
+        )
+        return Response(results)
+
+    def _build_results(self, subject_id: int) -> list:
         evaluations = Evaluation.objects.filter(subject_id=subject_id)
         if not evaluations.exists():
-            return Response([])
+            return []
 
         summary = (
             evaluations.values("criterion__id", "criterion__name")
@@ -263,7 +201,7 @@ class EvaluationSummaryView(APIView):
             .order_by("criterion__name")
         )
 
-        results = [
+        return [
             {
                 "criterion_id": row["criterion__id"],
                 "criterion_name": row["criterion__name"],
@@ -271,4 +209,3 @@ class EvaluationSummaryView(APIView):
             }
             for row in summary
         ]
-        return Response(results)
@@ -0,0 +1,192 @@
+"""
+The evaluation write path shared by EvaluationCreateView and EvaluationCreateV2View.
+
+Evaluation field names are resolved once, when the app is ready (EvaluationsConfig.ready calls
+resolve_write_fields), instead of by reflection on every request. create_evaluation() runs the
+cooldown check, the insert and every side effect (reliability mirror, outbound gating, meta
+mirror, activation) in one transaction with a fixed number of queries, whatever the size of the
+rater's history.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple, Optional
+
+from django.db import transaction
+from django.db.models import F, Subquery
+from django.db.models.functions import Coalesce
+
+from .activation import activate_subjects, active_subjects, create_meta_mirrors
+from .models import Criterion, Evaluation
+from .pending_tasks import cooldown_active
+from .rater_models import RaterStats
+from .signals import evaluation_submitted
+
+NUMERIC_TYPES = {
+    "IntegerField",
+    "SmallIntegerField",
+    "PositiveIntegerField",
+    "PositiveSmallIntegerField",
+    "BigIntegerField",
+    "FloatField",
+    "DecimalField",
+}
+
+
+def _pick_fk_field(model, preferred_names):
+    relations = [
+        f
+        for f in model._meta.get_fields()
+        if getattr(f, "is_relation", False) and not getattr(f, "many_to_many", False)
+    ]
+    # Exact name match first, then partial match
+    for f in relations:
+        if f.name in preferred_names:
+            return f.name
+    for f in relations:
+        if any(p in f.name for p in preferred_names):
+            return f.name
+    return None
+
+
+def _pick_numeric_field(model, preferred_names):
+    numeric = [
+        f
+        for f in model._meta.get_fields()
+        if hasattr(f, "get_internal_type") and f.get_internal_type() in NUMERIC_TYPES
+    ]
+    for f in numeric:
+        if f.name in preferred_names:
+            return f.name
+    for f in numeric:
+        if any(p in f.name for p in preferred_names):
+            return f.name
+    return None
+
+
+class WriteFields(NamedTuple):
+    subject: str
+    rater: str
+    criterion: str
+    score: str
+    familiarity: Optional[str]
+
+
+class EvaluationWriteError(Exception):
+    """A rejected write; ``detail`` and ``status_code`` are returned to the client as-is."""
+
+    def __init__(self, detail: str, status_code: int = 400):
+        super().__init__(detail)
+        self.detail = detail
+        self.status_code = status_code
+
+
+# Scores accepted by every write path: the 1-10 scale the clients offer.
+SCORE_MIN = 1
+SCORE_MAX = 10
+
+
+def check_score(score) -> int:
+    """Return ``score`` as an integer on the SCORE_MIN..SCORE_MAX scale, or raise EvaluationWriteError."""
+
+    try:
+        value = int(score)
+    except (TypeError, ValueError):
+        value = None
+    if value is None or not SCORE_MIN <= value <= SCORE_MAX:
+        raise EvaluationWriteError(f"score must be an integer from {SCORE_MIN} to {SCORE_MAX}.")
+    return value
+
+
+def check_familiarity(familiarity) -> Optional[int]:
+    """Return ``familiarity`` as a non-negative integer (or None), or raise EvaluationWriteError."""
+
+    if familiarity is None:
+        return None
+    try:
+        value = int(familiarity)
+    except (TypeError, ValueError):
+        value = None
+    if value is None or value < 0:
+        raise EvaluationWriteError("familiarity must be a non-negative integer.")
+    return value
+
+
+class WriteResult(NamedTuple):
+    evaluation: Evaluation
+    active: bool
+
+
+_fields: Optional[WriteFields] = None
+
+
+def resolve_write_fields(model=Evaluation) -> WriteFields:
+    """Resolve (and remember) the Evaluation field names used by create_evaluation()."""
+
+    global _fields
+    fields = WriteFields(
+        subject=_pick_fk_field(model, ["subject", "target", "rated_user", "profile", "user"]),
+        rater=_pick_fk_field(model, ["rater", "evaluator", "author", "user"]),
+        criterion=_pick_fk_field(model, ["criterion", "criteria"]),
+        score=_pick_numeric_field(model, ["score", "rating", "value", "val", "points"]),
+        familiarity=_pick_numeric_field(model, ["familiarity", "weight", "confidence"]),
+    )
+    if not (fields.subject and fields.rater and fields.criterion and fields.score):
+        raise LookupError("Evaluation model fields could not be inferred.")
+    _fields = fields
+    return fields
+
+
+def write_fields() -> WriteFields:
+    return _fields or resolve_write_fields()
+
+
+@transaction.atomic
+def create_evaluation(evaluator, subject_id, criterion_id, score, familiarity=None) -> WriteResult:
+    """
+    Create one evaluation by ``evaluator`` and apply its side effects.
+    Raises EvaluationWriteError for malformed ids, an out-of-range score or familiarity, an unknown
+    criterion or an active cooldown.
+    """
+
+    fields = write_fields()
+    try:
+        subject_id, criterion_id = int(subject_id), int(criterion_id)
+    except (TypeError, ValueError):
+        raise EvaluationWriteError("subject_id and criterion_id must be integers.") from None
+    score, familiarity = check_score(score), check_familiarity(familiarity)
+    if not Criterion.objects.filter(pk=criterion_id).exists():
+        raise EvaluationWriteError("criterion_id not found", status_code=404)
+    # Enforce cooldown (unique-key lookup on the PendingTask queue)
+    if cooldown_active(evaluator.id, subject_id, criterion_id):
+        raise EvaluationWriteError("Evaluation cooldown active.")
+
+    payload = {
+        f"{fields.subject}_id": subject_id,
+        f"{fields.rater}_id": evaluator.id,
+        f"{fields.criterion}_id": criterion_id,
+        fields.score: score,
+    }
+    if fields.familiarity and familiarity is not None:
+        payload[fields.familiarity] = familiarity
+    evaluation = Evaluation.objects.create(**payload)
+
+    # Notify downstream listeners; the post_save receivers have already refreshed consensus and weights.
+    evaluation_submitted.send(sender=Evaluation, evaluation=evaluation)
+
+    # normalized_score is derived at read time from RaterStats (see Evaluation.objects.with_normalization),
+    # so a submission does not rewrite the rater's history. Every evaluation by a rater carries the
+    # same reliability_weight; mirror the fresh one.
+    RaterStats.objects.filter(user_id=evaluator.id).update(
+        reliability=Coalesce(
+            Subquery(Evaluation.objects.filter(pk=evaluation.pk).values("reliability_weight")[:1]),
+            F("reliability"),
+        )
+    )
+
+    # Outbound gating for the subject being rated, from their RaterStats.outbound_count.
+    active = active_subjects([subject_id])
+    create_meta_mirrors([evaluation], active)
+    if active:
+        activate_subjects(active)
+    return WriteResult(evaluation, bool(active))
@@ -0,0 +1,26 @@
+# Generated by Django 5.1.2 on 2026-10-18 04:01
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("userprofiles", "0007_friendship_is_confirmed"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="friendship",
+            index=models.Index(
+                fields=["from_user", "is_confirmed"],
+                name="friendship_from_confirmed_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="friendship",
+            index=models.Index(fields=["to_user", "is_confirmed"], name="friendship_to_confirmed_idx"),
+        ),
+    ]
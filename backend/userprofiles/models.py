@@ -111,6 +111,11 @@ class Friendship(models.Model):
         unique_together = ("from_user", "to_user")
         verbose_name = "Friendship"
         verbose_name_plural = "Friendships"
+        indexes = [
+            # Confirmed-friend lookups in either direction (pending tasks, privacy checks).
+            models.Index(fields=["from_user", "is_confirmed"], name="friendship_from_confirmed_idx"),
+            models.Index(fields=["to_user", "is_confirmed"], name="friendship_to_confirmed_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.from_user_id} -> {self.to_user_id}"